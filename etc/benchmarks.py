@@ -0,0 +1,565 @@
+"""
+Benchmarks for zipline's simulation, pipeline and data-reader hot paths.
+
+Every benchmark runs against a fixed-size, deterministic scenario built from
+the synthetic data helpers in ``zipline.testing`` so that timings are
+comparable between machines and between revisions. Results are written as
+JSON so they can be stored and compared against a baseline, for example::
+
+    $ python etc/benchmarks.py -f daily -n 100 -o baseline.json
+    $ git checkout my-branch
+    $ python etc/benchmarks.py -f daily -n 100 --compare baseline.json
+
+When ``--compare`` is given, the process exits with a non-zero status if any
+benchmark got slower than the baseline by more than ``--tolerance``.
+"""
+from collections import OrderedDict, namedtuple
+import json
+import os
+import platform
+import sys
+from timeit import default_timer
+
+import click
+from contextlib2 import ExitStack
+import numpy as np
+import pandas as pd
+
+import zipline
+from zipline import TradingAlgorithm
+from zipline.api import (
+    date_rules,
+    order_target_percent,
+    schedule_function,
+    time_rules,
+)
+from zipline.assets.synthetic import make_simple_equity_info
+from zipline.data.data_portal import DataPortal
+from zipline.data.loader import INDEX_MAPPING, get_benchmark_filename
+from zipline.data.minute_bars import BcolzMinuteBarReader
+from zipline.data.us_equity_pricing import (
+    BcolzDailyBarReader,
+    BcolzDailyBarWriter,
+    SQLiteAdjustmentReader,
+    SQLiteAdjustmentWriter,
+)
+from zipline.finance.asset_restrictions import NoRestrictions
+from zipline.finance.blotter import Blotter
+from zipline.finance.execution import MarketOrder
+from zipline.pipeline import Pipeline, SimplePipelineEngine
+from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.factors import (
+    AverageDollarVolume,
+    Returns,
+    SimpleMovingAverage,
+)
+from zipline.pipeline.loaders.synthetic import SeededRandomLoader
+from zipline.protocol import BarData
+from zipline.testing.core import (
+    create_daily_bar_data,
+    create_minute_bar_data,
+    tmp_dir,
+    tmp_trading_env,
+    write_bcolz_minute_data,
+)
+from zipline.utils.calendars import get_calendar
+from zipline.utils.factory import create_simulation_parameters
+from zipline.utils.paths import ensure_directory
+
+
+MARKET_DATA_DIR = os.path.join(
+    os.path.dirname(zipline.__file__),
+    'resources',
+    'market_data',
+)
+
+# The scenarios end on the same session so that the benchmark returns and
+# treasury curves bundled with zipline cover them.
+END_SESSION = pd.Timestamp('2016-12-30', tz='UTC')
+
+# The number of sessions of bar data written for each data frequency.
+SCENARIO_SESSIONS = OrderedDict([
+    ('daily', 252),
+    ('minute', 5),
+])
+SCENARIO_ASSETS = (100, 1000, 8000)
+
+# Every SPLIT_STRIDE'th asset gets a 2:1 split halfway through the scenario
+# so that the readers exercise their adjustment paths.
+SPLIT_STRIDE = 10
+
+Scenario = namedtuple('Scenario', 'frequency num_assets num_sessions')
+
+
+def load_market_data(*args, **kwargs):
+    """Load the benchmark returns and treasury curves that ship with zipline
+    instead of downloading them.
+    """
+    benchmark_returns = pd.Series.from_csv(
+        os.path.join(MARKET_DATA_DIR, get_benchmark_filename('SPY')),
+    ).tz_localize('UTC')
+    treasury_curves = pd.DataFrame.from_csv(
+        os.path.join(MARKET_DATA_DIR, INDEX_MAPPING['SPY'][1]),
+    ).tz_localize('UTC')
+    return benchmark_returns, treasury_curves
+
+
+class ScenarioData(object):
+    """The synthetic data for a single scenario.
+
+    Parameters
+    ----------
+    scenario : Scenario
+        The scenario to build the data for.
+    path : str
+        The directory to write the bar and adjustment data into.
+    stack : ExitStack
+        The stack which owns the temporary resources created for the data.
+    """
+    def __init__(self, scenario, path, stack):
+        self.scenario = scenario
+        self.calendar = calendar = get_calendar('NYSE')
+
+        end_loc = calendar.all_sessions.get_loc(END_SESSION)
+        self.sessions = sessions = calendar.all_sessions[
+            end_loc - scenario.num_sessions + 1:end_loc + 1
+        ]
+        self.sids = sids = np.arange(1, scenario.num_assets + 1)
+
+        self.env = stack.enter_context(tmp_trading_env(
+            load=load_market_data,
+            equities=make_simple_equity_info(
+                sids,
+                sessions[0],
+                sessions[-1],
+                symbols=['SYM%d' % sid for sid in sids],
+            ),
+        ))
+        self.assets = self.env.asset_finder.retrieve_all(sids)
+
+        daily_path = os.path.join(path, 'daily_equities.bcolz')
+        BcolzDailyBarWriter(
+            daily_path,
+            calendar,
+            sessions[0],
+            sessions[-1],
+        ).write(create_daily_bar_data(sessions, sids))
+        self.daily_reader = BcolzDailyBarReader(daily_path)
+
+        if scenario.frequency == 'minute':
+            minute_path = os.path.join(path, 'minute_equities')
+            ensure_directory(minute_path)
+            write_bcolz_minute_data(
+                calendar,
+                sessions,
+                minute_path,
+                create_minute_bar_data(
+                    calendar.minutes_for_sessions_in_range(
+                        sessions[0],
+                        sessions[-1],
+                    ),
+                    sids,
+                ),
+            )
+            self.minute_reader = BcolzMinuteBarReader(minute_path)
+        else:
+            self.minute_reader = None
+
+        split_sids = sids[::SPLIT_STRIDE]
+        adjustments_path = os.path.join(path, 'adjustments.sqlite')
+        SQLiteAdjustmentWriter(
+            adjustments_path,
+            self.daily_reader,
+            calendar,
+        ).write(splits=pd.DataFrame({
+            'sid': split_sids,
+            'ratio': 0.5,
+            'effective_date': sessions[len(sessions) // 2].value // 10 ** 9,
+        }))
+        self.adjustment_reader = SQLiteAdjustmentReader(adjustments_path)
+        stack.callback(self.adjustment_reader.conn.close)
+
+    @property
+    def frequency(self):
+        return self.scenario.frequency
+
+    @property
+    def minutes(self):
+        return self.calendar.minutes_for_sessions_in_range(
+            self.sessions[0],
+            self.sessions[-1],
+        )
+
+    def data_portal(self):
+        """Create a new DataPortal over the scenario's data.
+
+        A new portal is created for each timed run so that caches built by
+        one run are not reused by the next.
+        """
+        return DataPortal(
+            self.env.asset_finder,
+            self.calendar,
+            first_trading_day=self.daily_reader.first_trading_day,
+            equity_daily_reader=self.daily_reader,
+            equity_minute_reader=self.minute_reader,
+            adjustment_reader=self.adjustment_reader,
+        )
+
+    def sim_params(self):
+        return create_simulation_parameters(
+            start=self.sessions[0],
+            end=self.sessions[-1],
+            data_frequency=self.frequency,
+            trading_calendar=self.calendar,
+        )
+
+
+# Registry of benchmark name -> benchmark function. Each benchmark function
+# takes a ScenarioData and returns a pair of ``(setup, run)`` callables.
+# ``setup`` is called before each timed run to produce the arguments for
+# ``run``; only ``run`` is timed.
+BENCHMARKS = OrderedDict()
+
+
+def benchmark(f):
+    BENCHMARKS[f.__name__] = f
+    return f
+
+
+@benchmark
+def algorithm_run(data):
+    """TradingAlgorithm.run over the whole scenario, rebalancing into an
+    equal weighted portfolio of every asset at each market open.
+    """
+    assets = data.assets
+    weight = 1.0 / len(assets)
+
+    def rebalance(context, bar_data):
+        for asset in assets:
+            order_target_percent(asset, weight)
+
+    def initialize(context):
+        schedule_function(
+            rebalance,
+            date_rules.every_day(),
+            time_rules.market_open(),
+        )
+
+    def setup():
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            handle_data=lambda context, bar_data: None,
+            sim_params=data.sim_params(),
+            env=data.env,
+        )
+        return algo, data.data_portal()
+
+    def run(algo, data_portal):
+        algo.run(data_portal)
+
+    return setup, run
+
+
+@benchmark
+def run_pipeline(data):
+    """SimplePipelineEngine.run_pipeline over the last quarter of a year of
+    SeededRandomLoader data.
+    """
+    calendar = data.calendar
+    end_loc = calendar.all_sessions.get_loc(END_SESSION)
+    dates = calendar.all_sessions[end_loc - 251:end_loc + 1]
+    loader = SeededRandomLoader(
+        seed=5,
+        columns=USEquityPricing.columns,
+        dates=dates,
+        sids=data.sids,
+    )
+
+    sma = SimpleMovingAverage(
+        inputs=[USEquityPricing.close],
+        window_length=20,
+    )
+    dollar_volume = AverageDollarVolume(window_length=30)
+    pipeline = Pipeline(
+        columns={
+            'sma': sma,
+            'returns': Returns(window_length=60),
+            'dollar_volume_rank': dollar_volume.rank(),
+        },
+        screen=dollar_volume.percentile_between(10, 90),
+    )
+
+    def setup():
+        engine = SimplePipelineEngine(
+            get_loader=lambda column: loader,
+            calendar=dates,
+            asset_finder=data.env.asset_finder,
+        )
+        return engine,
+
+    def run(engine):
+        engine.run_pipeline(pipeline, dates[-63], dates[-1])
+
+    return setup, run
+
+
+@benchmark
+def load_raw_arrays(data):
+    """load_raw_arrays for every asset and every OHLCV field over the whole
+    scenario, using the minute reader if there is one.
+    """
+    fields = ['open', 'high', 'low', 'close', 'volume']
+    if data.minute_reader is not None:
+        reader = data.minute_reader
+        start, end = data.minutes[[0, -1]]
+    else:
+        reader = data.daily_reader
+        start, end = data.sessions[[0, -1]]
+
+    def setup():
+        return ()
+
+    def run():
+        reader.load_raw_arrays(fields, start, end, data.sids)
+
+    return setup, run
+
+
+@benchmark
+def get_history_window(data):
+    """DataPortal.get_history_window for every asset at each bar of the last
+    session, as an algorithm calling ``data.history`` every bar would.
+    """
+    if data.frequency == 'minute':
+        end_dts = data.calendar.minutes_for_session(data.sessions[-1])
+        bar_count = 390
+        frequency = '1m'
+    else:
+        end_dts = data.sessions[-60:]
+        bar_count = 20
+        frequency = '1d'
+
+    def setup():
+        return data.data_portal(),
+
+    def run(data_portal):
+        for dt in end_dts:
+            data_portal.get_history_window(
+                data.assets,
+                dt,
+                bar_count,
+                frequency,
+                'close',
+                data.frequency,
+            )
+
+    return setup, run
+
+
+@benchmark
+def get_transactions(data):
+    """Blotter.get_transactions with one open market order for every asset.
+    """
+    if data.frequency == 'minute':
+        dt = data.minutes[-1]
+    else:
+        dt = data.sessions[-1]
+
+    def setup():
+        data_portal = data.data_portal()
+        bar_data = BarData(
+            data_portal,
+            lambda: dt,
+            data.frequency,
+            data.calendar,
+            NoRestrictions(),
+        )
+        blotter = Blotter(data.frequency)
+        blotter.set_date(dt)
+        for asset in data.assets:
+            blotter.order(asset, 10, MarketOrder())
+        return blotter, bar_data
+
+    def run(blotter, bar_data):
+        blotter.get_transactions(bar_data)
+
+    return setup, run
+
+
+def time_benchmark(setup, run, repeat):
+    """Time ``repeat`` calls to ``run``, each with fresh arguments from
+    ``setup``.
+
+    Returns
+    -------
+    timings : list[float]
+        The wall clock time in seconds of each call to ``run``.
+    """
+    timings = []
+    for _ in range(repeat):
+        args = setup()
+        start = default_timer()
+        run(*args)
+        timings.append(default_timer() - start)
+    return timings
+
+
+def summarize(scenario, name, timings):
+    return OrderedDict([
+        ('benchmark', name),
+        ('frequency', scenario.frequency),
+        ('num_assets', scenario.num_assets),
+        ('num_sessions', scenario.num_sessions),
+        ('timings', timings),
+        ('min', min(timings)),
+        ('median', float(np.median(timings))),
+        ('mean', float(np.mean(timings))),
+    ])
+
+
+def metadata():
+    return OrderedDict([
+        ('zipline', zipline.__version__),
+        ('python', platform.python_version()),
+        ('numpy', np.__version__),
+        ('pandas', pd.__version__),
+        ('platform', platform.platform()),
+        ('timestamp', pd.Timestamp.utcnow().isoformat()),
+    ])
+
+
+def _key(result):
+    return (
+        result['benchmark'],
+        result['frequency'],
+        result['num_assets'],
+        result['num_sessions'],
+    )
+
+
+def find_regressions(results, baseline, tolerance):
+    """Find the results whose best time is slower than the best time of the
+    matching baseline result by more than ``tolerance``.
+
+    Returns
+    -------
+    regressions : list[(dict, float)]
+        The slower results paired with their ratio to the baseline.
+    """
+    baseline = {_key(result): result for result in baseline['results']}
+    regressions = []
+    for result in results:
+        try:
+            expected = baseline[_key(result)]
+        except KeyError:
+            continue
+        ratio = result['min'] / expected['min']
+        if ratio > 1 + tolerance:
+            regressions.append((result, ratio))
+    return regressions
+
+
+@click.command()
+@click.option(
+    '-f',
+    '--frequency',
+    type=click.Choice(list(SCENARIO_SESSIONS)),
+    multiple=True,
+    help='The data frequencies to run. Defaults to all of them.',
+)
+@click.option(
+    '-n',
+    '--num-assets',
+    type=click.Choice([str(n) for n in SCENARIO_ASSETS]),
+    multiple=True,
+    help='The universe sizes to run. Defaults to all of them.',
+)
+@click.option(
+    '-b',
+    '--benchmark',
+    'names',
+    type=click.Choice(list(BENCHMARKS)),
+    multiple=True,
+    help='The benchmarks to run. Defaults to all of them.',
+)
+@click.option(
+    '-r',
+    '--repeat',
+    default=3,
+    show_default=True,
+    help='The number of timed runs of each benchmark.',
+)
+@click.option(
+    '-o',
+    '--output',
+    type=click.File('w'),
+    default='-',
+    help='The file to write the JSON results to. Defaults to stdout.',
+)
+@click.option(
+    '--compare',
+    type=click.File('r'),
+    help='A JSON results file to compare the new results against.',
+)
+@click.option(
+    '--tolerance',
+    default=0.1,
+    show_default=True,
+    help='The fraction a benchmark may slow down by relative to the'
+    ' --compare baseline before it is reported as a regression.',
+)
+def main(frequency, num_assets, names, repeat, output, compare, tolerance):
+    """Run the benchmarks and write their timings as JSON.
+    """
+    scenarios = [
+        Scenario(freq, int(n), SCENARIO_SESSIONS[freq])
+        for freq in frequency or SCENARIO_SESSIONS
+        for n in num_assets or SCENARIO_ASSETS
+    ]
+
+    results = []
+    for scenario in scenarios:
+        click.echo('building data for %s' % (scenario,), err=True)
+        with ExitStack() as stack:
+            tmpdir = stack.enter_context(tmp_dir())
+            data = ScenarioData(scenario, tmpdir.path, stack)
+            for name in names or BENCHMARKS:
+                setup, run = BENCHMARKS[name](data)
+                result = summarize(
+                    scenario,
+                    name,
+                    time_benchmark(setup, run, repeat),
+                )
+                click.echo(
+                    '%s: min=%.4fs median=%.4fs' % (
+                        name,
+                        result['min'],
+                        result['median'],
+                    ),
+                    err=True,
+                )
+                results.append(result)
+
+    json.dump(
+        OrderedDict([('metadata', metadata()), ('results', results)]),
+        output,
+        indent=2,
+    )
+    output.write('\n')
+
+    if compare is not None:
+        regressions = find_regressions(results, json.load(compare), tolerance)
+        for result, ratio in regressions:
+            click.echo(
+                'regression: %s %.2fx slower than baseline' % (
+                    _key(result),
+                    ratio,
+                ),
+                err=True,
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,4 @@
+from multiprocessing.pool import ThreadPool
 import os
 
 from nose_parameterized import parameterized
@@ -5,14 +6,19 @@ import pandas as pd
 import sqlalchemy as sa
 from toolz import valmap
 import toolz.curried.operator as op
-from zipline.assets import ASSET_DB_VERSION
+from zipline.assets import ASSET_DB_VERSION, AssetFinder
 
 from zipline.assets.asset_writer import check_version_info
 from zipline.assets.synthetic import make_simple_equity_info
 from zipline.data.bundles import UnknownBundle, from_bundle_ingest_dirname, \
     ingestions_for_bundle
 from zipline.data.bundles.core import _make_bundle_core, BadClean, \
-    to_bundle_ingest_dirname, asset_db_path
+    to_bundle_ingest_dirname, asset_db_path, daily_equity_path, \
+    minute_equity_path
+from zipline.data.minute_bars import BcolzMinuteBarReader
+from zipline.data.mmap_daily_bars import MmapDailyBarReader
+from zipline.data.mmap_minute_bars import MmapMinuteBarReader
+from zipline.data.us_equity_pricing import BcolzDailyBarReader
 from zipline.lib.adjustment import Float64Multiply
 from zipline.pipeline.loaders.synthetic import (
     make_bar_data,
@@ -122,7 +128,12 @@ class BundleCoreTestCase(WithInstanceTmpDir,
         self.ingest('bundle', self.environ)
         assert_true(called[0])
 
-    def test_ingest(self):
+    @parameterized.expand([
+        (False, False),
+        (True, False),
+        (False, True),
+    ])
+    def test_ingest(self, use_pool, shared):
         calendar = get_calendar('NYSE')
         sessions = calendar.sessions_in_range(self.START_DATE, self.END_DATE)
         minutes = calendar.minutes_for_sessions_in_range(
@@ -181,10 +192,32 @@ class BundleCoreTestCase(WithInstanceTmpDir,
             assert_is_instance(cache, dataframe_cache)
             assert_is_instance(show_progress, bool)
 
-        self.ingest('bundle', environ=self.environ)
-        bundle = self.load('bundle', environ=self.environ)
+        pool = ThreadPool(2) if use_pool else None
+        try:
+            self.ingest('bundle', environ=self.environ, pool=pool)
+        finally:
+            if pool is not None:
+                pool.terminate()
+        bundle = self.load('bundle', environ=self.environ, shared=shared)
 
         assert_equal(set(bundle.asset_finder.sids), set(sids))
+        if shared:
+            assert_is_instance(
+                bundle.equity_minute_bar_reader,
+                MmapMinuteBarReader,
+            )
+            assert_is_instance(
+                bundle.equity_daily_bar_reader,
+                MmapDailyBarReader,
+            )
+            assert_equal(
+                bundle.asset_finder.lifetimes(sessions, True),
+                AssetFinder(
+                    bundle.asset_finder.engine,
+                ).lifetimes(sessions, True),
+            )
+            # A second load reads the data which was already written.
+            bundle = self.load('bundle', environ=self.environ, shared=True)
 
         columns = 'open', 'high', 'low', 'close', 'volume'
 
@@ -264,6 +297,150 @@ class BundleCoreTestCase(WithInstanceTmpDir,
             msg='volume',
         )
 
+    def test_ingest_incremental(self):
+        calendar = get_calendar('NYSE')
+        sessions = calendar.sessions_in_range(self.START_DATE, self.END_DATE)
+        minutes = calendar.minutes_for_sessions_in_range(
+            self.START_DATE, self.END_DATE,
+        )
+
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+        daily_bar_data = dict(make_bar_data(equities, sessions))
+        minute_bar_data = dict(make_bar_data(equities, minutes))
+        splits = pd.DataFrame.from_records([
+            {
+                'effective_date': str_to_seconds('2014-01-07'),
+                'ratio': 0.5,
+                'sid': 0,
+            },
+            {
+                'effective_date': str_to_seconds('2014-01-10'),
+                'ratio': 0.1,
+                'sid': 1,
+            },
+        ])
+
+        # The last session with data available to each ingestion.
+        available = [sessions[1], sessions[-1]]
+        start_sessions = []
+
+        @self.register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            end = available[len(start_sessions)]
+            start_sessions.append(start_session)
+
+            asset_db_writer.write(
+                equities=equities.assign(end_date=end.tz_localize(None)),
+            )
+            minute_bar_writer.write(
+                (sid, df[start_session:end + pd.Timedelta(days=1)].copy())
+                for sid, df in minute_bar_data.items()
+            )
+            daily_bar_writer.write(
+                (sid, df[start_session:end].copy())
+                for sid, df in daily_bar_data.items()
+            )
+            adjustment_writer.write(
+                splits=splits[splits.effective_date <= str_to_seconds(
+                    str(end.date()),
+                )],
+            )
+
+        first_timestamp = pd.Timestamp('2014-01-07 12:00', tz='utc')
+        self.ingest('bundle', self.environ, timestamp=first_timestamp,
+                    incremental=True)
+        self.ingest('bundle', self.environ,
+                    timestamp=first_timestamp + pd.Timedelta(days=1),
+                    incremental=True)
+
+        # The first ingestion was a full ingestion, and the second only
+        # ingested the new sessions.
+        assert_equal(start_sessions, [self.START_DATE, sessions[2]])
+
+        columns = 'open', 'high', 'low', 'close', 'volume'
+        ingestions = ingestions_for_bundle('bundle', self.environ)[::-1]
+        assert_equal(len(ingestions), 2)
+        for ingestion, end in zip(ingestions, available):
+            # Appending in the second ingestion must not change the first.
+            timestr = to_bundle_ingest_dirname(ingestion)
+            asset_finder = AssetFinder(
+                asset_db_path('bundle', timestr, environ=self.environ),
+            )
+            assert_equal(asset_finder.retrieve_asset(0).end_date, end)
+
+            end_minute = calendar.session_close(end)
+            minute_bar_reader = BcolzMinuteBarReader(
+                minute_equity_path('bundle', timestr, environ=self.environ),
+            )
+            actual = minute_bar_reader.load_raw_arrays(
+                columns,
+                minutes[0],
+                end_minute,
+                sids,
+            )
+            for actual_column, colname in zip(actual, columns):
+                assert_equal(
+                    actual_column,
+                    expected_bar_values_2d(
+                        minutes[minutes <= end_minute],
+                        equities,
+                        colname,
+                    ),
+                    msg=colname,
+                )
+
+            daily_bar_reader = BcolzDailyBarReader(
+                daily_equity_path('bundle', timestr, environ=self.environ),
+            )
+            actual = daily_bar_reader.load_raw_arrays(
+                columns,
+                self.START_DATE,
+                end,
+                sids,
+            )
+            for actual_column, colname in zip(actual, columns):
+                assert_equal(
+                    actual_column,
+                    expected_bar_values_2d(
+                        sessions[sessions <= end],
+                        equities,
+                        colname,
+                    ),
+                    msg=colname,
+                )
+
+        # The split which was written by both ingestions is only stored
+        # once.
+        adjustment_reader = self.load('bundle', self.environ).adjustment_reader
+        assert_equal(
+            adjustment_reader.get_adjustments_for_sid('splits', 0),
+            [[pd.Timestamp('2014-01-07', tz='utc'), 0.5]],
+        )
+        assert_equal(
+            adjustment_reader.get_adjustments_for_sid('splits', 1),
+            [[pd.Timestamp('2014-01-10', tz='utc'), 0.1]],
+        )
+
     def test_ingest_assets_versions(self):
         versions = (1, 2)
 
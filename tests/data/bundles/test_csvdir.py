@@ -0,0 +1,147 @@
+import os
+
+from nose_parameterized import parameterized
+import numpy as np
+import pandas as pd
+
+from zipline.data.bundles.core import _make_bundle_core
+from zipline.data.bundles import csvdir_equities
+from zipline.testing import tmp_dir
+from zipline.testing.fixtures import ZiplineTestCase
+from zipline.testing.predicates import assert_equal
+from zipline.utils.calendars import get_calendar
+
+
+class CSVDIRBundleTestCase(ZiplineTestCase):
+    symbols = 'AAPL', 'IBM', 'KO'
+    columns = 'open', 'high', 'low', 'close', 'volume'
+    asset_start = pd.Timestamp('2014-01-02', tz='utc')
+    asset_end = pd.Timestamp('2014-03-31', tz='utc')
+    calendar = get_calendar('NYSE')
+    sessions = calendar.sessions_in_range(asset_start, asset_end)
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(CSVDIRBundleTestCase, cls).init_class_fixtures()
+        (cls.bundles,
+         cls.register,
+         cls.unregister,
+         cls.ingest,
+         cls.load,
+         cls.clean) = map(staticmethod, _make_bundle_core())
+
+    def make_frames(self):
+        """The pricing data for each symbol. Each symbol starts trading on a
+        different session. IBM splits and KO pays a dividend.
+        """
+        frames = {}
+        for sid, symbol in enumerate(self.symbols):
+            sessions = self.sessions[sid * 5:].tz_localize(None)
+            closes = np.arange(len(sessions), dtype=float) + 10 * (sid + 1)
+            frames[symbol] = pd.DataFrame(
+                {
+                    'date': sessions,
+                    'open': closes + 1,
+                    'high': closes + 2,
+                    'low': closes - 1,
+                    'close': closes,
+                    'volume': np.arange(len(sessions)) * 100,
+                    'dividend': np.where(
+                        (sessions == '2014-02-14') & (symbol == 'KO'),
+                        0.5,
+                        0.0,
+                    ),
+                    'split': np.where(
+                        (sessions == '2014-03-03') & (symbol == 'IBM'),
+                        0.5,
+                        1.0,
+                    ),
+                },
+                columns=[
+                    'date', 'open', 'high', 'low', 'close', 'volume',
+                    'dividend', 'split',
+                ],
+            )
+        return frames
+
+    @parameterized.expand([
+        ('files', None),
+        ('files', 2),
+        ('long', None),
+    ])
+    def test_bundle(self, layout, processes):
+        csvdir = self.enter_instance_context(tmp_dir()).path
+        frames = self.make_frames()
+        if layout == 'files':
+            os.mkdir(os.path.join(csvdir, 'daily'))
+            for symbol, frame in frames.items():
+                frame.to_csv(
+                    os.path.join(csvdir, 'daily', symbol + '.csv'),
+                    index=False,
+                )
+        else:
+            pd.concat(
+                frame.assign(symbol=symbol)
+                # The rows do not need to be grouped by symbol.
+                for symbol, frame in sorted(frames.items(), reverse=True)
+            ).sort_values('date').to_csv(
+                os.path.join(csvdir, 'daily.csv'),
+                index=False,
+            )
+
+        name = 'csvdir-%s-%s' % (layout, processes)
+        self.register(
+            name,
+            csvdir_equities(['daily'], processes=processes),
+            calendar_name='NYSE',
+            start_session=self.asset_start,
+            end_session=self.asset_end,
+        )
+
+        zipline_root = self.enter_instance_context(tmp_dir()).path
+        environ = {
+            'ZIPLINE_ROOT': zipline_root,
+            'CSVDIR': csvdir,
+        }
+
+        self.ingest(name, environ=environ, show_progress=False)
+        bundle = self.load(name, environ=environ)
+
+        sids = 0, 1, 2
+        equities = bundle.asset_finder.retrieve_all(sids)
+        for sid, (equity, symbol) in enumerate(zip(equities, self.symbols)):
+            assert_equal(equity.symbol, symbol)
+            assert_equal(equity.start_date, self.sessions[sid * 5])
+            assert_equal(equity.end_date, self.asset_end)
+            assert_equal(
+                equity.auto_close_date,
+                self.asset_end + pd.Timedelta(days=1),
+            )
+
+        actual = bundle.equity_daily_bar_reader.load_raw_arrays(
+            self.columns,
+            self.asset_start,
+            self.asset_end,
+            sids,
+        )
+        for column, values in zip(self.columns, actual):
+            for sid, symbol in enumerate(self.symbols):
+                expected = np.full(
+                    len(self.sessions),
+                    0.0 if column == 'volume' else np.nan,
+                )
+                expected[sid * 5:] = frames[symbol][column]
+                assert_equal(values[:, sid], expected, msg=column)
+
+        adjustment_reader = bundle.adjustment_reader
+        assert_equal(
+            adjustment_reader.get_adjustments_for_sid('splits', 1),
+            [[pd.Timestamp('2014-03-03', tz='utc'), 0.5]],
+        )
+        assert_equal(
+            adjustment_reader.get_adjustments_for_sid('splits', 0),
+            [],
+        )
+        dividends = adjustment_reader.get_adjustments_for_sid('dividends', 2)
+        assert_equal(len(dividends), 1)
+        assert_equal(dividends[0][0], pd.Timestamp('2014-02-14', tz='utc'))
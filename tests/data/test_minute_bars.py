@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from datetime import timedelta
+from functools import partial
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
 import os
 
 from numpy import (
@@ -45,8 +48,11 @@ from zipline.data.minute_bars import (
     BcolzMinuteWriterColumnMismatch,
     H5MinuteBarUpdateWriter,
     H5MinuteBarUpdateReader,
+    _writer_on_pool,
 )
 
+from zipline.testing import parameter_space
+from zipline.utils.pool import SequentialPool
 from zipline.testing.fixtures import (
     WithAssetFinder,
     WithInstanceTmpDir,
@@ -877,6 +883,155 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
                 assert_almost_equal(data[sid].loc[minutes, col],
                                     arrays[i][j][minute_locs])
 
+    @parameter_space(use_pool=[True, False])
+    def test_unadjusted_minutes_many_sids(self, use_pool):
+        """
+        Test a window over many sids with differing ratios and lengths,
+        spanning an early close.
+        """
+        # Subtests share the instance fixtures, so write to a new directory.
+        dest = self.instance_tmpdir.makedir('many_sids_%s' % use_pool)
+        writer = BcolzMinuteBarWriter(
+            dest,
+            self.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            US_EQUITIES_MINUTES_PER_DAY,
+            ohlc_ratios_per_sid={3: 10, 5: 100},
+        )
+        minutes = self.trading_calendar.minutes_for_sessions_in_range(
+            Timestamp('2015-11-25', tz='UTC'),
+            Timestamp('2015-11-30', tz='UTC'),
+        )
+        sids = list(range(1, 9))
+        for sid in sids:
+            # Each sid stops trading at a different minute, so some of the
+            # windows are shorter than the requested range.
+            sid_minutes = minutes[:len(minutes) - 100 * sid]
+            values = arange(len(sid_minutes), dtype=float64) % 7 + sid
+            writer.write_sid(sid, DataFrame(
+                data={
+                    'open': values,
+                    'high': values + 1,
+                    'low': values - 1,
+                    'close': values,
+                    'volume': values.astype(int64),
+                },
+                index=sid_minutes,
+            ))
+
+        pool = ThreadPool(3) if use_pool else None
+        reader = BcolzMinuteBarReader(dest, pool=pool)
+        columns = ['open', 'high', 'low', 'close', 'volume']
+        try:
+            arrays = reader.load_raw_arrays(
+                columns, minutes[0], minutes[-1], sids,
+            )
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+        for column, values in zip(columns, arrays):
+            self.assertEqual(values.shape, (len(minutes), len(sids)))
+            for j, sid in enumerate(sids):
+                expected = [
+                    reader.get_value(sid, minute, column)
+                    for minute in minutes
+                ]
+                assert_almost_equal(values[:, j], expected)
+
+    @parameter_space(pool_type=['sequential', 'thread', 'process'])
+    def test_write_with_pool(self, pool_type):
+        """
+        Test that writing with a pool gives the same result as writing
+        serially, including sids which are written in several chunks and
+        deferred frames.
+        """
+        minutes = self.trading_calendar.minutes_for_sessions_in_range(
+            Timestamp('2015-11-25', tz='UTC'),
+            Timestamp('2015-11-30', tz='UTC'),
+        )
+        session_starts = [0, 210, 600]
+
+        def make_data():
+            # Write each sid in chunks, interleaved with the other sids.
+            for start, stop in zip(session_starts, session_starts[1:]):
+                for sid in range(1, 6):
+                    values = arange(start, stop, dtype=float64) + sid
+                    # Deferred frames are called on the pool.
+                    yield sid, partial(
+                        DataFrame,
+                        data={
+                            'open': values,
+                            'high': values + 1,
+                            'low': values - 1,
+                            'close': values,
+                            'volume': values.astype(int64),
+                        },
+                        index=minutes[start:stop],
+                    )
+
+        def write(name, pool):
+            # Subtests share the instance fixtures, so write to a new
+            # directory.
+            dest = self.instance_tmpdir.makedir('%s_%s' % (name, pool_type))
+            BcolzMinuteBarWriter(
+                dest,
+                self.trading_calendar,
+                TEST_CALENDAR_START,
+                TEST_CALENDAR_STOP,
+                US_EQUITIES_MINUTES_PER_DAY,
+                ohlc_ratios_per_sid={3: 10},
+                pool=pool,
+            ).write(make_data())
+            return BcolzMinuteBarReader(dest)
+
+        pool = {
+            'sequential': SequentialPool,
+            'thread': partial(ThreadPool, 3),
+            'process': partial(Pool, 3),
+        }[pool_type]()
+        try:
+            result = write('pool', pool)
+        finally:
+            if pool_type != 'sequential':
+                pool.terminate()
+        expected = write('serial', None)
+
+        columns = ['open', 'high', 'low', 'close', 'volume']
+        sids = list(range(1, 6))
+        assert_array_equal(
+            result.load_raw_arrays(columns, minutes[0], minutes[-1], sids),
+            expected.load_raw_arrays(columns, minutes[0], minutes[-1], sids),
+        )
+        self.assertEqual(
+            result.get_value(3, minutes[599], 'close'),
+            602.0,
+        )
+
+    def test_writer_reused_on_pool(self):
+        """
+        Test that each worker of a pool only recreates the writer when it is
+        given the arguments of another writer.
+        """
+        def pool_args(name):
+            return BcolzMinuteBarWriter(
+                self.instance_tmpdir.makedir(name),
+                self.trading_calendar,
+                TEST_CALENDAR_START,
+                TEST_CALENDAR_STOP,
+                US_EQUITIES_MINUTES_PER_DAY,
+            )._pool_args()
+
+        args = pool_args('reused_a')
+        writer = _writer_on_pool(args)
+        self.assertIs(_writer_on_pool(args), writer)
+
+        other_args = pool_args('reused_b')
+        other_writer = _writer_on_pool(other_args)
+        self.assertIsNot(other_writer, writer)
+        self.assertEqual(other_writer._rootdir, other_args[0])
+
     def test_adjust_non_trading_minutes(self):
         start_day = Timestamp('2015-06-01', tz='UTC')
         end_day = Timestamp('2015-06-02', tz='UTC')
@@ -0,0 +1,257 @@
+import numpy as np
+from numpy.random import RandomState
+from numpy.testing import assert_array_equal
+from pandas import DataFrame, Timestamp
+
+from zipline.data.bar_reader import NoDataOnDate
+from zipline.data.mmap_daily_bars import (
+    MmapDailyBarReader,
+    MmapDailyBarUnknownSid,
+    MmapDailyBarWriter,
+    convert_bcolz_daily_bars,
+)
+from zipline.data.us_equity_pricing import (
+    BcolzDailyBarReader,
+    BcolzDailyBarWriter,
+)
+from zipline.testing import parameter_space
+from zipline.testing.fixtures import (
+    WithAssetFinder,
+    WithInstanceTmpDir,
+    WithTmpDir,
+    WithTradingCalendars,
+    ZiplineTestCase,
+)
+from zipline.testing.predicates import assert_equal
+
+TEST_CALENDAR_START = Timestamp('2015-06-01', tz='UTC')
+TEST_CALENDAR_STOP = Timestamp('2015-08-31', tz='UTC')
+
+
+class MmapDailyBarTestCase(WithTradingCalendars,
+                           WithAssetFinder,
+                           WithTmpDir,
+                           WithInstanceTmpDir,
+                           ZiplineTestCase):
+
+    ASSET_FINDER_EQUITY_SIDS = 1, 2, 4, 5
+    ASSET_FINDER_EQUITY_START_DATE = TEST_CALENDAR_START
+    ASSET_FINDER_EQUITY_END_DATE = TEST_CALENDAR_STOP
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(MmapDailyBarTestCase, cls).init_class_fixtures()
+        cls.sessions = cls.trading_calendar.sessions_in_range(
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+        )
+
+        # Write the same data in both formats to compare the readers.
+        data = list(cls.make_data())
+        mmap_dest = cls.tmpdir.getpath('mmap')
+        cls.make_writer(mmap_dest).write(data)
+        cls.mmap_reader = MmapDailyBarReader(mmap_dest)
+
+        cls.bcolz_dest = cls.tmpdir.getpath('bcolz')
+        BcolzDailyBarWriter(
+            cls.bcolz_dest,
+            cls.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+        ).write(data)
+        cls.bcolz_reader = BcolzDailyBarReader(cls.bcolz_dest)
+
+    @classmethod
+    def make_writer(cls, dest):
+        return MmapDailyBarWriter(
+            dest,
+            cls.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            cls.ASSET_FINDER_EQUITY_SIDS,
+        )
+
+    @classmethod
+    def make_data(cls):
+        """Random bars for each sid, with some sessions without trades. Sid 2
+        starts late, sid 4 stops early and sid 5 has no data.
+        """
+        rand = RandomState(3)
+        lifetimes = {
+            1: cls.sessions,
+            2: cls.sessions[10:],
+            4: cls.sessions[:-20],
+        }
+        for sid, sessions in sorted(lifetimes.items()):
+            closes = rand.uniform(1, 100, size=len(sessions)).round(2)
+            volumes = rand.randint(1, 1000, size=len(sessions))
+            traded = rand.uniform(size=len(sessions)) < 0.8
+            if sid == 4:
+                # The last sessions have no trades, so the last traded dt
+                # has to look back.
+                traded[-5:] = False
+            closes[~traded] = 0
+            volumes[~traded] = 0
+            yield sid, DataFrame(
+                {
+                    'open': closes + traded,
+                    'high': closes + 2 * traded,
+                    'low': closes,
+                    'close': closes,
+                    'volume': volumes,
+                },
+                index=sessions,
+            )
+
+    @parameter_space(
+        window=[
+            (0, 0),
+            (0, 20),
+            (5, 15),
+            (30, -1),
+            (0, -1),
+        ],
+        sids=[
+            [1, 2, 4],
+            [4, 1],
+            [2],
+        ],
+    )
+    def test_load_raw_arrays(self, window, sids):
+        start, end = self.sessions[window[0]], self.sessions[window[1]]
+        fields = ['open', 'high', 'low', 'close', 'volume']
+
+        expected = self.bcolz_reader.load_raw_arrays(fields, start, end, sids)
+        actual = self.mmap_reader.load_raw_arrays(fields, start, end, sids)
+
+        for field, e, a in zip(fields, expected, actual):
+            assert_equal(a.dtype, e.dtype, msg=field)
+            assert_array_equal(a, e, err_msg=field)
+
+    def test_load_raw_arrays_volume_view(self):
+        volumes, = self.mmap_reader.load_raw_arrays(
+            ['volume'],
+            self.sessions[5],
+            self.sessions[15],
+            [1, 2],
+        )
+        self.assertTrue(
+            np.may_share_memory(volumes, self.mmap_reader._block('volume')),
+        )
+
+    def test_load_raw_arrays_unknown_sid(self):
+        closes, volumes = self.mmap_reader.load_raw_arrays(
+            ['close', 'volume'],
+            self.sessions[0],
+            self.sessions[-1],
+            [1, 3],
+        )
+        expected_closes, expected_volumes = \
+            self.bcolz_reader.load_raw_arrays(
+                ['close', 'volume'],
+                self.sessions[0],
+                self.sessions[-1],
+                [1],
+            )
+        assert_array_equal(closes[:, 0], expected_closes[:, 0])
+        assert_array_equal(volumes[:, 0], expected_volumes[:, 0])
+        self.assertTrue(np.isnan(closes[:, 1]).all())
+        assert_array_equal(volumes[:, 1], 0)
+
+    def test_get_value(self):
+        for sid in 1, 2, 4:
+            for session in self.sessions:
+                for field in 'close', 'volume':
+                    try:
+                        expected = self.bcolz_reader.get_value(
+                            sid, session, field,
+                        )
+                    except NoDataOnDate as e:
+                        with self.assertRaises(type(e)):
+                            self.mmap_reader.get_value(sid, session, field)
+                        continue
+                    assert_equal(
+                        self.mmap_reader.get_value(sid, session, field),
+                        expected,
+                        msg=(sid, session, field),
+                    )
+
+    def test_get_value_no_data(self):
+        with self.assertRaises(NoDataOnDate):
+            self.mmap_reader.get_value(5, self.sessions[0], 'close')
+        with self.assertRaises(NoDataOnDate):
+            self.mmap_reader.get_value(3, self.sessions[0], 'close')
+
+    def test_get_last_traded_dt(self):
+        for asset in self.asset_finder.retrieve_all([1, 2, 4]):
+            for session in self.sessions:
+                assert_equal(
+                    self.mmap_reader.get_last_traded_dt(asset, session),
+                    self.bcolz_reader.get_last_traded_dt(asset, session),
+                    msg=(asset, session),
+                )
+
+    def test_attributes(self):
+        assert_equal(self.mmap_reader.sessions, self.bcolz_reader.sessions)
+        assert_equal(
+            self.mmap_reader.first_trading_day,
+            self.bcolz_reader.first_trading_day,
+        )
+        assert_equal(
+            self.mmap_reader.last_available_dt,
+            self.bcolz_reader.last_available_dt,
+        )
+        assert_equal(
+            self.mmap_reader.trading_calendar.name,
+            self.bcolz_reader.trading_calendar.name,
+        )
+
+    def test_unknown_sid(self):
+        writer = self.make_writer(self.instance_tmpdir.getpath('unknown'))
+        data = DataFrame(
+            {
+                'open': [1.0],
+                'high': [1.0],
+                'low': [1.0],
+                'close': [1.0],
+                'volume': [100],
+            },
+            index=self.sessions[:1],
+        )
+        with self.assertRaises(MmapDailyBarUnknownSid):
+            writer.write([(3, data)])
+
+    def test_convert_bcolz_daily_bars(self):
+        reader = convert_bcolz_daily_bars(
+            self.bcolz_dest,
+            self.instance_tmpdir.getpath('converted'),
+        )
+        fields = ['open', 'high', 'low', 'close', 'volume']
+        sids = [1, 2, 4]
+        expected = self.bcolz_reader.load_raw_arrays(
+            fields,
+            self.sessions[0],
+            self.sessions[-1],
+            sids,
+        )
+        actual = reader.load_raw_arrays(
+            fields,
+            self.sessions[0],
+            self.sessions[-1],
+            sids,
+        )
+        for field, e, a in zip(fields, expected, actual):
+            assert_array_equal(a, e, err_msg=field)
+
+        for asset in self.asset_finder.retrieve_all(sids):
+            assert_equal(
+                reader.get_last_traded_dt(asset, self.sessions[-1]),
+                self.bcolz_reader.get_last_traded_dt(
+                    asset,
+                    self.sessions[-1],
+                ),
+            )
+        assert_equal(
+            reader.first_trading_day,
+            self.bcolz_reader.first_trading_day,
+        )
@@ -0,0 +1,326 @@
+from numpy import arange, dtype, float64, int64, nan
+from numpy.random import RandomState
+from numpy.testing import assert_array_equal
+from pandas import DataFrame, NaT, Timestamp
+
+from zipline.data.bar_reader import NoDataOnDate
+from zipline.data.minute_bars import (
+    BcolzMinuteBarReader,
+    BcolzMinuteBarWriter,
+    US_EQUITIES_MINUTES_PER_DAY,
+)
+from zipline.data.mmap_minute_bars import (
+    MmapMinuteBarReader,
+    MmapMinuteBarUnknownSid,
+    MmapMinuteBarWriter,
+    convert_bcolz_minute_bars,
+)
+from zipline.testing import parameter_space
+from zipline.testing.fixtures import (
+    WithAssetFinder,
+    WithInstanceTmpDir,
+    WithTmpDir,
+    WithTradingCalendars,
+    ZiplineTestCase,
+)
+from zipline.testing.predicates import assert_equal
+
+# Covers the early closes on 2015-11-27 and 2015-12-24.
+TEST_CALENDAR_START = Timestamp('2015-11-23', tz='UTC')
+TEST_CALENDAR_STOP = Timestamp('2015-12-31', tz='UTC')
+
+# Small partitions so that windows span several of them.
+SESSIONS_PER_PARTITION = 4
+
+
+class MmapMinuteBarTestCase(WithTradingCalendars,
+                            WithAssetFinder,
+                            WithTmpDir,
+                            WithInstanceTmpDir,
+                            ZiplineTestCase):
+
+    ASSET_FINDER_EQUITY_SIDS = 1, 2, 4, 5
+    ASSET_FINDER_EQUITY_START_DATE = TEST_CALENDAR_START
+    ASSET_FINDER_EQUITY_END_DATE = TEST_CALENDAR_STOP
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(MmapMinuteBarTestCase, cls).init_class_fixtures()
+        cls.sessions = cls.trading_calendar.sessions_in_range(
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+        )
+        cls.minutes = cls.trading_calendar.minutes_for_sessions_in_range(
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+        )
+
+        # Write the same data in both formats to compare the readers.
+        data = list(cls.make_data())
+        mmap_dest = cls.tmpdir.getpath('mmap')
+        cls.make_writer(mmap_dest).write(data)
+        cls.mmap_reader = MmapMinuteBarReader(mmap_dest)
+
+        cls.bcolz_dest = bcolz_dest = cls.tmpdir.makedir('bcolz')
+        BcolzMinuteBarWriter(
+            bcolz_dest,
+            cls.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            US_EQUITIES_MINUTES_PER_DAY,
+            ohlc_ratios_per_sid={5: 10},
+        ).write(data)
+        cls.bcolz_reader = BcolzMinuteBarReader(bcolz_dest)
+
+    @classmethod
+    def make_writer(cls, dest):
+        return MmapMinuteBarWriter(
+            dest,
+            cls.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            US_EQUITIES_MINUTES_PER_DAY,
+            cls.ASSET_FINDER_EQUITY_SIDS,
+            ohlc_ratios_per_sid={5: 10},
+            sessions_per_partition=SESSIONS_PER_PARTITION,
+        )
+
+    @classmethod
+    def make_data(cls):
+        """Random bars for each sid, with some minutes and sessions missing.
+        """
+        rand = RandomState(3)
+        for sid in cls.ASSET_FINDER_EQUITY_SIDS:
+            minutes = cls.minutes[rand.uniform(size=len(cls.minutes)) < 0.5]
+            if sid == 4:
+                # Stop trading part way through so that the last traded dt
+                # has to look back across partitions.
+                minutes = minutes[minutes < cls.sessions[3]]
+            closes = rand.uniform(1, 100, size=len(minutes)).round(2)
+            yield sid, DataFrame(
+                {
+                    'open': closes + 1,
+                    'high': closes + 2,
+                    'low': closes - 1,
+                    'close': closes,
+                    'volume': rand.randint(1, 1000, size=len(minutes)),
+                },
+                index=minutes,
+            )
+
+    def init_instance_fixtures(self):
+        super(MmapMinuteBarTestCase, self).init_instance_fixtures()
+        self.dest = self.instance_tmpdir.getpath('mmap_minute_bars')
+        self.writer = self.make_writer(self.dest)
+
+    @parameter_space(
+        window=[
+            # A single minute.
+            ('2015-11-23 14:31', '2015-11-23 14:31'),
+            # Within one partition.
+            ('2015-11-23 15:00', '2015-11-24 20:00'),
+            # Across a partition boundary and an early close.
+            ('2015-11-25 14:31', '2015-12-01 21:00'),
+            # Every minute, across both early closes.
+            ('2015-11-23 14:31', '2015-12-31 21:00'),
+        ],
+        sids=[
+            [1, 2, 4, 5],
+            [5, 1],
+            [2, 3],
+        ],
+    )
+    def test_load_raw_arrays_matches_bcolz(self, window, sids):
+        mmap_reader = self.mmap_reader
+        bcolz_reader = self.bcolz_reader
+        start, end = (Timestamp(dt, tz='UTC') for dt in window)
+        fields = ['open', 'high', 'low', 'close', 'volume']
+
+        # The bcolz reader can not read sids which were not written.
+        known = [sid for sid in sids if sid in self.ASSET_FINDER_EQUITY_SIDS]
+        expected = bcolz_reader.load_raw_arrays(fields, start, end, known)
+        results = mmap_reader.load_raw_arrays(fields, start, end, sids)
+
+        for field, result, expected_field in zip(fields, results, expected):
+            self.assertEqual(result.dtype, expected_field.dtype)
+            for i, sid in enumerate(sids):
+                if sid in known:
+                    assert_array_equal(
+                        result[:, i],
+                        expected_field[:, known.index(sid)],
+                        err_msg='field=%s sid=%d' % (field, sid),
+                    )
+                else:
+                    assert_array_equal(
+                        result[:, i],
+                        0 if field == 'volume' else nan,
+                    )
+
+    def test_get_value_matches_bcolz(self):
+        mmap_reader = self.mmap_reader
+        bcolz_reader = self.bcolz_reader
+        for sid in self.ASSET_FINDER_EQUITY_SIDS:
+            for dt in self.minutes[::97]:
+                for field in 'close', 'volume':
+                    assert_array_equal(
+                        mmap_reader.get_value(sid, dt, field),
+                        bcolz_reader.get_value(sid, dt, field),
+                    )
+
+        with self.assertRaises(NoDataOnDate):
+            mmap_reader.get_value(1, Timestamp('2015-11-24 03:00', tz='UTC'),
+                                  'close')
+        with self.assertRaises(NoDataOnDate):
+            mmap_reader.get_value(3, self.minutes[0], 'close')
+
+    def test_get_values_matches_get_value(self):
+        sids = list(self.ASSET_FINDER_EQUITY_SIDS)
+        for reader in self.mmap_reader, self.bcolz_reader:
+            for dt in self.minutes[::97]:
+                for field in 'close', 'volume':
+                    values = reader.get_values(sids, dt, field)
+                    assert_equal(
+                        values.dtype,
+                        dtype(int64 if field == 'volume' else float64),
+                    )
+                    assert_array_equal(
+                        values,
+                        [reader.get_value(sid, dt, field) for sid in sids],
+                    )
+
+        with self.assertRaises(NoDataOnDate):
+            self.mmap_reader.get_values(
+                [1], Timestamp('2015-11-24 03:00', tz='UTC'), 'close',
+            )
+        with self.assertRaises(NoDataOnDate):
+            self.mmap_reader.get_values([1, 3], self.minutes[0], 'close')
+
+    def test_get_last_traded_dt_matches_bcolz(self):
+        mmap_reader = self.mmap_reader
+        bcolz_reader = self.bcolz_reader
+        dts = list(self.minutes[::131]) + [
+            # After the early close.
+            Timestamp('2015-11-27 20:00', tz='UTC'),
+            # Overnight.
+            Timestamp('2015-12-02 03:00', tz='UTC'),
+        ]
+        for asset in self.asset_finder.retrieve_all(
+                self.ASSET_FINDER_EQUITY_SIDS):
+            for dt in dts:
+                assert_equal(
+                    mmap_reader.get_last_traded_dt(asset, dt),
+                    bcolz_reader.get_last_traded_dt(asset, dt),
+                    msg='sid=%d dt=%s' % (asset.sid, dt),
+                )
+
+    def test_overwrite_and_reopen(self):
+        minute = self.minutes[5]
+        data = DataFrame(
+            {
+                'open': [10.0],
+                'high': [20.0],
+                'low': [30.0],
+                'close': [40.0],
+                'volume': [50.0],
+            },
+            index=[minute],
+        )
+        self.writer.write_sid(1, data)
+        self.writer.write_sid(1, data * 2)
+        self.assertEqual(
+            MmapMinuteBarReader(self.dest).get_value(1, minute, 'close'),
+            80.0,
+        )
+
+        # Extend the data set with a new session.
+        new_end = Timestamp('2016-01-04', tz='UTC')
+        new_minute = self.trading_calendar.minutes_for_session(new_end)[0]
+        data.index = [new_minute]
+        MmapMinuteBarWriter.open(self.dest, new_end).write([(2, data)])
+
+        reader = MmapMinuteBarReader(self.dest)
+        self.assertEqual(reader.last_available_dt.normalize(), new_end)
+        self.assertEqual(reader.get_value(1, minute, 'close'), 80.0)
+        self.assertEqual(reader.get_value(2, new_minute, 'volume'), 50)
+        self.assertIs(
+            reader.get_last_traded_dt(self.asset_finder.retrieve_asset(4),
+                                      new_minute),
+            NaT,
+        )
+
+    def test_partition_written_while_open(self):
+        first_minute = self.minutes[0]
+        # In a later partition than the first minute.
+        minute = self.trading_calendar.minutes_for_session(
+            self.sessions[SESSIONS_PER_PARTITION],
+        )[0]
+        data = DataFrame(
+            {
+                'open': [10.0],
+                'high': [20.0],
+                'low': [30.0],
+                'close': [40.0],
+                'volume': [50.0],
+            },
+            index=[first_minute],
+        )
+        self.writer.write_sid(1, data)
+
+        reader = MmapMinuteBarReader(self.dest)
+        self.assertEqual(reader.get_value(1, first_minute, 'close'), 40.0)
+        self.assertEqual(reader.get_value(1, minute, 'volume'), 0)
+
+        # The open reader sees the partition once it has been written.
+        data.index = [minute]
+        self.writer.write_sid(1, data)
+        self.assertEqual(reader.get_value(1, minute, 'volume'), 50)
+        self.assertEqual(reader.get_value(1, minute, 'close'), 40.0)
+
+    def test_unknown_sid(self):
+        data = DataFrame(
+            {
+                'open': arange(1.0),
+                'high': arange(1.0),
+                'low': arange(1.0),
+                'close': arange(1.0),
+                'volume': arange(1.0),
+            },
+            index=self.minutes[:1],
+        )
+        with self.assertRaises(MmapMinuteBarUnknownSid):
+            self.writer.write([(3, data)])
+
+    def test_convert_bcolz_minute_bars(self):
+        reader = convert_bcolz_minute_bars(
+            self.bcolz_dest,
+            self.instance_tmpdir.getpath('converted'),
+            sessions_per_partition=SESSIONS_PER_PARTITION,
+        )
+        assert_equal(list(reader.sids), list(self.ASSET_FINDER_EQUITY_SIDS))
+
+        fields = ['open', 'high', 'low', 'close', 'volume']
+        sids = list(self.ASSET_FINDER_EQUITY_SIDS)
+        expected = self.bcolz_reader.load_raw_arrays(
+            fields,
+            self.minutes[0],
+            self.minutes[-1],
+            sids,
+        )
+        actual = reader.load_raw_arrays(
+            fields,
+            self.minutes[0],
+            self.minutes[-1],
+            sids,
+        )
+        for field, e, a in zip(fields, expected, actual):
+            assert_array_equal(a, e, err_msg=field)
+
+        for asset in self.asset_finder.retrieve_all(sids):
+            assert_equal(
+                reader.get_last_traded_dt(asset, self.minutes[-1]),
+                self.bcolz_reader.get_last_traded_dt(asset, self.minutes[-1]),
+            )
+        assert_equal(
+            reader.first_trading_day,
+            self.bcolz_reader.first_trading_day,
+        )
@@ -16,11 +16,16 @@ from numbers import Real
 
 from nose_parameterized import parameterized
 from numpy.testing import assert_almost_equal
-from numpy import nan, array, full, isnan
+from numpy import nan, array, full, isnan, savez
 import pandas as pd
 from pandas import DataFrame
 from six import iteritems
 
+from zipline.data.minute_bars import (
+    BcolzMinuteBarReader,
+    BcolzMinuteBarWriter,
+    FUTURES_MINUTES_PER_DAY,
+)
 from zipline.data.resample import (
     minute_frame_to_session_frame,
     DailyHistoryAggregator,
@@ -29,7 +34,7 @@ from zipline.data.resample import (
     ReindexSessionBarReader,
 )
 
-from zipline.testing import parameter_space
+from zipline.testing import parameter_space, tmp_dir
 from zipline.testing.fixtures import (
     WithEquityMinuteBarData,
     WithBcolzEquityMinuteBarReader,
@@ -618,6 +623,147 @@ class TestResampleSessionBars(WithBcolzFutureMinuteBarReader,
                     result[i],
                     err_msg="sid={0} field={1}".format(sid, field))
 
+    @parameter_space(sessions_per_cache_block=[1, 2, 21])
+    def test_resample_cached(self, sessions_per_cache_block):
+        cache_dir = self.enter_instance_context(tmp_dir()).getpath('cache')
+        reader = MinuteResampleSessionBarReader(
+            self.trading_calendar,
+            self.bcolz_future_minute_bar_reader,
+            cache_dir=cache_dir,
+            sessions_per_cache_block=sessions_per_cache_block,
+        )
+        sids = list(self.ASSET_FINDER_FUTURE_SIDS)
+        windows = [
+            (self.START_DATE, self.START_DATE, sids[:2]),
+            (self.START_DATE, self.END_DATE, sids[::-1]),
+            (self.END_DATE, self.END_DATE, sids[1:]),
+        ]
+        for start, end, window_sids in windows:
+            expected = self.session_bar_reader._get_resampled(
+                OHLCV, start, end, window_sids,
+            )
+            result = reader.load_raw_arrays(OHLCV, start, end, window_sids)
+            for field, e, r in zip(OHLCV, expected, result):
+                self.assertEqual(e.dtype, r.dtype)
+                assert_almost_equal(r, e, err_msg=field)
+
+        # A new reader reads the bars from the cache.
+        def fail(*args, **kwargs):
+            raise AssertionError('bars were resampled again')
+
+        cached_reader = MinuteResampleSessionBarReader(
+            self.trading_calendar,
+            self.bcolz_future_minute_bar_reader,
+            cache_dir=cache_dir,
+            sessions_per_cache_block=sessions_per_cache_block,
+        )
+        cached_reader._get_resampled = fail
+        expected = reader.load_raw_arrays(
+            OHLCV, self.START_DATE, self.END_DATE, sids,
+        )
+        result = cached_reader.load_raw_arrays(
+            OHLCV, self.START_DATE, self.END_DATE, sids,
+        )
+        for field, e, r in zip(OHLCV, expected, result):
+            assert_almost_equal(r, e, err_msg=field)
+
+    def test_resample_cache_short_block(self):
+        """A cached block written before the minute data was extended is
+        resampled again.
+        """
+        cache_dir = self.enter_instance_context(tmp_dir()).getpath('cache')
+        reader = MinuteResampleSessionBarReader(
+            self.trading_calendar,
+            self.bcolz_future_minute_bar_reader,
+            cache_dir=cache_dir,
+        )
+        sid = self.ASSET_FINDER_FUTURE_SIDS[0]
+        expected = reader.load_raw_arrays(
+            OHLCV, self.START_DATE, self.END_DATE, [sid],
+        )
+
+        # Only keep the first session in the cached block.
+        savez(
+            reader._block_path(0),
+            sid=array([sid]),
+            **{field: values[:1] for field, values in zip(OHLCV, expected)}
+        )
+        reader = MinuteResampleSessionBarReader(
+            self.trading_calendar,
+            self.bcolz_future_minute_bar_reader,
+            cache_dir=cache_dir,
+        )
+        result = reader.load_raw_arrays(
+            OHLCV, self.START_DATE, self.END_DATE, [sid],
+        )
+        for field, e, r in zip(OHLCV, expected, result):
+            assert_almost_equal(r, e, err_msg=field)
+
+    def test_resample_blocks_in_memory(self):
+        reader = MinuteResampleSessionBarReader(
+            self.trading_calendar,
+            self.bcolz_future_minute_bar_reader,
+            sessions_per_cache_block=1,
+            blocks_in_memory=1,
+        )
+        sids = list(self.ASSET_FINDER_FUTURE_SIDS)
+        expected = self.session_bar_reader._get_resampled(
+            OHLCV, self.START_DATE, self.END_DATE, sids,
+        )
+        result = reader.load_raw_arrays(
+            OHLCV, self.START_DATE, self.END_DATE, sids,
+        )
+        for field, e, r in zip(OHLCV, expected, result):
+            assert_almost_equal(r, e, err_msg=field)
+        self.assertEqual(len(reader._blocks), 1)
+
+    def test_resample_cache_cleared_on_rewrite(self):
+        """The cache is cleared when the minute bars are written again."""
+        tmp = self.enter_instance_context(tmp_dir())
+        rootdir = tmp.makedir('minute_bars')
+        cache_dir = tmp.getpath('cache')
+        calendar = self.trading_calendar
+        sid = 1
+
+        def bars(session, price):
+            minutes = calendar.minutes_for_session(session)
+            return DataFrame(
+                {
+                    'open': price,
+                    'high': price,
+                    'low': price,
+                    'close': price,
+                    'volume': 100,
+                },
+                index=minutes,
+            )
+
+        BcolzMinuteBarWriter(
+            rootdir,
+            calendar,
+            self.START_DATE,
+            self.END_DATE,
+            FUTURES_MINUTES_PER_DAY,
+        ).write_sid(sid, bars(self.START_DATE, 10.0))
+
+        def closes():
+            reader = MinuteResampleSessionBarReader(
+                calendar,
+                BcolzMinuteBarReader(rootdir),
+                cache_dir=cache_dir,
+            )
+            return reader.load_raw_arrays(
+                ['close'], self.START_DATE, self.END_DATE, [sid],
+            )[0][:, 0]
+
+        assert_almost_equal(closes(), [10.0, nan])
+
+        # Append the next session without rewriting the metadata.
+        BcolzMinuteBarWriter.open(rootdir).write_sid(
+            sid, bars(self.END_DATE, 20.0),
+        )
+        assert_almost_equal(closes(), [10.0, 20.0])
+
     def test_sessions(self):
         sessions = self.session_bar_reader.sessions
 
@@ -12,6 +12,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from functools import partial
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
 from sys import maxsize
 import re
 
@@ -44,7 +47,7 @@ from zipline.pipeline.loaders.synthetic import (
     expected_bar_values_2d,
     make_bar_data,
 )
-from zipline.testing import seconds_to_timestamp
+from zipline.testing import parameter_space, seconds_to_timestamp
 from zipline.testing.fixtures import (
     WithAssetFinder,
     WithBcolzEquityDailyBarReader,
@@ -53,6 +56,7 @@ from zipline.testing.fixtures import (
     ZiplineTestCase,
 )
 from zipline.utils.calendars import get_calendar
+from zipline.utils.pool import SequentialPool
 
 TEST_CALENDAR_START = Timestamp('2015-06-01', tz='UTC')
 TEST_CALENDAR_STOP = Timestamp('2015-06-30', tz='UTC')
@@ -409,3 +413,51 @@ class BcolzDailyBarWriterMissingDataTestCase(WithAssetFinder,
         )
         with self.assertRaisesRegexp(AssertionError, expected_msg):
             writer.write(bar_data)
+
+
+class BcolzDailyBarWriterPoolTestCase(WithAssetFinder,
+                                      WithTmpDir,
+                                      WithTradingCalendars,
+                                      ZiplineTestCase):
+
+    @classmethod
+    def make_equity_info(cls):
+        return EQUITY_INFO
+
+    @parameter_space(pool_type=['sequential', 'thread', 'process'])
+    def test_write_with_pool(self, pool_type):
+        sessions = self.trading_calendar.sessions_in_range(
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+        )
+
+        def write(name, pool):
+            writer = BcolzDailyBarWriter(
+                # Subtests share the tmpdir, so write to a new path.
+                self.tmpdir.getpath('%s_%s' % (name, pool_type)),
+                self.trading_calendar,
+                sessions[0],
+                sessions[-1],
+                pool=pool,
+            )
+            return writer.write(
+                # Deferred frames are called on the pool.
+                (sid, partial(DataFrame, df) if sid % 2 else df)
+                for sid, df in make_bar_data(EQUITY_INFO, sessions)
+            )
+
+        pool = {
+            'sequential': SequentialPool,
+            'thread': partial(ThreadPool, 3),
+            'process': partial(Pool, 3),
+        }[pool_type]()
+        try:
+            result = write('pool', pool)
+        finally:
+            if pool_type != 'sequential':
+                pool.terminate()
+        expected = write('serial', None)
+
+        assert_array_equal(result[:], expected[:])
+        for attr in 'first_row', 'last_row', 'calendar_offset':
+            self.assertEqual(result.attrs[attr], expected.attrs[attr])
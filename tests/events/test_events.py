@@ -13,12 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import datetime
+from functools import partial
 from inspect import isabstract
+from itertools import product
 import random
 from unittest import TestCase
 import warnings
 
 from nose_parameterized import parameterized
+from numpy.testing import assert_array_equal
 import pandas as pd
 from six import iteritems
 from six.moves import range, map
@@ -48,7 +51,10 @@ from zipline.utils.events import (
     MAX_MONTH_RANGE,
     MAX_WEEK_RANGE,
     TradingDayOfMonthRule,
-    TradingDayOfWeekRule
+    TradingDayOfWeekRule,
+    date_rules,
+    make_eventrule,
+    time_rules,
 )
 
 
@@ -170,6 +176,116 @@ class TestEventManager(TestCase):
 
         self.assertEqual(CountingRule.count, 5)
 
+    def test_compile_always(self):
+        cal = get_calendar('NYSE')
+        minutes = cal.minutes_for_session(pd.Timestamp('2014-09-22', tz='UTC'))
+        calls = []
+
+        def make_event(name, rule):
+            rule.cal = cal
+            return Event(rule, lambda context, data: calls.append(name))
+
+        self.em.add_event(make_event('open', AfterOpen(minutes=1)))
+        self.em.add_event(make_event('every', Always()))
+        self.em.add_event(make_event('close', BeforeClose(minutes=1)))
+        self.em.compile(minutes)
+
+        # Events which trigger every minute are not expanded into the
+        # schedule.
+        self.assertEqual(len(self.em._trigger_times), 2)
+
+        for dt in minutes:
+            del calls[:]
+            self.em.handle_data(None, None, dt)
+            if dt == minutes[0]:
+                self.assertEqual(calls, ['open', 'every'])
+            elif dt == minutes[-2]:
+                self.assertEqual(calls, ['every', 'close'])
+            else:
+                self.assertEqual(calls, ['every'])
+
+    def test_next_trigger(self):
+        cal = get_calendar('NYSE')
+        minutes = cal.minutes_for_session(pd.Timestamp('2014-09-22', tz='UTC'))
+        calls = []
+
+        class EveryTenMinutes(StatelessRule):
+            def should_trigger(self, dt):
+                calls.append(dt)
+                return minutes.get_loc(dt) % 10 == 9
+
+        class CountingNever(StatelessRule):
+            def should_trigger(self, dt):
+                calls.append(dt)
+                return False
+
+        ignored = Event(Always())
+        self.em.add_event(ignored)
+        self.em.add_event(Event(CountingNever()))
+        self.em.add_event(Event(EveryTenMinutes()))
+        close = BeforeClose(minutes=5)
+        close.cal = cal
+        self.em.add_event(Event(close))
+
+        triggers = []
+        ix = self.em.next_trigger(minutes, ignore=(ignored,))
+        while ix < len(minutes):
+            triggers.append(ix)
+            ix += 1 + self.em.next_trigger(minutes[ix + 1:], ignore=(ignored,))
+
+        self.assertEqual(
+            triggers,
+            sorted(set(range(9, 390, 10)) | {384}),
+        )
+        # The rules are only checked a few minutes past each trigger, not
+        # over the rest of the session every time.
+        self.assertLess(len(calls), 4 * len(minutes))
+
+        self.assertEqual(self.em.next_trigger(minutes), 0)
+
+    def test_compile(self):
+        cal = get_calendar('NYSE')
+        minutes = cal.minutes_for_sessions_in_range(
+            pd.Timestamp('2014-09-22', tz='UTC'),
+            pd.Timestamp('2014-09-23', tz='UTC'),
+        )
+        calls = []
+
+        def make_event(name, rule):
+            rule.cal = cal
+            return Event(rule, lambda context, data: calls.append(name))
+
+        class CountingRule(StatelessRule):
+            count = 0
+
+            def should_trigger(self, dt):
+                CountingRule.count += 1
+                return dt == minutes[5]
+
+        self.em.add_event(make_event('close', BeforeClose(minutes=384)))
+        self.em.add_event(make_event('open', AfterOpen(minutes=6)))
+        self.em.add_event(make_event('counting', CountingRule()))
+        self.em.add_event(make_event('every', Always()), prepend=True)
+        self.em.compile(minutes)
+
+        # Added after compiling, so it checks its rule every minute.
+        self.em.add_event(make_event('late', Always()))
+
+        for dt in minutes:
+            del calls[:]
+            self.em.handle_data(None, None, dt)
+            if dt == minutes[5]:
+                self.assertEqual(
+                    calls,
+                    ['every', 'close', 'open', 'counting', 'late'],
+                )
+            elif dt == minutes[390 + 5]:
+                self.assertEqual(calls, ['every', 'close', 'open', 'late'])
+            else:
+                self.assertEqual(calls, ['every', 'late'])
+
+        self.assertEqual(CountingRule.count, len(minutes))
+
 
 class TestEventRule(TestCase):
     def test_is_abstract(self):
@@ -472,6 +588,37 @@ class StatelessRulesTests(RuleTestCase):
         with self.assertRaises(ValueError):
             NthTradingDayOfMonth(24)
 
+    def test_may_trigger(self):
+        # Include the half days of 2014, if the calendar has any.
+        half_sessions = self.cal.early_closes[
+            self.cal.early_closes.year == 2014
+        ]
+        minutes = self.sept_week.union_many(
+            [self.cal.minutes_for_session(s) for s in half_sessions],
+        )
+
+        rules = [
+            Always(),
+            Never(),
+            AfterOpen(minutes=1),
+            AfterOpen(hours=1, minutes=5),
+            BeforeClose(minutes=1),
+            BeforeClose(hours=1, minutes=5),
+            NotHalfDay(),
+            NthTradingDayOfWeek(1),
+            NDaysBeforeLastTradingDayOfWeek(0),
+            NthTradingDayOfMonth(16),
+            NDaysBeforeLastTradingDayOfMonth(3),
+            AfterOpen(minutes=30) & NotHalfDay(),
+        ]
+        for rule in rules:
+            rule.cal = self.cal
+            if isinstance(rule, ComposedRule):
+                rule.first.cal = rule.second.cal = self.cal
+
+            expected = [bool(rule.should_trigger(m)) for m in minutes]
+            assert_array_equal(rule.may_trigger(minutes), expected)
+
 
 class StatefulRulesTests(RuleTestCase):
     CALENDAR_STRING = "NYSE"
@@ -504,3 +651,121 @@ class StatefulRulesTests(RuleTestCase):
                 rule.should_trigger(minute)
 
             self.assertEqual(rule.count, 1)
+
+    def test_OncePerDay_skip(self):
+        minutes = self.cal.minutes_for_sessions_in_range(
+            pd.Timestamp('2014-09-22', tz='UTC'),
+            pd.Timestamp('2014-09-26', tz='UTC'),
+        )
+
+        def make_rule():
+            after_open = AfterOpen(minutes=30)
+            after_open.cal = self.cal
+            return OncePerDay(after_open)
+
+        expected_rule = make_rule()
+        expected = [m for m in minutes if expected_rule.should_trigger(m)]
+
+        # Only call ``should_trigger`` at the minutes at which the rule may
+        # trigger, skipping over the others.
+        rule = make_rule()
+        triggered = []
+        ix = 0
+        while ix < len(minutes):
+            (candidates,) = rule.may_trigger(minutes[ix:]).nonzero()
+            if not len(candidates):
+                rule.skip(minutes[ix:])
+                break
+            rule.skip(minutes[ix:ix + candidates[0]])
+            ix += candidates[0]
+            if rule.should_trigger(minutes[ix]):
+                triggered.append(minutes[ix])
+            ix += 1
+
+        self.assertEqual(triggered, expected)
+        self.assertEqual(len(triggered), 5)
+        self.assertEqual(rule.date, expected_rule.date)
+        self.assertEqual(rule.next_date, expected_rule.next_date)
+        self.assertEqual(rule.triggered, expected_rule.triggered)
+
+    def test_compile_sparse_minutes(self):
+        sessions = self.cal.sessions_in_range(
+            pd.Timestamp('2013-11-25', tz='UTC'),
+            pd.Timestamp('2014-01-31', tz='UTC'),
+        )
+        # The minutes of a daily simulation are the session closes.
+        daily_minutes = pd.to_datetime(
+            self.cal.execution_time_from_close(
+                self.cal.schedule.market_close.loc[sessions],
+            ).values,
+            utc=True,
+        )
+        # Includes a half day for NYSE.
+        minutes = self.cal.minutes_for_sessions_in_range(
+            pd.Timestamp('2013-11-26', tz='UTC'),
+            pd.Timestamp('2013-12-03', tz='UTC'),
+        )
+
+        date_rule_factories = [
+            date_rules.every_day,
+            date_rules.month_start,
+            date_rules.week_end,
+            partial(date_rules.week_start, 1),
+            partial(date_rules.month_end, 2),
+        ]
+        cases = [
+            (daily_minutes, time_rules.every_minute),
+            # Triggers at the close of full and half days, respectively.
+            (minutes, partial(time_rules.market_open, hours=6, minutes=31)),
+            (minutes, partial(time_rules.market_open, hours=3, minutes=31)),
+        ]
+        for (minutes, time_rule), date_rule, half_days in product(
+                cases, date_rule_factories, (True, False)):
+
+            def make_rule():
+                return make_eventrule(
+                    date_rule(), time_rule(), self.cal, half_days,
+                )
+
+            expected_rule = make_rule()
+            expected = [
+                m.value for m in minutes if expected_rule.should_trigger(m)
+            ]
+            assert_array_equal(make_rule().compile(minutes), expected)
+
+    def test_compile(self):
+        # Includes a half day for NYSE and a holiday.
+        minutes = self.cal.minutes_for_sessions_in_range(
+            pd.Timestamp('2014-06-30', tz='UTC'),
+            pd.Timestamp('2014-07-08', tz='UTC'),
+        )
+        date_rule_factories = [
+            date_rules.every_day,
+            partial(date_rules.week_start, 1),
+            partial(date_rules.month_end, 1),
+        ]
+        time_rule_factories = [
+            partial(time_rules.market_open, minutes=30),
+            partial(time_rules.market_close, hours=1),
+            time_rules.every_minute,
+        ]
+        for date_rule, time_rule, half_days in product(
+                date_rule_factories, time_rule_factories, (True, False)):
+
+            def make_rule():
+                return make_eventrule(
+                    date_rule(), time_rule(), self.cal, half_days,
+                )
+
+            expected_rule = make_rule()
+            expected = [
+                m.value for m in minutes if expected_rule.should_trigger(m)
+            ]
+            assert_array_equal(make_rule().compile(minutes), expected)
+
+        class Custom(StatefulRule):
+            def should_trigger(self, dt):
+                return True
+
+        self.assertIsNone(Custom().compile(minutes))
+        self.assertIsNone(OncePerDay(Custom()).compile(minutes))
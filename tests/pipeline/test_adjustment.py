@@ -1,8 +1,12 @@
 """
 Tests for zipline.lib.adjustment
 """
+from pickle import dumps, loads
 from unittest import TestCase
+
 from nose_parameterized import parameterized
+from numpy import array, asarray
+from numpy.testing import assert_equal
 
 from zipline.lib import adjustment as adj
 from zipline.utils.numpy_utils import make_datetime64ns
@@ -100,3 +104,40 @@ class AdjustmentTestCase(TestCase):
             "%r." % SomeClass
         )
         self.assertEqual(str(exc), expected_msg)
+
+    @parameterized.expand([
+        ('float', adj.Float64Multiply, 0.5),
+        ('int', adj.Int64Overwrite, 1),
+        ('datetime', adj.Datetime64Overwrite, make_datetime64ns(0)),
+        ('object', adj.ObjectOverwrite, 'some text'),
+    ])
+    def test_pickle(self, name, type_, value):
+        adjustment = type_(
+            first_row=1,
+            last_row=2,
+            first_col=3,
+            last_col=4,
+            value=value,
+        )
+        self.assertEqual(loads(dumps(adjustment)), adjustment)
+
+    def test_pickle_array_adjustment(self):
+        values = array([make_datetime64ns(0), make_datetime64ns(1)])
+        adjustment = adj.Datetime641DArrayOverwrite(
+            first_row=1,
+            last_row=2,
+            first_col=3,
+            last_col=4,
+            values=values,
+        )
+        result = loads(dumps(adjustment))
+        self.assertIs(type(result), adj.Datetime641DArrayOverwrite)
+        self.assertEqual(
+            (result.first_row, result.last_row),
+            (adjustment.first_row, adjustment.last_row),
+        )
+        self.assertEqual(
+            (result.first_col, result.last_col),
+            (adjustment.first_col, adjustment.last_col),
+        )
+        assert_equal(asarray(result.values), asarray(adjustment.values))
@@ -0,0 +1,240 @@
+"""
+Tests for zipline.pipeline.loaders.caching.
+"""
+import os
+
+from numpy import arange, float64, full
+from pandas import DataFrame, Int64Index, Timestamp
+
+from zipline.lib.adjusted_array import AdjustedArray, NOMASK
+from zipline.lib.adjustment import MULTIPLY
+from zipline.lib.labelarray import LabelArray
+from zipline.pipeline import Pipeline
+from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.data.testing import TestingDataSet
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.factors import SimpleMovingAverage
+from zipline.pipeline.loaders.caching import (
+    CachingLoader,
+    DiskTermCache,
+    InMemoryTermCache,
+)
+from zipline.pipeline.loaders.frame import DataFrameLoader
+from zipline.testing import ExplodingObject, parameter_space
+from zipline.testing.fixtures import (
+    WithInstanceTmpDir,
+    WithSeededRandomPipelineEngine,
+    ZiplineTestCase,
+)
+from zipline.testing.predicates import assert_equal
+
+
+class RecordingLoader(object):
+    """A loader that records the columns it was asked to load.
+    """
+    def __init__(self, loader):
+        self.loader = loader
+        self.loaded = []
+
+    def load_adjusted_array(self, columns, dates, assets, mask):
+        self.loaded.extend(columns)
+        return self.loader.load_adjusted_array(columns, dates, assets, mask)
+
+
+class CachingLoaderTestCase(WithSeededRandomPipelineEngine,
+                            WithInstanceTmpDir,
+                            ZiplineTestCase):
+
+    def make_cache(self, kind):
+        if kind == 'memory':
+            return InMemoryTermCache()
+        return DiskTermCache(self.instance_tmpdir.getpath('cache'))
+
+    def make_engine(self, loader):
+        return SimplePipelineEngine(
+            get_loader=lambda column: loader,
+            calendar=self.trading_days,
+            asset_finder=self.asset_finder,
+        )
+
+    def make_pipeline(self):
+        return Pipeline({
+            'float': TestingDataSet.float_col.latest,
+            'sma': SimpleMovingAverage(
+                inputs=[TestingDataSet.float_col],
+                window_length=5,
+            ),
+            'bool': TestingDataSet.bool_col.latest,
+            'datetime': TestingDataSet.datetime_col.latest,
+            'categorical': TestingDataSet.categorical_col.latest,
+        })
+
+    @parameter_space(kind=['memory', 'disk'])
+    def test_cached_pipeline(self, kind):
+        dates = self.trading_days[-20:]
+        start_date, end_date = dates[[-10, -1]]
+        pipe = self.make_pipeline()
+        expected = self.run_pipeline(pipe, start_date, end_date)
+
+        recorder = RecordingLoader(self.seeded_random_loader)
+        cache = self.make_cache(kind)
+        engine = self.make_engine(CachingLoader(recorder, cache))
+
+        assert_equal(engine.run_pipeline(pipe, start_date, end_date), expected)
+        self.assertEqual(
+            set(recorder.loaded),
+            {
+                TestingDataSet.float_col,
+                TestingDataSet.bool_col,
+                TestingDataSet.datetime_col,
+                TestingDataSet.categorical_col,
+            },
+        )
+
+        # The second run should be served entirely from the cache.
+        del recorder.loaded[:]
+        assert_equal(engine.run_pipeline(pipe, start_date, end_date), expected)
+        self.assertEqual(recorder.loaded, [])
+
+        # A different date range is a different key.
+        start_date = dates[-11]
+        engine.run_pipeline(pipe, start_date, end_date)
+        self.assertTrue(recorder.loaded)
+
+    def test_disk_cache_persists(self):
+        dates = self.trading_days[-20:]
+        start_date, end_date = dates[[-10, -1]]
+        pipe = self.make_pipeline()
+        expected = self.run_pipeline(pipe, start_date, end_date)
+
+        path = self.instance_tmpdir.getpath('cache')
+        self.make_engine(
+            CachingLoader(self.seeded_random_loader, DiskTermCache(path)),
+        ).run_pipeline(pipe, start_date, end_date)
+
+        # A fresh cache on the same path must not touch the loader.
+        engine = self.make_engine(
+            CachingLoader(ExplodingObject(), DiskTermCache(path)),
+        )
+        assert_equal(engine.run_pipeline(pipe, start_date, end_date), expected)
+
+    def test_version(self):
+        dates = self.trading_days[-20:]
+        start_date, end_date = dates[[-10, -1]]
+        pipe = Pipeline({'float': TestingDataSet.float_col.latest})
+
+        cache = InMemoryTermCache()
+        recorder = RecordingLoader(self.seeded_random_loader)
+        self.make_engine(
+            CachingLoader(recorder, cache, version='a'),
+        ).run_pipeline(pipe, start_date, end_date)
+        self.make_engine(
+            CachingLoader(recorder, cache, version='b'),
+        ).run_pipeline(pipe, start_date, end_date)
+
+        self.assertEqual(
+            recorder.loaded,
+            [TestingDataSet.float_col, TestingDataSet.float_col],
+        )
+        self.assertEqual(len(cache), 2)
+
+    @parameter_space(kind=['memory', 'disk'])
+    def test_adjustments_round_trip(self, kind):
+        dates = self.trading_days[-10:]
+        assets = Int64Index(self.asset_finder.sids)
+        baseline = DataFrame(
+            arange(len(dates) * len(assets), dtype=float).reshape(
+                len(dates),
+                len(assets),
+            ),
+            index=dates,
+            columns=assets,
+        )
+        adjustments = DataFrame({
+            'sid': [assets[0], assets[1]],
+            'value': [0.5, 2.0],
+            'kind': [MULTIPLY, MULTIPLY],
+            'start_date': [Timestamp('NaT'), Timestamp('NaT')],
+            'end_date': [dates[3], dates[6]],
+            'apply_date': [dates[4], dates[7]],
+        })
+        loader = DataFrameLoader(
+            USEquityPricing.close,
+            baseline,
+            adjustments,
+        )
+        mask = full(baseline.shape, True, dtype=bool)
+        column = USEquityPricing.close
+
+        cache = self.make_cache(kind)
+        expected = loader.load_adjusted_array([column], dates, assets, mask)
+        CachingLoader(loader, cache).load_adjusted_array(
+            [column], dates, assets, mask,
+        )
+        result = CachingLoader(ExplodingObject(), cache).load_adjusted_array(
+            [column], dates, assets, mask,
+        )
+
+        assert_equal(
+            list(result[column].traverse(3)),
+            list(expected[column].traverse(3)),
+        )
+
+    def test_disk_label_array(self):
+        data = LabelArray(
+            [['a', 'b'], ['c', None]],
+            missing_value=None,
+        )
+        cache = DiskTermCache(self.instance_tmpdir.getpath('cache'))
+        cache['key'] = AdjustedArray(data, NOMASK, {}, None)
+
+        result = cache['key'].data
+        self.assertIsInstance(result, LabelArray)
+        assert_equal(result.as_string_array(), data.as_string_array())
+
+    def test_memory_eviction(self):
+        # Each entry holds 80 bytes of baseline data.
+        def entry(value):
+            return AdjustedArray(
+                full((2, 5), value, dtype=float64), NOMASK, {}, 0.0,
+            )
+
+        cache = InMemoryTermCache(max_bytes=200)
+        cache['a'] = entry(1)
+        cache['b'] = entry(2)
+        # Reading 'a' makes 'b' the least recently used entry.
+        cache['a']
+        cache['c'] = entry(3)
+
+        self.assertEqual(sorted(cache), ['a', 'c'])
+        self.assertEqual(cache.nbytes, 160)
+
+        # Entries larger than the cache are never stored.
+        cache['d'] = AdjustedArray(
+            full((6, 5), 4.0), NOMASK, {}, 0.0,
+        )
+        self.assertNotIn('d', cache)
+        self.assertEqual(sorted(cache), ['a', 'c'])
+
+    def test_disk_eviction(self):
+        def entry(value):
+            return AdjustedArray(
+                full((2, 5), value, dtype=float64), NOMASK, {}, 0.0,
+            )
+
+        cache = DiskTermCache(self.instance_tmpdir.getpath('cache'))
+        cache['a'] = entry(1)
+        cache['b'] = entry(2)
+        entry_size = os.path.getsize(cache._keypath('a', '.npy'))
+
+        # Make 'b' older than 'a' so that it is evicted first.
+        os.utime(cache._keypath('a', '.npy'), (2, 2))
+        os.utime(cache._keypath('b', '.npy'), (1, 1))
+
+        cache.max_bytes = 2 * entry_size
+        cache['c'] = entry(3)
+
+        self.assertEqual(list(cache), ['a', 'c'])
+        assert_equal(cache['c'].data, entry(3).data)
+        with self.assertRaises(KeyError):
+            cache['b']
@@ -4,6 +4,7 @@ Tests for SimplePipelineEngine
 from __future__ import division
 from collections import OrderedDict
 from itertools import product
+from multiprocessing.pool import ThreadPool
 from operator import add, sub
 
 from nose_parameterized import parameterized
@@ -1377,6 +1378,139 @@ class WindowSafetyPropagationTestCase(WithSeededRandomPipelineEngine,
             assert_equal(expected_result, results[colname])
 
 
+class ConcurrentComputeTestCase(WithSeededRandomPipelineEngine,
+                                ZiplineTestCase):
+
+    def init_instance_fixtures(self):
+        super(ConcurrentComputeTestCase, self).init_instance_fixtures()
+        self.pool = pool = ThreadPool(4)
+        self.add_instance_callback(pool.terminate)
+
+        loader = self.seeded_random_loader
+        self.concurrent_engine = SimplePipelineEngine(
+            get_loader=lambda column: loader,
+            calendar=self.trading_days,
+            asset_finder=self.asset_finder,
+            pool=pool,
+        )
+
+    def test_matches_serial_engine(self):
+        dates = self.trading_days[-30:]
+        start_date, end_date = dates[[-10, -1]]
+
+        float_col = TestingDataSet.float_col
+        rank = float_col.latest.rank()
+        pipe = Pipeline(
+            columns={
+                'sma': SimpleMovingAverage(
+                    inputs=[float_col],
+                    window_length=10,
+                ),
+                'rank': rank,
+                'average_of_rank': SimpleMovingAverage(
+                    inputs=[rank],
+                    window_length=5,
+                ),
+                'zscore': float_col.latest.zscore(),
+                'bool': TestingDataSet.bool_col.latest,
+                'categorical': TestingDataSet.categorical_col.latest,
+            },
+            screen=float_col.latest > 0,
+        )
+
+        expected = self.run_pipeline(pipe, start_date, end_date)
+        result = self.concurrent_engine.run_pipeline(
+            pipe,
+            start_date,
+            end_date,
+        )
+        assert_equal(result, expected)
+
+    def test_errors_are_reraised(self):
+        dates = self.trading_days[-30:]
+        start_date, end_date = dates[[-10, -1]]
+
+        class SomeError(Exception):
+            pass
+
+        class Explodes(CustomFactor):
+            inputs = [TestingDataSet.float_col]
+            window_length = 3
+
+            def compute(self, today, assets, out, values):
+                raise SomeError()
+
+        pipe = Pipeline(
+            columns={
+                'explodes': Explodes(),
+                'latest': TestingDataSet.float_col.latest,
+            },
+        )
+        with self.assertRaises(SomeError):
+            self.concurrent_engine.run_pipeline(pipe, start_date, end_date)
+
+
+class MultiplePipelinesTestCase(WithSeededRandomPipelineEngine,
+                                ZiplineTestCase):
+
+    def test_matches_individual_pipelines(self):
+        dates = self.trading_days[-30:]
+        start_date, end_date = dates[[-10, -1]]
+
+        computed_dates = []
+
+        class Recording(CustomFactor):
+            inputs = [TestingDataSet.float_col]
+            window_length = 3
+
+            def compute(self, today, assets, out, values):
+                computed_dates.append(today)
+                out[:] = values.sum(axis=0)
+
+        float_col = TestingDataSet.float_col
+        shared = Recording()
+        pipelines = {
+            'a': Pipeline(
+                columns={
+                    'shared': shared,
+                    'sma': SimpleMovingAverage(
+                        inputs=[float_col],
+                        window_length=10,
+                    ),
+                    'categorical': TestingDataSet.categorical_col.latest,
+                },
+                screen=float_col.latest > 0,
+            ),
+            'b': Pipeline(
+                columns={
+                    'shared': shared,
+                    'shared_rank': shared.rank(),
+                    'bool': TestingDataSet.bool_col.latest,
+                },
+            ),
+            'c': Pipeline(),
+        }
+
+        expected = {
+            name: self.run_pipeline(pipe, start_date, end_date)
+            for name, pipe in iteritems(pipelines)
+        }
+        del computed_dates[:]
+
+        result = self.seeded_random_engine.run_multiple_pipelines(
+            pipelines,
+            start_date,
+            end_date,
+        )
+        assert_equal(result, expected)
+
+        # The shared term should have been computed once for each day.
+        self.assertEqual(
+            computed_dates,
+            list(dates[-10:]),
+        )
+
+
 class PopulateInitialWorkspaceTestCase(WithConstantInputs, ZiplineTestCase):
 
     @parameter_space(window_length=[3, 5], pipeline_length=[5, 10])
@@ -1531,3 +1665,72 @@ class ChunkedPipelineTestCase(WithEquityPricingPipelineEngine,
             chunksize=22
         )
         self.assertTrue(chunked_result.equals(pipeline_result))
+
+    def test_run_chunked_pipeline_concurrently(self):
+        """
+        Test that computing chunks concurrently produces the same result as
+        computing them one after another.
+        """
+        pipe = Pipeline(
+            columns={
+                'close': USEquityPricing.close.latest,
+                'returns': Returns(window_length=2),
+                'categorical': USEquityPricing.close.latest.quantiles(5)
+            },
+        )
+        serial_result = self.pipeline_engine.run_chunked_pipeline(
+            pipeline=pipe,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+            chunksize=22,
+        )
+        concurrent_result = self.pipeline_engine.run_chunked_pipeline(
+            pipeline=pipe,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+            chunksize=22,
+            max_workers=3,
+        )
+        self.assertTrue(concurrent_result.equals(serial_result))
+
+    def test_iter_pipeline_chunks(self):
+        """
+        Test that iterating over the chunks of a pipeline yields one frame per
+        chunk, and that together they match the result of running the whole
+        pipeline at once.
+        """
+        pipe = Pipeline(
+            columns={
+                'close': USEquityPricing.close.latest,
+                'returns': Returns(window_length=2),
+            },
+        )
+        pipeline_result = self.pipeline_engine.run_pipeline(
+            pipe,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+        )
+        chunks = self.pipeline_engine.iter_pipeline_chunks(
+            pipeline=pipe,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+            chunksize=22,
+        )
+        self.assertNotIsInstance(chunks, list)
+
+        chunks = list(chunks)
+        dates = self.nyse_sessions.slice_indexer(
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+        )
+        self.assertEqual(
+            len(chunks),
+            -(-len(self.nyse_sessions[dates]) // 22),
+        )
+        for chunk in chunks:
+            chunk_dates = chunk.index.levels[0]
+            self.assertLessEqual(len(chunk_dates), 22)
+            assert_equal(
+                chunk,
+                pipeline_result.loc[chunk_dates[0]:chunk_dates[-1]],
+            )
@@ -2,12 +2,19 @@
 Tests for statistical pipeline terms.
 """
 from numpy import (
+    apply_along_axis,
     arange,
+    array,
+    broadcast_arrays,
+    errstate,
     full,
     full_like,
+    isnan,
     nan,
     where,
 )
+from numpy.random import RandomState
+from numpy.testing import assert_allclose
 from pandas import (
     DataFrame,
     date_range,
@@ -15,7 +22,7 @@ from pandas import (
     Timestamp,
 )
 from pandas.util.testing import assert_frame_equal
-from scipy.stats import linregress, pearsonr, spearmanr
+from scipy.stats import linregress, pearsonr, rankdata, spearmanr
 
 from zipline.assets import Equity
 from zipline.errors import IncompatibleTerms, NonExistentAssetInTimeFrame
@@ -29,6 +36,12 @@ from zipline.pipeline.factors import (
     RollingPearsonOfReturns,
     RollingSpearmanOfReturns,
 )
+from zipline.pipeline.factors.statistical import (
+    _linear_regression,
+    _pearson_r,
+    _rankdata_columns,
+    _spearman_r,
+)
 from zipline.pipeline.loaders.frame import DataFrameLoader
 from zipline.pipeline.sentinels import NotSpecified
 from zipline.testing import (
@@ -802,3 +815,67 @@ class StatisticalMethodsTestCase(WithSeededRandomPipelineEngine,
                 columns=assets,
             )
             assert_frame_equal(output_result, expected_output_result)
+
+
+class VectorizedStatisticsTestCase(ZiplineTestCase):
+    """
+    Tests that the column-wise implementations used by the statistical
+    factors agree with their scipy counterparts.
+    """
+
+    def make_data(self, nrows):
+        rand = RandomState(5)
+        x = rand.randint(0, 4, size=(nrows, 8)).astype(float64_dtype)
+        y = rand.randn(nrows, 8)
+
+        # Constant columns.
+        x[:, 1] = 1.0
+        y[:, 2] = 2.0
+
+        # Columns with missing data.
+        x[0, 3] = nan
+        y[-1, 4] = nan
+        return x, y
+
+    @parameter_space(nrows=[2, 3, 10], broadcast_x=[True, False])
+    def test_matches_scipy(self, nrows, broadcast_x):
+        x, y = self.make_data(nrows)
+        if broadcast_x:
+            x = x[:, :1]
+        full_x = broadcast_arrays(x, y)[0]
+
+        pearson = _pearson_r(y, x)
+        spearman = _spearman_r(y, x)
+        regression = _linear_regression(y=y, x=x)
+
+        with errstate(divide='ignore', invalid='ignore'):
+            for i in range(y.shape[1]):
+                assert_allclose(pearson[i], pearsonr(y[:, i], full_x[:, i])[0])
+
+                if isnan(y[:, i]).any() or isnan(full_x[:, i]).any():
+                    self.assertTrue(isnan(spearman[i]))
+                else:
+                    assert_allclose(
+                        spearman[i],
+                        spearmanr(y[:, i], full_x[:, i])[0],
+                    )
+
+                slope, intercept, r_value, p_value, stderr = linregress(
+                    x=full_x[:, i], y=y[:, i],
+                )
+                assert_allclose(
+                    [output[i] for output in regression],
+                    [intercept, slope, r_value, p_value, stderr],
+                )
+
+    def test_rankdata_columns(self):
+        data = array(
+            [[1.0, 5.0, 2.0],
+             [3.0, 5.0, 2.0],
+             [1.0, 4.0, 2.0],
+             [2.0, 5.0, 2.0]]
+        )
+        check_arrays(
+            _rankdata_columns(data),
+            apply_along_axis(rankdata, 0, data),
+        )
@@ -45,6 +45,8 @@ from zipline.pipeline.loaders.synthetic import (
 from zipline.pipeline.loaders.equity_pricing_loader import (
     USEquityPricingLoader,
 )
+from zipline.data.adjustments_index import AdjustmentsIndex
+from zipline.data.us_equity_pricing import SQLiteAdjustmentReader
 
 from zipline.errors import WindowLengthTooLong
 from zipline.pipeline.data import USEquityPricing
@@ -52,6 +54,7 @@ from zipline.testing import (
     seconds_to_timestamp,
     str_to_seconds,
     MockDailyBarReader,
+    tmp_dir,
 )
 from zipline.testing.fixtures import (
     WithAdjustmentReader,
@@ -611,3 +614,56 @@ class USEquityPricingLoaderTestCase(WithAdjustmentReader,
             highs.traverse(windowlen + 1)
         with self.assertRaises(WindowLengthTooLong):
             volumes.traverse(windowlen + 1)
+
+
+class PreloadedUSEquityPricingLoaderTestCase(USEquityPricingLoaderTestCase):
+    ADJUSTMENT_READER_PRELOAD = True
+
+    def test_preloaded_matches_sqlite(self):
+        preloaded = self.adjustment_reader
+        reader = SQLiteAdjustmentReader(preloaded.conn)
+        # Include sids without any adjustments.
+        sids = list(range(8))
+
+        class asset_finder(object):
+            @staticmethod
+            def retrieve_asset(sid):
+                return sid
+
+        for table_name in 'splits', 'mergers', 'dividends':
+            for sid in sids:
+                self.assertEqual(
+                    preloaded.get_adjustments_for_sid(table_name, sid),
+                    sorted(reader.get_adjustments_for_sid(table_name, sid)),
+                )
+
+        for day in self.calendar_days_between(TEST_CALENDAR_START,
+                                              TEST_CALENDAR_STOP):
+            self.assertEqual(
+                sorted(preloaded.get_splits(sids, day)),
+                sorted(reader.get_splits(sids, day)),
+            )
+            self.assertEqual(
+                sorted(preloaded.get_dividends_with_ex_date(
+                    sids, day, asset_finder,
+                )),
+                sorted(reader.get_dividends_with_ex_date(
+                    sids, day, asset_finder,
+                )),
+            )
+
+
+class MappedUSEquityPricingLoaderTestCase(
+        PreloadedUSEquityPricingLoaderTestCase):
+    """Run the loader tests against an adjustments index which was written
+    to disk and read back memory-mapped.
+    """
+    @classmethod
+    def init_class_fixtures(cls):
+        super(MappedUSEquityPricingLoaderTestCase, cls).init_class_fixtures()
+        path = cls.enter_class_context(tmp_dir()).getpath('adjustments')
+        cls.adjustment_reader._index.write(path)
+        cls.adjustment_reader = SQLiteAdjustmentReader(
+            cls.adjustment_reader.conn,
+            index=AdjustmentsIndex.read(path),
+        )
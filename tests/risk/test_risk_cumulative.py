@@ -13,6 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import warnings
+
+import empyrical
+from nose_parameterized import parameterized
 import numpy as np
 import pandas as pd
 import zipline.finance.risk as risk
@@ -134,3 +138,72 @@ class TestRisk(WithTradingEnvironment, ZiplineTestCase):
     def test_representation(self):
         assert all(metric in repr(self.cumulative_metrics)
                    for metric in self.cumulative_metrics.METRIC_NAMES)
+
+    @parameterized.expand([
+        ('daily', False),
+        ('first_day_stats', True),
+    ])
+    def test_matches_empyrical(self, name, create_first_day_stats):
+        metrics = risk.RiskMetricsCumulative(
+            self.sim_params,
+            treasury_curves=self.env.treasury_curves,
+            trading_calendar=self.trading_calendar,
+            create_first_day_stats=create_first_day_stats,
+        )
+
+        rand = np.random.RandomState(1)
+        dts = self.algo_returns.index
+        algo_returns = rand.normal(0.001, 0.02, len(dts))
+        benchmark_returns = rand.normal(0.0005, 0.01, len(dts))
+        algo_returns[[5, 20]] = np.nan
+        benchmark_returns[[20, 30]] = np.nan
+
+        for i, dt in enumerate(dts):
+            # Earlier returns for the same session should be replaced, as
+            # happens when updating every minute.
+            metrics.update(dt, 0.5, -0.5, 0.0)
+            metrics.update(dt, algo_returns[i], benchmark_returns[i], 0.0)
+
+            algo = algo_returns[:i + 1]
+            benchmark = benchmark_returns[:i + 1]
+            if create_first_day_stats and i == 0:
+                algo = np.append(0.0, algo)
+                benchmark = np.append(0.0, benchmark)
+
+            with np.errstate(divide='ignore', invalid='ignore'), \
+                    warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                expected_alpha, expected_beta = empyrical.alpha_beta_aligned(
+                    algo,
+                    benchmark,
+                )
+                expected = [
+                    empyrical.cum_returns(algo)[-1],
+                    empyrical.cum_returns(benchmark)[-1],
+                    empyrical.annual_volatility(algo),
+                    empyrical.annual_volatility(benchmark),
+                    expected_alpha,
+                    expected_beta,
+                    empyrical.sharpe_ratio(algo),
+                    empyrical.downside_risk(algo),
+                    empyrical.sortino_ratio(algo),
+                    empyrical.max_drawdown(algo),
+                ]
+
+            np.testing.assert_allclose(
+                [
+                    metrics.algorithm_cumulative_returns[i],
+                    metrics.benchmark_cumulative_returns[i],
+                    metrics.algorithm_volatility[i],
+                    metrics.benchmark_volatility[i],
+                    metrics.alpha[i],
+                    metrics.beta[i],
+                    metrics.sharpe[i],
+                    metrics.downside_risk[i],
+                    metrics.sortino[i],
+                    metrics.max_drawdown,
+                ],
+                expected,
+                rtol=1e-9,
+                err_msg='day %d' % i,
+            )
@@ -561,6 +561,107 @@ def log_nyse_close(context, data):
 
         self.assertEqual(algo.func_called, algo.days)
 
+    def test_clock_without_all_minutes(self):
+        class Clock(object):
+            # A clock which can't list its minutes up front.
+            def __init__(self, clock):
+                self._clock = clock
+
+            def __iter__(self):
+                return iter(self._clock)
+
+        class ClockAlgorithm(TradingAlgorithm):
+            def _create_clock(self):
+                return Clock(super(ClockAlgorithm, self)._create_clock())
+
+        def count(algo, data):
+            algo.calls += 1
+
+        def initialize(algo):
+            algo.calls = 0
+            algo.schedule_function(
+                func=count,
+                date_rule=date_rules.every_day(),
+                time_rule=time_rules.market_open(minutes=30),
+            )
+
+        algo = ClockAlgorithm(
+            initialize=initialize,
+            sim_params=self.sim_params,
+            env=self.env,
+        )
+        algo.run(self.data_portal)
+        self.assertEqual(algo.calls, len(self.sim_params.sessions))
+        self.assertIsNone(algo.event_manager._trigger_times)
+
+    def test_skip_idle_minutes(self):
+        def buy(algo, data):
+            algo.order(algo.sid(1), 10)
+
+        def sell(algo, data):
+            algo.order(algo.sid(1), -5)
+
+        def initialize(algo):
+            algo.schedule_function(
+                func=buy,
+                date_rule=date_rules.every_day(),
+                time_rule=time_rules.market_open(minutes=30),
+            )
+            algo.schedule_function(
+                func=sell,
+                date_rule=date_rules.every_day(),
+                time_rule=time_rules.market_close(minutes=30),
+            )
+
+        def run(skip_idle_minutes):
+            algo = TradingAlgorithm(
+                initialize=initialize,
+                sim_params=self.sim_params,
+                env=self.env,
+                skip_idle_minutes=skip_idle_minutes,
+            )
+            bars = []
+            handle_data = algo.event_manager.handle_data
+
+            def record_bar(context, data, dt):
+                bars.append(dt)
+                handle_data(context, data, dt)
+
+            algo.event_manager.handle_data = record_bar
+            return algo.run(self.data_portal), bars
+
+        expected, all_bars = run(skip_idle_minutes=False)
+        result, bars = run(skip_idle_minutes=True)
+
+        for column in ('portfolio_value', 'ending_cash', 'ending_value',
+                       'pnl', 'returns'):
+            assert_equal(result[column], expected[column])
+        assert_equal(
+            [[(t['amount'], t['price'], t['dt']) for t in txns]
+             for txns in result.transactions],
+            [[(t['amount'], t['price'], t['dt']) for t in txns]
+             for txns in expected.transactions],
+        )
+
+        # Only the bars at which the scheduled functions trigger and the bars
+        # after them while their orders fill are run.
+        trigger_bars = [
+            pd.Timestamp(
+                '{} {}'.format(session.date(), time), tz='US/Eastern',
+            ).tz_convert('UTC')
+            for session in self.sim_params.sessions
+            for time in ('10:00', '15:30')
+        ]
+        fill_bars = [
+            t['dt'] for txns in expected.transactions for t in txns
+        ]
+        self.assertLessEqual(set(trigger_bars), set(bars))
+        self.assertLessEqual(set(fill_bars), set(bars))
+        self.assertLess(set(bars), set(all_bars))
+        self.assertEqual(bars, sorted(bars))
+        self.assertLess(len(bars), 30)
+        self.assertEqual(len(all_bars), 390 * len(self.sim_params.sessions))
+
     def test_event_context(self):
         expected_data = []
         collected_data_pre = []
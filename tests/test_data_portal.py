@@ -25,6 +25,7 @@ from zipline.data.minute_bars import (
     FUTURES_MINUTES_PER_DAY,
     US_EQUITIES_MINUTES_PER_DAY,
 )
+from zipline.data.us_equity_pricing import CorporateActionCalendar
 from zipline.testing import parameter_space
 from zipline.testing.fixtures import (
     ZiplineTestCase,
@@ -370,6 +371,32 @@ class DataPortalTestBase(WithDataPortal,
         ]
         assert_almost_equal(expected.values.tolist(), result)
 
+    def test_get_spot_value_multiple_assets_matches_single(self):
+        assets = self.asset_finder.retrieve_all([1, 2, 10000, 10001])
+        trading_calendar = self.trading_calendars[Equity]
+        dts = []
+        for session in self.trading_days[:4]:
+            minutes = trading_calendar.minutes_for_session(session)
+            dts.extend(minutes[:7])
+            dts.append(minutes[100])
+
+        for dt in dts:
+            for field in 'open', 'high', 'low', 'close', 'volume', 'price':
+                expected = [
+                    self.data_portal.get_spot_value(
+                        asset, field, dt, 'minute',
+                    )
+                    for asset in assets
+                ]
+                result = self.data_portal.get_spot_value(
+                    assets, field, dt, 'minute',
+                )
+                assert_almost_equal(
+                    result,
+                    expected,
+                    err_msg='field=%s dt=%s' % (field, dt),
+                )
+
     def test_bar_count_for_simple_transforms(self):
         # July 2015
         # Su Mo Tu We Th Fr Sa
@@ -520,3 +547,126 @@ class TestDataPortal(DataPortalTestBase):
 class TestDataPortalExplicitLastAvailable(DataPortalTestBase):
     DATA_PORTAL_LAST_AVAILABLE_SESSION = alias('START_DATE')
     DATA_PORTAL_LAST_AVAILABLE_MINUTE = alias('END_DATE')
+
+
+class DataPortalCorporateActionsTestCase(WithDataPortal, ZiplineTestCase):
+    ASSET_FINDER_EQUITY_SIDS = (1, 2, 3)
+    START_DATE = pd.Timestamp('2016-08-01', tz='utc')
+    END_DATE = pd.Timestamp('2016-08-31', tz='utc')
+
+    # The range covered by the corporate action calendar.
+    CALENDAR_START = pd.Timestamp('2016-08-02', tz='utc')
+    CALENDAR_END = pd.Timestamp('2016-08-19', tz='utc')
+
+    @classmethod
+    def make_splits_data(cls):
+        return pd.DataFrame({
+            'sid': array([1, 2, 1, 3]),
+            'effective_date': array([
+                pd.Timestamp('2016-08-03').value // int(1e9),
+                pd.Timestamp('2016-08-03').value // int(1e9),
+                pd.Timestamp('2016-08-10').value // int(1e9),
+                pd.Timestamp('2016-08-24').value // int(1e9),
+            ]),
+            'ratio': array([0.5, 0.25, 0.5, 2.0]),
+        })
+
+    @classmethod
+    def make_dividends_data(cls):
+        return pd.DataFrame({
+            'sid': array([1, 2]),
+            'amount': array([0.1, 0.2]),
+            'declared_date': pd.to_datetime(['2016-07-01', '2016-07-01']),
+            'ex_date': pd.to_datetime(['2016-08-04', '2016-08-25']),
+            'record_date': pd.to_datetime(['2016-08-05', '2016-08-26']),
+            'pay_date': pd.to_datetime(['2016-08-08', '2016-08-29']),
+        })
+
+    @classmethod
+    def make_stock_dividends_data(cls):
+        return pd.DataFrame({
+            'sid': array([3, 3]),
+            'payment_sid': array([2, 2]),
+            'ratio': array([2.0, 3.0]),
+            'declared_date': pd.to_datetime(['2016-07-01', '2016-07-01']),
+            'ex_date': pd.to_datetime(['2016-08-05', '2016-08-22']),
+            'record_date': pd.to_datetime(['2016-08-08', '2016-08-23']),
+            'pay_date': pd.to_datetime(['2016-08-09', '2016-08-24']),
+        })
+
+    def test_corporate_action_calendar(self):
+        reader = self.adjustment_reader
+        calendar = CorporateActionCalendar(
+            reader,
+            self.CALENDAR_START,
+            self.CALENDAR_END,
+        )
+        sids = set(self.ASSET_FINDER_EQUITY_SIDS)
+
+        # Sessions outside of the calendar are looked up in the reader.
+        for session in self.trading_calendar.sessions_in_range(
+                self.START_DATE,
+                self.END_DATE):
+            assert_equal(
+                sorted(calendar.get_splits(sids, session)),
+                sorted(reader.get_splits(sids, session)),
+                msg=str(session),
+            )
+            assert_equal(
+                sorted(calendar.get_dividends_with_ex_date(
+                    sids, session, self.asset_finder,
+                )),
+                sorted(reader.get_dividends_with_ex_date(
+                    sids, session, self.asset_finder,
+                )),
+                msg=str(session),
+            )
+            assert_equal(
+                calendar.get_stock_dividends_with_ex_date(
+                    sids, session, self.asset_finder,
+                ),
+                reader.get_stock_dividends_with_ex_date(
+                    sids, session, self.asset_finder,
+                ),
+                msg=str(session),
+            )
+
+        assert_equal(
+            calendar.get_splits({1, 3}, pd.Timestamp('2016-08-03', tz='utc')),
+            [(1, 0.5)],
+        )
+
+    def test_load_corporate_actions(self):
+        sessions = self.trading_calendar.sessions_in_range(
+            self.START_DATE,
+            self.END_DATE,
+        )
+        assets = self.asset_finder.retrieve_all(self.ASSET_FINDER_EQUITY_SIDS)
+        splits_before = [
+            self.data_portal.get_splits(assets, session)
+            for session in sessions
+        ]
+        stock_dividends_before = [
+            self.data_portal.get_stock_dividends(3, sessions[n:])
+            for n in range(len(sessions))
+        ]
+
+        self.data_portal.load_corporate_actions(
+            self.CALENDAR_START,
+            self.CALENDAR_END,
+        )
+        splits_after = [
+            self.data_portal.get_splits(assets, session)
+            for session in sessions
+        ]
+        stock_dividends_after = [
+            self.data_portal.get_stock_dividends(3, sessions[n:])
+            for n in range(len(sessions))
+        ]
+
+        assert_equal(splits_after, splits_before)
+        assert_equal(stock_dividends_after, stock_dividends_before)
+        assert_equal(
+            len(self.data_portal.get_stock_dividends(3, sessions)),
+            2,
+        )
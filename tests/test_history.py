@@ -18,6 +18,7 @@ from nose_parameterized import parameterized
 import numpy as np
 from numpy import nan
 import pandas as pd
+from pandas.util.testing import assert_frame_equal
 from six import iteritems
 
 from zipline import TradingAlgorithm
@@ -1083,6 +1084,35 @@ class MinuteEquityHistoryTestCase(WithHistory, ZiplineTestCase):
             # should not be adjusted, should be 1005 to 1009
             np.testing.assert_array_equal(range(1005, 1010), window4)
 
+    def test_minute_window_rolls_forward(self):
+        # Request consecutive windows through several sessions with
+        # adjustments from a data portal whose windows run out of prefetched
+        # data often, and compare against windows built from scratch.
+        self.DATA_PORTAL_MINUTE_HISTORY_PREFETCH = 45
+        rolling_portal = self.make_data_portal()
+
+        assets = [
+            self.SPLIT_ASSET,
+            self.DIVIDEND_ASSET,
+            self.MERGER_ASSET,
+            self.ASSET2,
+        ]
+        equity_cal = self.trading_calendars[Equity]
+        minutes = equity_cal.minutes_for_sessions_in_range(
+            pd.Timestamp('2015-01-05', tz='UTC'),
+            pd.Timestamp('2015-01-08', tz='UTC'),
+        )[400::30]
+
+        for minute in minutes:
+            for field in ('close', 'volume'):
+                result = rolling_portal.get_history_window(
+                    assets, minute, 100, '1m', field, 'minute',
+                )
+                expected = self.make_data_portal().get_history_window(
+                    assets, minute, 100, '1m', field, 'minute',
+                )
+                assert_frame_equal(result, expected)
+
     def test_minute_dividends(self):
         # self.DIVIDEND_ASSET had dividends on 1/6 and 1/7
 
@@ -1866,6 +1896,38 @@ class DailyEquityHistoryTestCase(WithHistory, ZiplineTestCase):
             elif asset == self.MERGER_ASSET:
                 np.testing.assert_array_equal(window3_volume, [200, 300, 400])
 
+    def test_daily_adjustments_multiple_assets(self):
+        # Load adjusted assets together, so that their windows share a block,
+        # and compare against loading each asset on its own.
+        assets = [
+            self.SPLIT_ASSET,
+            self.ASSET1,
+            self.DIVIDEND_ASSET,
+            self.MERGER_ASSET,
+        ]
+        days = self.trading_calendars[Equity].sessions_in_range(
+            pd.Timestamp('2015-01-05', tz='UTC'),
+            pd.Timestamp('2015-01-09', tz='UTC'),
+        )
+
+        for field in ALL_FIELDS:
+            combined_portal = self.make_data_portal()
+            single_portals = {asset: self.make_data_portal()
+                              for asset in assets}
+            for day in days:
+                combined = combined_portal.get_history_window(
+                    assets, day, 3, '1d', field, 'daily',
+                )
+                for asset in assets:
+                    expected = single_portals[asset].get_history_window(
+                        [asset], day, 3, '1d', field, 'daily',
+                    )[asset]
+                    np.testing.assert_array_equal(
+                        combined[asset].values,
+                        expected.values,
+                        err_msg='%s %s %s' % (field, asset, day),
+                    )
+
     def test_daily_dividends(self):
         # self.DIVIDEND_ASSET had dividends on 1/6 and 1/7
 
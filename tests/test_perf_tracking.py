@@ -2047,6 +2047,79 @@ class TestPositionTracker(WithTradingEnvironment,
         self.assertEqual(100 + 200 + 300000 + 400000, pos_stats.gross_exposure)
         self.assertEqual(100 - 200 + 300000 - 400000, pos_stats.net_exposure)
 
+    def test_sync_last_sale_prices(self):
+        pt = perf.PositionTracker('minute')
+        dt = pd.Timestamp('2015-12-10 15:00', tz='UTC')
+        for asset in self.EQUITY1, self.EQUITY2, self.FUTURE3:
+            pt.update_position(asset, amount=10, last_sale_price=10)
+
+        calls = []
+
+        class data_portal(object):
+            @staticmethod
+            def get_spot_value(assets, field, dt, data_frequency):
+                calls.append(assets)
+                # The price of EQUITY2 is not available.
+                return [11.0, np.nan, 12.0]
+
+        pt.sync_last_sale_prices(dt, False, data_portal)
+
+        # All of the prices are looked up at once.
+        self.assertEqual(
+            calls,
+            [[self.EQUITY1, self.EQUITY2, self.FUTURE3]],
+        )
+        self.assertEqual(pt.positions[self.EQUITY1].last_sale_price, 11.0)
+        self.assertEqual(pt.positions[self.EQUITY2].last_sale_price, 10.0)
+        self.assertEqual(pt.positions[self.FUTURE3].last_sale_price, 12.0)
+
+        pos_stats = pt.stats()
+        self.assertEqual(110 + 100, pos_stats.net_value)
+        self.assertEqual(110 + 100 + 120000, pos_stats.net_exposure)
+
+        # Closing a position removes it from the columns.
+        pt.execute_transaction(create_txn(self.EQUITY1, dt, 11.0, -10))
+        self.assertEqual(pt.columns.assets, [self.EQUITY2, self.FUTURE3])
+        self.assertEqual(100, pt.stats().net_value)
+
+    def test_get_positions_rebuilds_changed_positions(self):
+        pt = perf.PositionTracker('minute')
+        dt = pd.Timestamp('2015-12-10 15:00', tz='UTC')
+        for asset in self.EQUITY1, self.EQUITY2:
+            pt.update_position(asset, amount=10, last_sale_price=10)
+
+        positions = pt.get_positions()
+        first = dict(positions)
+        self.assertEqual(set(first), {self.EQUITY1, self.EQUITY2})
+
+        # Nothing changed, so nothing is rebuilt.
+        self.assertEqual(dict(pt.get_positions()), first)
+        for asset in first:
+            self.assertIs(pt.get_positions()[asset], first[asset])
+
+        class data_portal(object):
+            @staticmethod
+            def get_spot_value(assets, field, dt, data_frequency):
+                # Only the price of EQUITY2 changes.
+                return [10.0, 11.0]
+
+        pt.sync_last_sale_prices(dt, False, data_portal)
+        positions = pt.get_positions()
+        self.assertIs(positions[self.EQUITY1], first[self.EQUITY1])
+        self.assertIsNot(positions[self.EQUITY2], first[self.EQUITY2])
+        self.assertEqual(positions[self.EQUITY2].last_sale_price, 11.0)
+        # The old position is a snapshot.
+        self.assertEqual(first[self.EQUITY2].last_sale_price, 10.0)
+
+        pt.handle_commission(self.EQUITY1, 5)
+        self.assertEqual(pt.get_positions()[self.EQUITY1].cost_basis, 0.5)
+
+        pt.update_position(self.EQUITY1, amount=0)
+        self.assertEqual(set(pt.get_positions()), {self.EQUITY2})
+
+        pt.execute_transaction(create_txn(self.EQUITY2, dt, 11.0, -10))
+        self.assertEqual(pt.get_positions(), {})
+
     @parameterized.expand([('FutureLong', True, 1),
                            ('FutureShort', True, -1),
                            ('EquityLong', False, 1),
@@ -0,0 +1,78 @@
+from itertools import count
+from multiprocessing.pool import ThreadPool
+from threading import Lock
+import time
+from unittest import TestCase
+
+from zipline.utils.pool import SequentialPool, imap_bounded
+
+
+class ImapBoundedTestCase(TestCase):
+
+    def test_ordered(self):
+        pool = ThreadPool(4)
+        try:
+            result = list(imap_bounded(
+                pool,
+                # Later elements finish first.
+                lambda n: time.sleep((10 - n) * 0.001) or n * 2,
+                range(10),
+                max_pending=3,
+            ))
+        finally:
+            pool.terminate()
+        self.assertEqual(result, [n * 2 for n in range(10)])
+
+    def test_lazy(self):
+        consumed = count()
+
+        def iterable():
+            for n in range(10):
+                next(consumed)
+                yield n
+
+        it = imap_bounded(SequentialPool(), lambda n: n, iterable(), 3)
+        self.assertEqual(next(it), 0)
+        # Only enough elements to fill the pending calls have been consumed.
+        self.assertEqual(next(consumed), 4)
+
+    def test_key(self):
+        lock = Lock()
+        running = set()
+        overlapping = []
+
+        def f(element):
+            key, n = element
+            with lock:
+                if key in running:
+                    overlapping.append(element)
+                running.add(key)
+            time.sleep(0.005)
+            with lock:
+                running.remove(key)
+            return n
+
+        pool = ThreadPool(4)
+        try:
+            result = list(imap_bounded(
+                pool,
+                f,
+                [(n % 2, n) for n in range(10)],
+                max_pending=4,
+                key=lambda e: e[0],
+            ))
+        finally:
+            pool.terminate()
+        self.assertEqual(result, list(range(10)))
+        self.assertEqual(overlapping, [])
+
+    def test_error(self):
+        def f(n):
+            if n == 2:
+                raise ValueError(n)
+            return n
+
+        it = imap_bounded(SequentialPool(), f, range(5), max_pending=2)
+        self.assertEqual([next(it), next(it)], [0, 1])
+        with self.assertRaises(ValueError):
+            next(it)
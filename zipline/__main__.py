@@ -1,4 +1,5 @@
 import errno
+import multiprocessing
 import os
 from functools import wraps
 
@@ -301,16 +302,41 @@ def zipline_magic(line, cell=None):
     default=True,
     help='Print progress information to the terminal.'
 )
-def ingest(bundle, assets_version, show_progress):
+@click.option(
+    '-j',
+    '--processes',
+    type=int,
+    default=1,
+    show_default=True,
+    help='The number of processes used to convert and write the bars.',
+)
+@click.option(
+    '--incremental/--full',
+    default=False,
+    help='Only ingest the sessions after the most recent ingestion, starting'
+    ' from a copy of it.',
+)
+def ingest(bundle, assets_version, show_progress, processes, incremental):
     """Ingest the data for the given bundle.
     """
-    bundles_module.ingest(
-        bundle,
-        os.environ,
-        pd.Timestamp.utcnow(),
-        assets_version,
-        show_progress,
-    )
+    if processes > 1:
+        pool = multiprocessing.Pool(processes)
+    else:
+        pool = None
+
+    try:
+        bundles_module.ingest(
+            bundle,
+            os.environ,
+            pd.Timestamp.utcnow(),
+            assets_version,
+            show_progress,
+            pool=pool,
+            incremental=incremental,
+        )
+    finally:
+        if pool is not None:
+            pool.terminate()
 
 
 @main.command()
@@ -29,6 +29,7 @@ from numbers import Integral
 
 from six import (
     exec_,
+    get_unbound_function,
     iteritems,
     itervalues,
     string_types,
@@ -207,6 +208,11 @@ class TradingAlgorithm(object):
         in the simulation with ``get_environment``. This allows algorithms
         to conditionally execute code based on platform it is running on.
         default: 'zipline'
+    skip_idle_minutes : bool, optional
+        Whether a minute simulation with daily emission should only run the
+        bars at which a scheduled function may trigger, an order may fill or
+        the capital changes. This only has an effect when the algorithm has
+        no ``handle_data`` and no account controls. default: False
     """
 
     def __init__(self, *args, **kwargs):
@@ -388,15 +394,21 @@ class TradingAlgorithm(object):
             )
             self._analyze = kwargs.pop('analyze', None)
 
-        self.event_manager.add_event(
-            zipline.utils.events.Event(
-                zipline.utils.events.Always(),
-                # We pass handle_data.__func__ to get the unbound method.
-                # We will explicitly pass the algorithm to bind it again.
-                self.handle_data.__func__,
-            ),
-            prepend=True,
+        self._handle_data_event = zipline.utils.events.Event(
+            zipline.utils.events.Always(),
+            # We pass handle_data.__func__ to get the unbound method.
+            # We will explicitly pass the algorithm to bind it again.
+            self.handle_data.__func__,
+        )
+        self.event_manager.add_event(self._handle_data_event, prepend=True)
+
+        # Whether the handle_data event only checks the account controls.
+        self._handle_data_is_noop = (
+            self._handle_data in (noop, None) and
+            get_unbound_function(type(self).handle_data) is
+            get_unbound_function(TradingAlgorithm.handle_data)
         )
+        self._skip_idle_minutes = kwargs.pop('skip_idle_minutes', False)
 
         # Alternative way of setting data_frequency for backwards
         # compatibility.
@@ -532,14 +544,70 @@ class TradingAlgorithm(object):
             "US/Eastern"
         )
 
+        if (self._skip_idle_minutes and
+                self.sim_params.data_frequency == 'minute' and
+                not minutely_emission and
+                self._handle_data_is_noop):
+            next_bar = self._next_bar_position
+        else:
+            next_bar = None
+
         return MinuteSimulationClock(
             self.sim_params.sessions,
             execution_opens,
             execution_closes,
             before_trading_start_minutes,
             minute_emission=minutely_emission,
+            next_bar=next_bar,
         )
 
+    def _next_bar_position(self, minutes, start):
+        """
+        Find the next of ``minutes`` at which the simulation has to run a bar.
+
+        Bars are needed while there are open or new orders, and at the minutes
+        at which a scheduled function may trigger or the capital changes. The
+        scheduled functions are advanced past the skipped minutes.
+
+        Parameters
+        ----------
+        minutes : pd.DatetimeIndex
+            The minutes of a session, in order.
+        start : int
+            The position in ``minutes`` of the first minute which has not
+            been run.
+
+        Returns
+        -------
+        position : int
+            The position in ``minutes`` of the next bar, ``len(minutes)`` if
+            there is none.
+        """
+        blotter = self.blotter
+        if (self.account_controls or
+                blotter.new_orders or
+                any(itervalues(blotter.open_orders))):
+            return start
+
+        remaining = minutes[start:]
+        if not len(remaining):
+            return start
+
+        if self.capital_changes:
+            # Only look for scheduled functions before the next change.
+            (changes,) = np.nonzero(
+                remaining.isin(list(self.capital_changes)),
+            )
+            if len(changes):
+                remaining = remaining[:changes[0]]
+
+        skipped = self.event_manager.next_trigger(
+            remaining,
+            ignore=(self._handle_data_event,),
+        )
+        self.event_manager.skip(remaining[:skipped])
+        return start + skipped
+
     def _create_benchmark_source(self):
         if self.benchmark_sid is not None:
             benchmark_asset = self.asset_finder.retrieve_asset(
@@ -579,11 +647,28 @@ class TradingAlgorithm(object):
             self.initialize(*self.initialize_args, **self.initialize_kwargs)
             self.initialized = True
 
+        # Read the splits and dividends of every session up front instead of
+        # querying the adjustments db each session.
+        if self.data_portal is not None:
+            self.data_portal.load_corporate_actions(
+                self.sim_params.start_session,
+                self.sim_params.end_session,
+            )
+
+        clock = self._create_clock()
+
+        # Work out when the scheduled functions trigger over the whole
+        # simulation up front instead of checking their rules every bar.
+        # Clocks which can't list their minutes check the rules every bar.
+        all_minutes = getattr(clock, 'all_minutes', None)
+        if all_minutes is not None:
+            self.event_manager.compile(all_minutes())
+
         self.trading_client = AlgorithmSimulator(
             self,
             sim_params,
             self.data_portal,
-            self._create_clock(),
+            clock,
             self._create_benchmark_source(),
             self.restrictions,
             universe_func=self._calculate_universe
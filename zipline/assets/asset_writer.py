@@ -453,11 +453,19 @@ class AssetDBWriter(object):
             If you have compiled sqlite3 with more bind or less params you may
             want to pass that value here.
 
+        Notes
+        -----
+        If the database already has assets, the new data is added to them.
+        The existing metadata and symbol mappings for any sid, exchange or
+        root symbol which is written again are replaced.
+
         See Also
         --------
         zipline.assets.asset_finder
         """
         with self.engine.begin() as conn:
+            tables_already_exist = self._all_tables_present(conn)
+
             # Create SQL tables if they do not exist.
             self.init_db(conn)
 
@@ -473,6 +481,9 @@ class AssetDBWriter(object):
                     else pd.DataFrame()
                 ),
             )
+            if tables_already_exist:
+                self._delete_existing(data, conn)
+
             # Write the data to SQL.
             self._write_df_to_table(
                 futures_exchanges,
@@ -507,6 +518,52 @@ class AssetDBWriter(object):
                 mapping_data=data.equities_mappings,
             )
 
+    def _delete_existing(self, data, txn):
+        """Delete the rows which are about to be replaced by ``data``.
+
+        Parameters
+        ----------
+        data : AssetData
+            The data being written.
+        txn : sa.engine.Connection
+            The transaction to execute in.
+        """
+        equity_sids = data.equities.index.tolist()
+        future_sids = data.futures.index.tolist()
+        supplementary_mappings = data.equity_supplementary_mappings
+        for tbl, columns, keys in (
+                (futures_exchanges,
+                 ['exchange'],
+                 data.exchanges.index.tolist()),
+                (futures_root_symbols,
+                 ['root_symbol'],
+                 data.root_symbols.index.tolist()),
+                (equity_supplementary_mappings_table,
+                 ['sid', 'field', 'start_date'],
+                 list(zip(*(
+                     supplementary_mappings[column].tolist()
+                     for column in ('sid', 'field', 'start_date')
+                 )))),
+                (futures_contracts_table, ['sid'], future_sids),
+                (equities_table, ['sid'], equity_sids),
+                (equity_symbol_mappings, ['sid'], equity_sids),
+                (asset_router, ['sid'], equity_sids + future_sids)):
+            if not keys:
+                continue
+            if len(columns) == 1:
+                keys = [(key,) for key in keys]
+            txn.execute(
+                tbl.delete().where(sa.and_(*(
+                    tbl.c[column] == sa.bindparam('key_' + column)
+                    for column in columns
+                ))),
+                [
+                    {'key_' + column: value
+                     for column, value in zip(columns, key)}
+                    for key in keys
+                ],
+            )
+
     def _write_df_to_table(
         self,
         tbl,
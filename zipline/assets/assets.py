@@ -257,6 +257,10 @@ class AssetFinder(object):
         A dict mapping future root symbol to a predicate function which accepts
     a contract as a parameter and returns whether or not the contract should be
     included in the chain.
+    asset_lifetimes : np.recarray, optional
+        The sid, start and end of each equity, as computed by the finder for
+        :meth:`lifetimes`. This may be a memory-mapped array shared between
+        processes. By default it is read from the db on first use.
 
     See Also
     --------
@@ -267,7 +271,10 @@ class AssetFinder(object):
     PERSISTENT_TOKEN = "<AssetFinder>"
 
     @preprocess(engine=coerce_string_to_eng)
-    def __init__(self, engine, future_chain_predicates=CHAIN_PREDICATES):
+    def __init__(self,
+                 engine,
+                 future_chain_predicates=CHAIN_PREDICATES,
+                 asset_lifetimes=None):
         self.engine = engine
         metadata = sa.MetaData(bind=engine)
         metadata.reflect(only=asset_db_table_names)
@@ -291,8 +298,8 @@ class AssetFinder(object):
             if future_chain_predicates is not None else {}
         self._ordered_contracts = {}
 
-        # Populated on first call to `lifetimes`.
-        self._asset_lifetimes = None
+        # Populated on first call to `lifetimes` if not given.
+        self._asset_lifetimes = asset_lifetimes
 
     def _reset_caches(self):
         """
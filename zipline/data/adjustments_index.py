@@ -0,0 +1,410 @@
+"""
+An in-memory index of the adjustments written by
+:class:`zipline.data.us_equity_pricing.SQLiteAdjustmentWriter`.
+
+The whole adjustments db is read once into sorted arrays. The ratio tables
+(splits, mergers and dividends) are sorted by sid and effective date, with the
+offset of the first row of each sid, so looking up the adjustments of an asset
+is a pair of binary searches instead of a SQLite query. The payout tables are
+sorted by ex date.
+
+The sorted arrays can be written to a directory of ``.npy`` files and read
+back memory-mapped, so that many processes share one copy of the index.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from zipline.lib.adjustment import Float64Multiply
+from zipline.utils.paths import ensure_directory
+
+
+RATIO_TABLES = ('splits', 'mergers', 'dividends')
+PAYOUT_TABLES = {
+    'dividend_payouts': (
+        ('sid', np.int64),
+        ('ex_date', np.int64),
+        ('amount', np.float64),
+        ('pay_date', np.int64),
+    ),
+    'stock_dividend_payouts': (
+        ('sid', np.int64),
+        ('ex_date', np.int64),
+        ('payment_sid', np.int64),
+        ('ratio', np.float64),
+        ('pay_date', np.int64),
+    ),
+}
+RATIO_COLUMNS = (
+    ('sid', np.int64),
+    ('effective_date', np.int64),
+    ('ratio', np.float64),
+)
+
+
+def _read_table(conn, tablename, columns):
+    """Read ``columns`` of ``tablename`` into one array per column.
+
+    Missing tables are read as empty arrays.
+    """
+    exists = conn.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name=?",
+        (tablename,),
+    ).fetchone()[0]
+    if exists:
+        rows = conn.execute(
+            'SELECT {0} FROM {1}'.format(
+                ', '.join(name for name, _ in columns),
+                tablename,
+            ),
+        ).fetchall()
+    else:
+        rows = []
+
+    if rows:
+        values = list(zip(*rows))
+    else:
+        values = [()] * len(columns)
+
+    return {
+        name: np.array(column, dtype=dtype)
+        for (name, dtype), column in zip(columns, values)
+    }
+
+
+def _to_seconds(dt):
+    return pd.Timestamp(dt).value // int(1e9)
+
+
+def _column_path(rootdir, tablename, column):
+    return os.path.join(rootdir, tablename, '{0}.npy'.format(column))
+
+
+def _write_columns(rootdir, tablename, columns):
+    ensure_directory(os.path.join(rootdir, tablename))
+    for name, column in columns.items():
+        np.save(_column_path(rootdir, tablename, name), column)
+
+
+def _read_columns(rootdir, tablename, columns, mmap_mode):
+    return {
+        name: np.load(
+            _column_path(rootdir, tablename, name),
+            mmap_mode=mmap_mode,
+        )
+        for name, _ in columns
+    }
+
+
+class RatioTable(object):
+    """The rows of one of the splits, mergers or dividends tables, sorted by
+    sid and effective date.
+
+    Parameters
+    ----------
+    sids : np.array[int64]
+        The sid of each adjustment.
+    effective_dates : np.array[int64]
+        The effective date of each adjustment, in seconds since the epoch.
+    ratios : np.array[float64]
+        The ratio of each adjustment.
+
+    Notes
+    -----
+    The rows must already be sorted by sid and effective date; use
+    :meth:`from_unsorted` otherwise. The arrays are not copied, so they may
+    be memory-mapped.
+    """
+    def __init__(self, sids, effective_dates, ratios):
+        self.sids = sids
+        self.effective_dates = effective_dates
+        self.ratios = ratios
+
+        self._unique_sids, starts = np.unique(sids, return_index=True)
+        self._offsets = np.append(starts, len(sids))
+
+    @classmethod
+    def from_unsorted(cls, sids, effective_dates, ratios):
+        """Sort the rows of a table by sid and effective date.
+        """
+        order = np.lexsort((effective_dates, sids))
+        return cls(sids[order], effective_dates[order], ratios[order])
+
+    @property
+    def columns(self):
+        return {
+            'sid': self.sids,
+            'effective_date': self.effective_dates,
+            'ratio': self.ratios,
+        }
+
+    def __len__(self):
+        return len(self.sids)
+
+    def sid_bounds(self, sid):
+        """The range of rows holding the adjustments for ``sid``.
+        """
+        ix = self._unique_sids.searchsorted(sid)
+        if ix == len(self._unique_sids) or self._unique_sids[ix] != sid:
+            return 0, 0
+        return self._offsets[ix], self._offsets[ix + 1]
+
+    def date_bounds(self, sid, start, end):
+        """The range of rows holding the adjustments for ``sid`` which are
+        effective between ``start`` and ``end``, inclusive.
+        """
+        lo, hi = self.sid_bounds(sid)
+        if lo == hi:
+            return lo, hi
+        dates = self.effective_dates[lo:hi]
+        return (
+            lo + dates.searchsorted(start, side='left'),
+            lo + dates.searchsorted(end, side='right'),
+        )
+
+
+class PayoutTable(object):
+    """The rows of one of the payout tables, sorted by ex date and sid.
+
+    Parameters
+    ----------
+    columns : dict[str -> np.array]
+        The columns of the table. There must be a 'sid' and an 'ex_date'
+        column.
+
+    Notes
+    -----
+    The rows must already be sorted by ex date and sid; use
+    :meth:`from_unsorted` otherwise.
+    """
+    def __init__(self, columns):
+        self.columns = columns
+
+    @classmethod
+    def from_unsorted(cls, columns):
+        """Sort the rows of a table by ex date and sid.
+        """
+        order = np.lexsort((columns['sid'], columns['ex_date']))
+        return cls({name: column[order] for name, column in columns.items()})
+
+    def on_ex_date(self, sids, ex_date):
+        """The payouts for ``sids`` with an ex date of ``ex_date``.
+
+        Returns
+        -------
+        payouts : dict[str -> np.array]
+            The columns of the matching rows.
+        """
+        ex_dates = self.columns['ex_date']
+        lo = ex_dates.searchsorted(ex_date, side='left')
+        hi = ex_dates.searchsorted(ex_date, side='right')
+        mask = np.in1d(
+            self.columns['sid'][lo:hi],
+            np.asarray(sids, dtype=np.int64),
+        )
+        return {
+            name: column[lo:hi][mask]
+            for name, column in self.columns.items()
+        }
+
+
+class AdjustmentsIndex(object):
+    """All of the adjustments in an adjustments db, held in memory.
+
+    Parameters
+    ----------
+    ratio_tables : dict[str -> RatioTable]
+        The splits, mergers and dividends tables.
+    payout_tables : dict[str -> PayoutTable]
+        The dividend_payouts and stock_dividend_payouts tables.
+
+    See Also
+    --------
+    :class:`zipline.data.us_equity_pricing.SQLiteAdjustmentReader`
+    """
+    def __init__(self, ratio_tables, payout_tables):
+        self.ratio_tables = ratio_tables
+        self.payout_tables = payout_tables
+
+    @classmethod
+    def from_conn(cls, conn):
+        """Read every adjustment in the db behind ``conn``.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection
+            A connection to a db written by ``SQLiteAdjustmentWriter``.
+        """
+        ratio_tables = {}
+        for tablename in RATIO_TABLES:
+            columns = _read_table(conn, tablename, RATIO_COLUMNS)
+            ratio_tables[tablename] = RatioTable.from_unsorted(
+                columns['sid'],
+                columns['effective_date'],
+                columns['ratio'],
+            )
+        payout_tables = {
+            tablename: PayoutTable.from_unsorted(
+                _read_table(conn, tablename, columns),
+            )
+            for tablename, columns in PAYOUT_TABLES.items()
+        }
+        return cls(ratio_tables, payout_tables)
+
+    def write(self, rootdir):
+        """Write the sorted tables to ``rootdir`` as ``.npy`` files, one per
+        column.
+
+        Parameters
+        ----------
+        rootdir : str
+            The directory to write to. It is created if it does not exist.
+        """
+        for tablename, table in self.ratio_tables.items():
+            _write_columns(rootdir, tablename, table.columns)
+        for tablename, table in self.payout_tables.items():
+            _write_columns(rootdir, tablename, table.columns)
+
+    @classmethod
+    def read(cls, rootdir, mmap_mode='r'):
+        """Read an index written with :meth:`write`.
+
+        Parameters
+        ----------
+        rootdir : str
+            The directory the index was written to.
+        mmap_mode : str or None, optional
+            The mode with which to memory-map the columns, see
+            :func:`numpy.load`. By default the columns are mapped read-only,
+            so processes reading the same index share its pages.
+        """
+        ratio_tables = {}
+        for tablename in RATIO_TABLES:
+            columns = _read_columns(
+                rootdir, tablename, RATIO_COLUMNS, mmap_mode,
+            )
+            ratio_tables[tablename] = RatioTable(
+                columns['sid'],
+                columns['effective_date'],
+                columns['ratio'],
+            )
+        payout_tables = {
+            tablename: PayoutTable(
+                _read_columns(rootdir, tablename, columns, mmap_mode),
+            )
+            for tablename, columns in PAYOUT_TABLES.items()
+        }
+        return cls(ratio_tables, payout_tables)
+
+    def load_adjustments(self, columns, dates, assets):
+        """Load the adjustments to apply to a window of ``columns``.
+
+        This returns the same adjustments as
+        :func:`zipline.data._adjustments.load_adjustments_from_sqlite`.
+
+        Parameters
+        ----------
+        columns : list[str]
+            List of column names for which adjustments are needed.
+        dates : pd.DatetimeIndex
+            Dates for which adjustments are needed
+        assets : pd.Int64Index
+            Assets for which adjustments are needed.
+
+        Returns
+        -------
+        adjustments : list[dict[int -> Adjustment]]
+            A list of mappings from index to adjustment objects to apply at
+            that index.
+        """
+        results = [{} for _ in columns]
+        if not len(dates):
+            return results
+
+        dates_seconds = dates.values.astype('datetime64[s]').view(np.int64)
+        start = dates_seconds[0]
+        end = dates_seconds[-1]
+
+        for tablename in RATIO_TABLES:
+            table = self.ratio_tables[tablename]
+            if not len(table):
+                continue
+            for asset_ix, sid in enumerate(assets):
+                lo, hi = table.date_bounds(sid, start, end)
+                if lo == hi:
+                    continue
+                date_locs = dates_seconds.searchsorted(
+                    table.effective_dates[lo:hi],
+                )
+                for date_loc, ratio in zip(date_locs.tolist(),
+                                           table.ratios[lo:hi].tolist()):
+                    adj = Float64Multiply(
+                        0, date_loc, asset_ix, asset_ix, ratio,
+                    )
+                    for column, col_adjustments in zip(columns, results):
+                        if column != 'volume':
+                            col_adj = adj
+                        elif tablename == 'splits':
+                            # splits affect volumes by the inverse ratio
+                            col_adj = Float64Multiply(
+                                0, date_loc, asset_ix, asset_ix, 1.0 / ratio,
+                            )
+                        else:
+                            # mergers and dividends affect prices only
+                            continue
+                        try:
+                            col_adjustments[date_loc].append(col_adj)
+                        except KeyError:
+                            col_adjustments[date_loc] = [col_adj]
+
+        return results
+
+    def get_adjustments_for_sid(self, table_name, sid):
+        """The adjustments in ``table_name`` for ``sid``, earliest first.
+
+        Returns
+        -------
+        adjustments : list[[pd.Timestamp, float]]
+        """
+        table = self.ratio_tables[table_name.lower()]
+        lo, hi = table.sid_bounds(sid)
+        return [
+            [pd.Timestamp(date, unit='s', tz='UTC'), ratio]
+            for date, ratio in zip(table.effective_dates[lo:hi].tolist(),
+                                   table.ratios[lo:hi].tolist())
+        ]
+
+    def get_splits(self, sids, dt):
+        """The splits for ``sids`` which are effective on ``dt``.
+
+        Returns
+        -------
+        splits : list[(int, float)]
+            The sid and ratio of each split.
+        """
+        seconds = _to_seconds(dt)
+        table = self.ratio_tables['splits']
+        splits = []
+        if not len(table):
+            return splits
+        for sid in sids:
+            lo, hi = table.date_bounds(int(sid), seconds, seconds)
+            splits.extend(
+                (int(sid), ratio) for ratio in table.ratios[lo:hi].tolist()
+            )
+        return splits
+
+    def payouts_with_ex_date(self, table_name, sids, dt):
+        """The rows of the payout table ``table_name`` for ``sids`` with an
+        ex date of ``dt``.
+
+        Returns
+        -------
+        payouts : dict[str -> np.array]
+            The columns of the matching rows.
+        """
+        return self.payout_tables[table_name].on_ex_date(
+            [int(sid) for sid in sids],
+            _to_seconds(dt),
+        )
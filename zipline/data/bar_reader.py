@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABCMeta, abstractmethod, abstractproperty
+
+import numpy as np
 from six import with_metaclass
 
 
@@ -115,6 +117,41 @@ class BarReader(with_metaclass(ABCMeta, object)):
         """
         pass
 
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the values of many sids at the same dt.
+
+        Parameters
+        ----------
+        sids : iterable[int]
+            The asset identifiers.
+        dt : pd.Timestamp
+            The timestamp for the desired data points.
+        field : string
+            The OHLCV name for the desired data points.
+
+        Returns
+        -------
+        values : np.array[float64|int64]
+            The value of each sid at ``dt``, ``int64`` for 'volume' and
+            ``float64`` otherwise. Missing OHLC values are nan and missing
+            volumes are 0, as with :meth:`get_value`.
+
+        Raises
+        ------
+        NoDataOnDate
+            If :meth:`get_value` would raise for any of the sids.
+
+        Notes
+        -----
+        The default implementation calls :meth:`get_value` for each sid;
+        readers which can gather the values of many sids at once override it.
+        """
+        return np.array(
+            [self.get_value(sid, dt, field) for sid in sids],
+            dtype=np.int64 if field == 'volume' else np.float64,
+        )
+
     @abstractmethod
     def get_last_traded_dt(self, asset, dt):
         """
@@ -1,14 +1,20 @@
 from collections import namedtuple
 import errno
 import os
+import re
 import shutil
+import sqlite3
+from tempfile import mkdtemp
 import warnings
 
+from bcolz import ctable
 from contextlib2 import ExitStack
 import click
+import numpy as np
 import pandas as pd
 from toolz import curry, complement, take
 
+from ..adjustments_index import AdjustmentsIndex
 from ..us_equity_pricing import (
     BcolzDailyBarReader,
     BcolzDailyBarWriter,
@@ -19,6 +25,8 @@ from ..minute_bars import (
     BcolzMinuteBarReader,
     BcolzMinuteBarWriter,
 )
+from ..mmap_daily_bars import MmapDailyBarReader, convert_bcolz_daily_bars
+from ..mmap_minute_bars import MmapMinuteBarReader, convert_bcolz_minute_bars
 from zipline.assets import AssetDBWriter, AssetFinder, ASSET_DB_VERSION
 from zipline.assets.asset_db_migrations import downgrade
 from zipline.utils.cache import (
@@ -61,6 +69,13 @@ def adjustment_db_path(bundle_name, timestr, environ=None):
     )
 
 
+def shared_path(bundle_name, timestr, environ=None):
+    return pth.data_path(
+        shared_relative(bundle_name, timestr, environ),
+        environ=environ,
+    )
+
+
 def cache_path(bundle_name, environ=None):
     return pth.data_path(
         cache_relative(bundle_name, environ),
@@ -90,6 +105,10 @@ def asset_db_relative(bundle_name, timestr, environ=None, db_version=None):
     return bundle_name, timestr, 'assets-%d.sqlite' % db_version
 
 
+def shared_relative(bundle_name, timestr, environ=None):
+    return bundle_name, timestr, 'shared'
+
+
 def to_bundle_ingest_dirname(ts):
     """Convert a pandas Timestamp into the name of the directory for the
     ingestion.
@@ -132,6 +151,121 @@ def ingestions_for_bundle(bundle, environ=None):
     )
 
 
+def _link_bcolz(src, dst):
+    """Hard link the bcolz data at ``src`` into ``dst``, so that the two can
+    be appended to independently.
+
+    Appending to a carray only adds new chunk files and rewrites its last
+    chunk and its metadata, so those files are copied and the other chunk
+    files are shared.
+    """
+    nchunks = {}
+
+    def should_copy(path):
+        dirname, filename = os.path.split(path)
+        match = _bcolz_chunk_filename.match(filename)
+        if os.path.basename(dirname) != 'data' or match is None:
+            return True
+        if dirname not in nchunks:
+            nchunks[dirname] = sum(
+                _bcolz_chunk_filename.match(f) is not None
+                for f in os.listdir(dirname)
+            )
+        return int(match.group(1)) >= nchunks[dirname] - 1
+
+    pth.link_tree(src, dst, should_copy)
+
+
+_bcolz_chunk_filename = re.compile(r'__(\d+)\.blp$')
+
+
+def _materialize_shared(bundle_name, timestr, environ=None):
+    """Write the memory-mappable copy of an ingestion which is read by
+    ``load(..., shared=True)``, unless it already exists.
+
+    The bars are converted to the memory-mapped formats, the adjustments are
+    written as an :class:`~zipline.data.adjustments_index.AdjustmentsIndex`
+    and the asset lifetimes are saved as an ``.npy`` file.
+
+    Returns
+    -------
+    path : str
+        The directory holding the shared data.
+    """
+    path = shared_path(bundle_name, timestr, environ=environ)
+    if os.path.exists(path):
+        return path
+
+    # Build the data next to its final location and rename it into place,
+    # so that processes loading the bundle at the same time never see a
+    # partial copy.
+    tmp = mkdtemp(prefix='.shared', dir=os.path.dirname(path))
+    try:
+        convert_bcolz_daily_bars(
+            daily_equity_path(bundle_name, timestr, environ=environ),
+            os.path.join(tmp, 'daily_equities'),
+        )
+        convert_bcolz_minute_bars(
+            minute_equity_path(bundle_name, timestr, environ=environ),
+            os.path.join(tmp, 'minute_equities'),
+        )
+        conn = sqlite3.connect(
+            adjustment_db_path(bundle_name, timestr, environ=environ),
+        )
+        try:
+            AdjustmentsIndex.from_conn(conn).write(
+                os.path.join(tmp, 'adjustments'),
+            )
+        finally:
+            conn.close()
+        np.save(
+            os.path.join(tmp, 'asset_lifetimes.npy'),
+            AssetFinder(
+                asset_db_path(bundle_name, timestr, environ=environ),
+            )._compute_asset_lifetimes(),
+        )
+        os.rename(tmp, path)
+    except OSError as e:
+        shutil.rmtree(tmp, ignore_errors=True)
+        # Another process finished first.
+        if e.errno not in (errno.EEXIST, errno.ENOTEMPTY) or \
+                not os.path.exists(path):
+            raise
+    except:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+    return path
+
+
+def _last_ingested_session(daily_bars, minute_bar_writer):
+    """The last session with data in an ingestion.
+
+    Parameters
+    ----------
+    daily_bars : bcolz.ctable
+        The ingestion's daily bars.
+    minute_bar_writer : BcolzMinuteBarWriter
+        A writer for the ingestion's minute bars.
+
+    Returns
+    -------
+    last_session : pd.Timestamp
+        The last session with either daily or minute data, or NaT if the
+        ingestion has no data.
+    """
+    days = daily_bars['day']
+    last_sessions = [
+        pd.Timestamp(days[row], unit='s', tz='UTC')
+        for row in daily_bars.attrs['last_row'].values()
+    ]
+    last_sessions.append(minute_bar_writer.last_date_in_output())
+    return max(
+        [session for session in last_sessions if session is not pd.NaT] or
+        [pd.NaT]
+    )
+
+
 RegisteredBundle = namedtuple(
     'RegisteredBundle',
     ['calendar_name',
@@ -339,7 +473,9 @@ def _make_bundle_core():
                environ=os.environ,
                timestamp=None,
                assets_versions=(),
-               show_progress=False):
+               show_progress=False,
+               pool=None,
+               incremental=False):
         """Ingest data for a given bundle.
 
         Parameters
@@ -355,12 +491,30 @@ def _make_bundle_core():
             Versions of the assets db to which to downgrade.
         show_progress : bool, optional
             Tell the ingest function to display the progress where possible.
+        pool : Pool, optional
+            A pool, such as :class:`multiprocessing.Pool`, used by the daily
+            and minute bar writers to convert and write each asset's data
+            concurrently. If not provided, the data is written serially.
+        incremental : bool, optional
+            Start from the most recent ingestion of this bundle instead of
+            from empty writers. The bars of the previous ingestion are hard
+            linked into the new one where possible, and its asset and
+            adjustment databases are copied. The ingest function is then
+            passed a ``start_session`` of the first session after the last
+            ingested session, and should only write bars from that session
+            on. Assets and adjustments which are written again replace the
+            previous ones. If the bundle has not been ingested before, this
+            does a full ingestion.
         """
         try:
             bundle = bundles[name]
         except KeyError:
             raise UnknownBundle(name)
 
+        if incremental and not bundle.create_writers:
+            raise ValueError('Need to ingest a bundle that creates writers in'
+                             ' order to ingest incrementally.')
+
         calendar = get_calendar(bundle.calendar_name)
 
         start_session = bundle.start_session
@@ -376,6 +530,16 @@ def _make_bundle_core():
             timestamp = pd.Timestamp.utcnow()
         timestamp = timestamp.tz_convert('utc').tz_localize(None)
 
+        previous = None
+        if incremental:
+            try:
+                previous = os.path.basename(
+                    most_recent_data(name, timestamp, environ=environ),
+                )
+            except ValueError:
+                # This bundle has not been ingested before.
+                pass
+
         timestr = to_bundle_ingest_dirname(timestamp)
         cachepath = cache_path(name, environ=environ)
         pth.ensure_directory(pth.data_path([name, timestr], environ=environ))
@@ -386,46 +550,103 @@ def _make_bundle_core():
             # cache directory if the load fails in the middle
             if bundle.create_writers:
                 wd = stack.enter_context(working_dir(
-                    pth.data_path([], environ=environ))
-                )
+                    pth.data_path([], environ=environ),
+                    # Work next to the ingestions so that the files can be
+                    # hard linked between them.
+                    prefix='.',
+                    dir=pth.data_path([name], environ=environ),
+                ))
                 daily_bars_path = wd.ensure_dir(
                     *daily_equity_relative(
                         name, timestr, environ=environ,
                     )
                 )
-                daily_bar_writer = BcolzDailyBarWriter(
-                    daily_bars_path,
-                    calendar,
-                    start_session,
-                    end_session,
-                )
-                # Do an empty write to ensure that the daily ctables exist
-                # when we create the SQLiteAdjustmentWriter below. The
-                # SQLiteAdjustmentWriter needs to open the daily ctables so
-                # that it can compute the adjustment ratios for the dividends.
-
-                daily_bar_writer.write(())
-                minute_bar_writer = BcolzMinuteBarWriter(
-                    wd.ensure_dir(*minute_equity_relative(
-                        name, timestr, environ=environ)
-                    ),
-                    calendar,
-                    start_session,
-                    end_session,
-                    minutes_per_day=bundle.minutes_per_day,
-                )
+                minute_bars_path = wd.ensure_dir(*minute_equity_relative(
+                    name, timestr, environ=environ,
+                ))
                 assets_db_path = wd.getpath(*asset_db_relative(
                     name, timestr, environ=environ,
                 ))
+                adjustments_path = wd.getpath(*adjustment_db_relative(
+                    name, timestr, environ=environ,
+                ))
+
+                if previous is None:
+                    daily_bar_writer = BcolzDailyBarWriter(
+                        daily_bars_path,
+                        calendar,
+                        start_session,
+                        end_session,
+                        pool=pool,
+                    )
+                    # Do an empty write to ensure that the daily ctables
+                    # exist when we create the SQLiteAdjustmentWriter below.
+                    # The SQLiteAdjustmentWriter needs to open the daily
+                    # ctables so that it can compute the adjustment ratios
+                    # for the dividends.
+
+                    daily_bar_writer.write(())
+                    minute_bar_writer = BcolzMinuteBarWriter(
+                        minute_bars_path,
+                        calendar,
+                        start_session,
+                        end_session,
+                        minutes_per_day=bundle.minutes_per_day,
+                        pool=pool,
+                    )
+                else:
+                    previous_daily_bars = ctable(
+                        rootdir=daily_equity_path(
+                            name, previous, environ=environ,
+                        ),
+                        mode='r',
+                    )
+                    # The daily bars are rewritten with the new data, but
+                    # the SQLiteAdjustmentWriter needs them to exist.
+                    _link_bcolz(previous_daily_bars.rootdir, daily_bars_path)
+                    daily_bar_writer = BcolzDailyBarWriter(
+                        daily_bars_path,
+                        calendar,
+                        start_session,
+                        end_session,
+                        pool=pool,
+                        append_to=previous_daily_bars,
+                    )
+                    _link_bcolz(
+                        minute_equity_path(name, previous, environ=environ),
+                        minute_bars_path,
+                    )
+                    minute_bar_writer = BcolzMinuteBarWriter.open(
+                        minute_bars_path,
+                        end_session,
+                        pool=pool,
+                    )
+                    shutil.copy2(
+                        asset_db_path(name, previous, environ=environ),
+                        assets_db_path,
+                    )
+                    shutil.copy2(
+                        adjustment_db_path(name, previous, environ=environ),
+                        adjustments_path,
+                    )
+
+                    last_session = _last_ingested_session(
+                        previous_daily_bars,
+                        minute_bar_writer,
+                    )
+                    if last_session is not pd.NaT:
+                        start_session = calendar.next_session_label(
+                            last_session,
+                        )
+
                 asset_db_writer = AssetDBWriter(assets_db_path)
 
                 adjustment_db_writer = stack.enter_context(
                     SQLiteAdjustmentWriter(
-                        wd.getpath(*adjustment_db_relative(
-                            name, timestr, environ=environ)),
+                        adjustments_path,
                         BcolzDailyBarReader(daily_bars_path),
                         calendar.all_sessions,
-                        overwrite=True,
+                        overwrite=previous is None,
                     )
                 )
             else:
@@ -498,7 +719,7 @@ def _make_bundle_core():
                 ),
             )
 
-    def load(name, environ=os.environ, timestamp=None):
+    def load(name, environ=os.environ, timestamp=None, shared=False):
         """Loads a previously ingested bundle.
 
         Parameters
@@ -510,6 +731,13 @@ def _make_bundle_core():
         timestamp : datetime, optional
             The timestamp of the data to lookup.
             Defaults to the current time.
+        shared : bool, optional
+            Read the bars, adjustments and asset lifetimes from memory-mapped
+            files instead of decompressing or querying them in each process.
+            The files are written next to the ingestion by the first load
+            which asks for them, and every process which loads the ingestion
+            afterwards maps the same pages of the OS page cache read-only.
+            This makes starting many workers on the same bundle cheap.
 
         Returns
         -------
@@ -519,6 +747,29 @@ def _make_bundle_core():
         if timestamp is None:
             timestamp = pd.Timestamp.utcnow()
         timestr = most_recent_data(name, timestamp, environ=environ)
+        if shared:
+            path = _materialize_shared(name, timestr, environ=environ)
+            return BundleData(
+                asset_finder=AssetFinder(
+                    asset_db_path(name, timestr, environ=environ),
+                    asset_lifetimes=np.load(
+                        os.path.join(path, 'asset_lifetimes.npy'),
+                        mmap_mode='r',
+                    ).view(np.recarray),
+                ),
+                equity_minute_bar_reader=MmapMinuteBarReader(
+                    os.path.join(path, 'minute_equities'),
+                ),
+                equity_daily_bar_reader=MmapDailyBarReader(
+                    os.path.join(path, 'daily_equities'),
+                ),
+                adjustment_reader=SQLiteAdjustmentReader(
+                    adjustment_db_path(name, timestr, environ=environ),
+                    index=AdjustmentsIndex.read(
+                        os.path.join(path, 'adjustments'),
+                    ),
+                ),
+            )
         return BundleData(
             asset_finder=AssetFinder(
                 asset_db_path(name, timestr, environ=environ),
@@ -1,20 +1,27 @@
 """
 Module for building a complete dataset from local directory with csv files.
 """
+from multiprocessing import Pool
 import os
 import sys
 
 import logbook
-from numpy import empty
-from pandas import DataFrame, read_csv, Index, Timedelta, NaT
+import numpy as np
+from pandas import DataFrame, read_csv, read_hdf, Timedelta, to_datetime
+from six.moves import zip
 
 from zipline.utils.calendars import register_calendar_alias
 from zipline.utils.cli import maybe_show_progress
+from zipline.utils.pool import SequentialPool, imap_bounded
 
 logger = logbook.Logger(__name__)
 
+# The maximum number of files that are being parsed, or waiting to be parsed,
+# when parsing with multiple processes.
+MAX_PENDING_FILES = 64
 
-def csvdir_equities(tframes=['daily'], start=None, end=None):
+
+def csvdir_equities(tframes=['daily'], start=None, end=None, processes=None):
     """
     Generate an ingest function for custom data bundle
 
@@ -28,6 +35,9 @@ def csvdir_equities(tframes=['daily'], start=None, end=None):
     end : datetime, optional
         The end date to query for. By default this pulls the full history
         for the calendar.
+    processes : int, optional
+        The number of processes used to parse the csv files. By default the
+        files are parsed in the ingesting process.
     Returns
     -------
     ingest : callable
@@ -48,9 +58,75 @@ def csvdir_equities(tframes=['daily'], start=None, end=None):
         daily/<symbol>.cvs files
         minute/<symbol>.csv files
     for each symbol.
+
+    Instead of a directory, a time frame may also be stored as a single file
+    with the data for all of the symbols:
+        daily.csv or daily.h5
+        minute.csv or minute.h5
+    with a 'symbol' column next to the date and pricing columns. The ``.h5``
+    files must hold a single pandas table in HDF5 format. This is much faster
+    to ingest than one file per symbol.
+    """
+
+    return CSVDIRBundle(tframes, start, end, processes).ingest
+
+
+def _read_symbol_csv(path):
+    """Read the pricing data for one symbol.
+    """
+    return read_csv(path,
+                    parse_dates=[0], infer_datetime_format=True,
+                    index_col=0).sort_index()
+
+
+def _read_symbol_csvs(ddir, symbols, pool):
+    """Read the file for each symbol in ``ddir`` on ``pool``.
+
+    Returns
+    -------
+    frames : iterator[pd.DataFrame]
+        The pricing data for each symbol, in order.
     """
+    return imap_bounded(
+        pool,
+        _read_symbol_csv,
+        (os.path.join(ddir, '%s.csv' % symbol) for symbol in symbols),
+        max_pending=MAX_PENDING_FILES,
+    )
 
-    return CSVDIRBundle(tframes, start, end).ingest
+
+def _split_long_frame(data):
+    """Split a frame with the data for many symbols into one frame per
+    symbol.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The data for all of the symbols. The first column holds the dates,
+        and the 'symbol' column holds the symbols.
+
+    Returns
+    -------
+    symbols : list[str]
+        The sorted symbols.
+    frames : iterator[pd.DataFrame]
+        The pricing data for each symbol, in the order of ``symbols``,
+        indexed by date.
+    """
+    date_column = data.columns[0]
+    data[date_column] = to_datetime(data[date_column],
+                                    infer_datetime_format=True)
+    data = data.sort_values(['symbol', date_column])
+
+    symbol_values = data.pop('symbol').values.astype(str)
+    data = data.set_index(date_column)
+    symbols, starts = np.unique(symbol_values, return_index=True)
+    stops = np.append(starts[1:], len(symbol_values))
+
+    return list(symbols), (
+        data.iloc[start:stop].copy()
+        for start, stop in zip(starts, stops)
+    )
 
 
 class CSVDIRBundle:
@@ -59,15 +135,15 @@ class CSVDIRBundle:
     from _pricing_iter method.
     """
 
-    def __init__(self, tframes, start, end):
+    def __init__(self, tframes, start, end, processes=None):
         self.tframes = tframes
         self.start = start
         self.end = end
+        self.processes = processes
 
         self.show_progress = None
         self.symbols = None
         self.metadata = None
-        self.csvdir = None
 
         self.splits = None
         self.dividends = None
@@ -76,7 +152,7 @@ class CSVDIRBundle:
                daily_bar_writer, adjustment_writer, calendar, start_session,
                end_session, cache, show_progress, output_dir):
 
-        csvdir = os.environ.get('CSVDIR')
+        csvdir = environ.get('CSVDIR')
         if not csvdir:
             logger.error("CSVDIR environment variable is not set")
             sys.exit(1)
@@ -87,98 +163,152 @@ class CSVDIRBundle:
 
         for tframe in self.tframes:
             ddir = os.path.join(csvdir, tframe)
-            if not os.path.isdir(ddir):
+            if not (os.path.isdir(ddir) or self._long_path(csvdir, tframe)):
                 logger.error("%s is not a directory" % ddir)
 
-        for tframe in self.tframes:
-            ddir = os.path.join(csvdir, tframe)
-
-            self.symbols = sorted(item.split('.csv')[0]
-                                  for item in os.listdir(ddir)
-                                  if item.endswith('.csv'))
-            if not self.symbols:
-                logger.error("no <symbol>.csv files found in %s" % ddir)
-                sys.exit(1)
-
-            self.csvdir = ddir
-
-            dtype = [('start_date', 'datetime64[ns]'),
-                     ('end_date', 'datetime64[ns]'),
-                     ('auto_close_date', 'datetime64[ns]'),
-                     ('symbol', 'object')]
-            self.metadata = DataFrame(empty(len(self.symbols), dtype=dtype))
-
-            self.show_progress = show_progress
-
-            if tframe == 'minute':
-                writer = minute_bar_writer
-            else:
-                writer = daily_bar_writer
-
-            writer.write(self._pricing_iter(), show_progress=show_progress)
-
-            # Hardcode the exchange to "CSVDIR" for all assets and (elsewhere)
-            # register "CSVDIR" to resolve to the NYSE calendar, because these
-            # are all equities and thus can use the NYSE calendar.
-            self.metadata['exchange'] = "CSVDIR"
+        self.show_progress = show_progress
+        self.splits = []
+        self.dividends = []
+
+        if self.processes:
+            pool = Pool(self.processes)
+        else:
+            pool = SequentialPool()
+
+        try:
+            for tframe in self.tframes:
+                ddir = os.path.join(csvdir, tframe)
+                long_path = self._long_path(csvdir, tframe)
+                if long_path is not None:
+                    if long_path.endswith('.h5'):
+                        data = read_hdf(long_path)
+                    else:
+                        data = read_csv(long_path)
+                    self.symbols, frames = _split_long_frame(data)
+                    location = long_path
+                else:
+                    self.symbols = sorted(item.split('.csv')[0]
+                                          for item in os.listdir(ddir)
+                                          if item.endswith('.csv'))
+                    frames = _read_symbol_csvs(ddir, self.symbols, pool)
+                    location = ddir
+
+                if not self.symbols:
+                    logger.error("no <symbol>.csv files found in %s" %
+                                 location)
+                    sys.exit(1)
+
+                if tframe == 'minute':
+                    writer = minute_bar_writer
+                else:
+                    writer = daily_bar_writer
+
+                writer.write(self._pricing_iter(frames),
+                             show_progress=show_progress)
+        finally:
+            if self.processes:
+                pool.terminate()
+
+        # Hardcode the exchange to "CSVDIR" for all assets and (elsewhere)
+        # register "CSVDIR" to resolve to the NYSE calendar, because these
+        # are all equities and thus can use the NYSE calendar.
+        self.metadata['exchange'] = "CSVDIR"
 
         asset_db_writer.write(equities=self.metadata)
 
-        adjustment_writer.write(splits=self.splits, dividends=self.dividends)
-
-    def _pricing_iter(self):
-        with maybe_show_progress(self.symbols, self.show_progress,
-                                 label='Loading custom pricing data: ') as it:
-            for sid, symbol in enumerate(it):
+        adjustment_writer.write(
+            splits=self._concat_adjustments(
+                self.splits,
+                ['effective_date', 'ratio', 'sid'],
+            ),
+            dividends=self._concat_adjustments(
+                self.dividends,
+                ['ex_date', 'record_date', 'declared_date', 'pay_date',
+                 'amount', 'sid'],
+            ),
+        )
+
+    @staticmethod
+    def _long_path(csvdir, tframe):
+        """The path to the single file with the data for all symbols for
+        ``tframe``, or None if there is no such file.
+        """
+        for extension in '.csv', '.h5':
+            path = os.path.join(csvdir, tframe + extension)
+            if os.path.isfile(path):
+                return path
+        return None
+
+    @staticmethod
+    def _concat_adjustments(chunks, columns):
+        """Concatenate the adjustments collected for each symbol.
+
+        Adjustments which were found in more than one time frame are only
+        kept once.
+        """
+        if not chunks:
+            return None
+        adjustments = DataFrame({
+            column: np.concatenate([chunk[column] for chunk in chunks])
+            for column in columns
+        }, columns=columns)
+        return adjustments.drop_duplicates(
+            subset=[columns[0], 'sid'],
+        ).reset_index(drop=True)
+
+    def _pricing_iter(self, frames):
+        # The metadata is collected in arrays, and the adjustments in lists
+        # of arrays, which are only turned into frames once all of the data
+        # has been read.
+        nsymbols = len(self.symbols)
+        start_dates = np.empty(nsymbols, dtype='datetime64[ns]')
+        end_dates = np.empty(nsymbols, dtype='datetime64[ns]')
+
+        with maybe_show_progress(zip(self.symbols, frames),
+                                 self.show_progress,
+                                 label='Loading custom pricing data: ',
+                                 length=nsymbols) as it:
+            for sid, (symbol, dfr) in enumerate(it):
                 logger.debug('%s: sid %s' % (symbol, sid))
 
-                dfr = read_csv(os.path.join(self.csvdir, '%s.csv' % symbol),
-                               parse_dates=[0], infer_datetime_format=True,
-                               index_col=0).sort_index()
-
                 # the start date is the date of the first trade and
                 # the end date is the date of the last trade
-                start_date = dfr.index[0]
-                end_date = dfr.index[-1]
-
-                # The auto_close date is the day after the last trade.
-                ac_date = end_date + Timedelta(days=1)
-                self.metadata.iloc[sid] = start_date, end_date, ac_date, symbol
+                start_dates[sid] = dfr.index[0]
+                end_dates[sid] = dfr.index[-1]
 
                 if 'split' in dfr.columns:
-                    if self.splits is None:
-                        self.splits = DataFrame()
-                    tmp = dfr[dfr['split'] != 1.0]['split']
-                    split = DataFrame(data=tmp.index.tolist(),
-                                      columns=['effective_date'])
-                    split['ratio'] = tmp.tolist()
-                    split['sid'] = sid
-
-                    index = Index(range(self.splits.shape[0],
-                                        self.splits.shape[0] + split.shape[0]))
-                    split.set_index(index, inplace=True)
-                    self.splits = self.splits.append(split)
+                    split = dfr['split'].values
+                    mask = split != 1.0
+                    self.splits.append({
+                        'effective_date': dfr.index.values[mask],
+                        'ratio': split[mask],
+                        'sid': np.full(mask.sum(), sid, dtype=int),
+                    })
 
                 if 'dividend' in dfr.columns:
-                    if self.dividends is None:
-                        self.dividends = DataFrame()
                     # ex_date   amount  sid record_date declared_date pay_date
-                    tmp = dfr[dfr['dividend'] != 0.0]['dividend']
-                    div = DataFrame(data=tmp.index.tolist(),
-                                    columns=['ex_date'])
-                    div['record_date'] = NaT
-                    div['declared_date'] = NaT
-                    div['pay_date'] = NaT
-                    div['amount'] = tmp.tolist()
-                    div['sid'] = sid
-                    ind = Index(range(self.dividends.shape[0],
-                                      self.dividends.shape[0] + div.shape[0]))
-                    div.set_index(ind, inplace=True)
-                    if self.dividends is None:
-                        self.dividends = DataFrame()
-                    self.dividends = self.dividends.append(div)
+                    dividend = dfr['dividend'].values
+                    mask = dividend != 0.0
+                    count = mask.sum()
+                    nat = np.full(count, 'NaT', dtype='datetime64[ns]')
+                    self.dividends.append({
+                        'ex_date': dfr.index.values[mask],
+                        'record_date': nat,
+                        'declared_date': nat,
+                        'pay_date': nat,
+                        'amount': dividend[mask],
+                        'sid': np.full(count, sid, dtype=int),
+                    })
 
                 yield sid, dfr
 
+        self.metadata = DataFrame({
+            'start_date': start_dates,
+            'end_date': end_dates,
+            # The auto_close date is the day after the last trade.
+            'auto_close_date': end_dates + Timedelta(days=1).to_timedelta64(),
+            'symbol': self.symbols,
+        }, columns=['start_date', 'end_date', 'auto_close_date', 'symbol'])
+
 
 register_calendar_alias("CSVDIR", "NYSE")
@@ -53,7 +53,10 @@ from zipline.data.history_loader import (
     DailyHistoryLoader,
     MinuteHistoryLoader,
 )
-from zipline.data.us_equity_pricing import NoDataOnDate
+from zipline.data.us_equity_pricing import (
+    CorporateActionCalendar,
+    NoDataOnDate,
+)
 
 from zipline.utils.math_utils import (
     nansum,
@@ -159,6 +162,10 @@ class DataPortal(object):
 
         self._adjustment_reader = adjustment_reader
 
+        # The splits and dividends of the sessions being simulated, see
+        # load_corporate_actions.
+        self._corporate_actions = None
+
         # caches of sid -> adjustment list
         self._splits_dict = {}
         self._mergers_dict = {}
@@ -526,8 +533,68 @@ class DataPortal(object):
 
         if assets_is_scalar:
             return get_single_asset_value(assets)
+
+        if data_frequency == 'minute' and field in OHLCVP_FIELDS:
+            assets = list(assets)
+            if all(isinstance(asset, (Equity, Future)) for asset in assets):
+                values = self._get_minute_spot_values(
+                    assets, field, dt, session_label,
+                )
+                if values is not None:
+                    return values
+
+        return list(map(get_single_asset_value, assets))
+
+    def _get_minute_spot_values(self, assets, field, dt, session_label):
+        """
+        The spot values of ``field`` for many assets at the minute ``dt``.
+
+        The values of all of the assets are gathered with a single
+        ``get_values`` call on the minute reader per column. For 'price', only
+        the assets which did not trade at ``dt`` are forward filled one at a
+        time.
+
+        Returns
+        -------
+        values : list or None
+            The value of each asset, the same as calling ``get_spot_value``
+            for each asset, or None if the reader has no data for some of the
+            assets at ``dt``, in which case the values have to be looked up
+            one asset at a time.
+        """
+        alive = np.array([
+            not (dt < asset.start_date or session_label > asset.end_date)
+            for asset in assets
+        ], dtype=bool)
+        live_assets = [
+            asset for asset, is_alive in zip(assets, alive) if is_alive
+        ]
+
+        if field == 'volume':
+            out = np.zeros(len(assets), dtype=int64)
         else:
-            return list(map(get_single_asset_value, assets))
+            out = np.full(len(assets), nan)
+        if not live_assets:
+            return out.tolist()
+
+        reader = self._get_pricing_reader('minute')
+        column = 'close' if field == 'price' else field
+        try:
+            values = reader.get_values(live_assets, dt, column)
+            if field == 'price':
+                traded = reader.get_values(live_assets, dt, 'volume') > 0
+        except NoDataOnDate:
+            return None
+
+        if field == 'price':
+            # Assets which did not trade at dt take the last traded close.
+            for ix in np.flatnonzero(~traded):
+                values[ix] = self._get_minute_spot_value(
+                    live_assets[ix], 'close', dt, ffill=True,
+                )
+
+        out[alive] = values
+        return out.tolist()
 
     def get_adjustments(self, assets, field, dt, perspective_dt):
         """
@@ -1136,6 +1203,39 @@ class DataPortal(object):
 
             self._asset_end_dates[sid] = asset.end_date
 
+    def load_corporate_actions(self, start_session, end_session):
+        """
+        Read the splits and dividends which take effect between the given
+        sessions from the adjustment reader, so that looking them up during
+        a simulation of those sessions does not query the adjustments db.
+
+        Parameters
+        ----------
+        start_session : pd.Timestamp
+            The first session of the simulation.
+        end_session : pd.Timestamp
+            The last session of the simulation.
+        """
+        if self._adjustment_reader is None:
+            self._corporate_actions = None
+        else:
+            self._corporate_actions = CorporateActionCalendar(
+                self._adjustment_reader,
+                start_session,
+                end_session,
+            )
+
+    def _corporate_actions_reader(self, dt):
+        """
+        The object to look up the splits and dividends on ``dt`` in; the
+        calendar built by ``load_corporate_actions`` if it holds ``dt``,
+        otherwise the adjustment reader.
+        """
+        corporate_actions = self._corporate_actions
+        if corporate_actions is not None and corporate_actions.covers(dt):
+            return corporate_actions
+        return self._adjustment_reader
+
     def get_splits(self, assets, dt):
         """
         Returns any splits for the given sids and the given dt.
@@ -1156,19 +1256,9 @@ class DataPortal(object):
         if self._adjustment_reader is None or not assets:
             return []
 
-        # convert dt to # of seconds since epoch, because that's what we use
-        # in the adjustments db
-        seconds = int(dt.value / 1e9)
-
-        splits = self._adjustment_reader.conn.execute(
-            "SELECT sid, ratio FROM SPLITS WHERE effective_date = ?",
-            (seconds,)).fetchall()
-
-        splits = [split for split in splits if split[0] in assets]
-        splits = [(self.asset_finder.retrieve_asset(split[0]), split[1])
-                  for split in splits]
-
-        return splits
+        splits = self._corporate_actions_reader(dt).get_splits(assets, dt)
+        return [(self.asset_finder.retrieve_asset(sid), ratio)
+                for sid, ratio in splits]
 
     def get_stock_dividends(self, sid, trading_days):
         """
@@ -1195,24 +1285,31 @@ class DataPortal(object):
         if len(trading_days) == 0:
             return []
 
-        start_dt = trading_days[0].value / 1e9
-        end_dt = trading_days[-1].value / 1e9
+        corporate_actions = self._corporate_actions_reader(trading_days[0])
+        if isinstance(corporate_actions, CorporateActionCalendar):
+            dividends = corporate_actions.get_stock_dividend_rows(
+                sid, trading_days[0], trading_days[-1],
+            )
+        else:
+            start_dt = trading_days[0].value / 1e9
+            end_dt = trading_days[-1].value / 1e9
 
-        dividends = self._adjustment_reader.conn.execute(
-            "SELECT * FROM stock_dividend_payouts WHERE sid = ? AND "
-            "ex_date > ? AND pay_date < ?", (int(sid), start_dt, end_dt,)).\
-            fetchall()
+            dividends = self._adjustment_reader.conn.execute(
+                "SELECT declared_date, ex_date, pay_date, payment_sid, "
+                "ratio, record_date, sid FROM stock_dividend_payouts "
+                "WHERE sid = ? AND ex_date > ? AND pay_date < ?",
+                (int(sid), start_dt, end_dt,)).fetchall()
 
         dividend_info = []
         for dividend_tuple in dividends:
             dividend_info.append({
-                "declared_date": dividend_tuple[1],
-                "ex_date": pd.Timestamp(dividend_tuple[2], unit="s"),
-                "pay_date": pd.Timestamp(dividend_tuple[3], unit="s"),
-                "payment_sid": dividend_tuple[4],
-                "ratio": dividend_tuple[5],
-                "record_date": pd.Timestamp(dividend_tuple[6], unit="s"),
-                "sid": dividend_tuple[7]
+                "declared_date": dividend_tuple[0],
+                "ex_date": pd.Timestamp(dividend_tuple[1], unit="s"),
+                "pay_date": pd.Timestamp(dividend_tuple[2], unit="s"),
+                "payment_sid": dividend_tuple[3],
+                "ratio": dividend_tuple[4],
+                "record_date": pd.Timestamp(dividend_tuple[5], unit="s"),
+                "sid": dividend_tuple[6]
             })
 
         return dividend_info
@@ -96,6 +96,26 @@ class AssetDispatchBarReader(with_metaclass(ABCMeta)):
         r = self._readers[type(asset)]
         return r.get_value(asset, dt, field)
 
+    def get_values(self, sids, dt, field):
+        asset_types = self._asset_types
+        sid_groups = {t: [] for t in asset_types}
+        out_pos = {t: [] for t in asset_types}
+
+        assets = self._asset_finder.retrieve_all(sids)
+
+        for i, asset in enumerate(assets):
+            t = type(asset)
+            sid_groups[t].append(asset)
+            out_pos[t].append(i)
+
+        out = self._make_raw_array_out(field, len(sids))
+        for t in asset_types:
+            if sid_groups[t]:
+                out[out_pos[t]] = self._readers[t].get_values(
+                    sid_groups[t], dt, field,
+                )
+        return out
+
     def get_last_traded_dt(self, asset, dt):
         r = self._readers[type(asset)]
         return r.get_last_traded_dt(asset, dt)
@@ -18,20 +18,19 @@ from abc import (
     abstractproperty,
 )
 
-from numpy import concatenate
+from numpy import asarray, concatenate
 from lru import LRU
 from pandas import isnull
 from pandas.tslib import normalize_date
-from toolz import sliding_window
+from toolz import groupby, sliding_window
 
-from six import with_metaclass
+from six import iteritems, with_metaclass
 
 from zipline.assets import Equity, Future
 from zipline.assets.continuous_futures import ContinuousFuture
 from zipline.lib._int64window import AdjustedArrayWindow as Int64Window
 from zipline.lib._float64window import AdjustedArrayWindow as Float64Window
 from zipline.lib.adjustment import Float64Multiply, Float64Add
-from zipline.utils.cache import ExpiringCache
 from zipline.utils.math_utils import number_of_decimal_places
 from zipline.utils.memoize import lazyval
 from zipline.utils.numpy_utils import float64_dtype
@@ -41,6 +40,28 @@ from zipline.utils.pandas_utils import find_in_sorted_index
 DEFAULT_ASSET_PRICE_DECIMALS = 3
 
 
+def _load_adjustments_by_column(reader, columns, dts, assets):
+    """
+    Implementation of ``load_adjustments`` for the history adjustment readers,
+    which load the adjustments for one asset at a time with
+    ``_get_adjustments_in_range``.
+    """
+    out = [None] * len(columns)
+    for i, column in enumerate(columns):
+        adjs = {}
+        for col, asset in enumerate(assets):
+            asset_adjs = reader._get_adjustments_in_range(
+                asset, dts, column, col,
+            )
+            for loc, loc_adjs in iteritems(asset_adjs):
+                try:
+                    adjs[loc].extend(loc_adjs)
+                except KeyError:
+                    adjs[loc] = loc_adjs
+        out[i] = adjs
+    return out
+
+
 class HistoryCompatibleUSEquityAdjustmentReader(object):
 
     def __init__(self, adjustment_reader):
@@ -53,17 +74,11 @@ class HistoryCompatibleUSEquityAdjustmentReader(object):
         adjustments : list[dict[int -> Adjustment]]
             A list, where each element corresponds to the `columns`, of
             mappings from index to adjustment objects to apply at that index.
+            The adjustments for ``assets[i]`` apply to column ``i``.
         """
-        out = [None] * len(columns)
-        for i, column in enumerate(columns):
-            adjs = {}
-            for asset in assets:
-                adjs.update(self._get_adjustments_in_range(
-                    asset, dts, column))
-            out[i] = adjs
-        return out
-
-    def _get_adjustments_in_range(self, asset, dts, field):
+        return _load_adjustments_by_column(self, columns, dts, assets)
+
+    def _get_adjustments_in_range(self, asset, dts, field, col=0):
         """
         Get the Float64Multiply objects to pass to an AdjustedArrayWindow.
 
@@ -86,6 +101,8 @@ class HistoryCompatibleUSEquityAdjustmentReader(object):
             The dts for which adjustment data is needed.
         field : str
             OHLCV field for which to get the adjustments.
+        col : int, optional
+            The column of the window holding the data for ``asset``.
 
         Returns
         -------
@@ -106,8 +123,8 @@ class HistoryCompatibleUSEquityAdjustmentReader(object):
                     adj_loc = end_loc
                     mult = Float64Multiply(0,
                                            end_loc - 1,
-                                           0,
-                                           0,
+                                           col,
+                                           col,
                                            m[1])
                     try:
                         adjs[adj_loc].append(mult)
@@ -122,8 +139,8 @@ class HistoryCompatibleUSEquityAdjustmentReader(object):
                     adj_loc = end_loc
                     mult = Float64Multiply(0,
                                            end_loc - 1,
-                                           0,
-                                           0,
+                                           col,
+                                           col,
                                            d[1])
                     try:
                         adjs[adj_loc].append(mult)
@@ -142,8 +159,8 @@ class HistoryCompatibleUSEquityAdjustmentReader(object):
                 adj_loc = end_loc
                 mult = Float64Multiply(0,
                                        end_loc - 1,
-                                       0,
-                                       0,
+                                       col,
+                                       col,
                                        ratio)
                 try:
                     adjs[adj_loc].append(mult)
@@ -177,21 +194,16 @@ class ContinuousFutureAdjustmentReader(object):
         adjustments : list[dict[int -> Adjustment]]
             A list, where each element corresponds to the `columns`, of
             mappings from index to adjustment objects to apply at that index.
+            The adjustments for ``assets[i]`` apply to column ``i``.
         """
-        out = [None] * len(columns)
-        for i, column in enumerate(columns):
-            adjs = {}
-            for asset in assets:
-                adjs.update(self._get_adjustments_in_range(
-                    asset, dts, column))
-            out[i] = adjs
-        return out
+        return _load_adjustments_by_column(self, columns, dts, assets)
 
     def _make_adjustment(self,
                          adjustment_type,
                          front_close,
                          back_close,
-                         end_loc):
+                         end_loc,
+                         col=0):
         adj_base = back_close - front_close
         if adjustment_type == 'mul':
             adj_value = 1.0 + adj_base / front_close
@@ -201,11 +213,11 @@ class ContinuousFutureAdjustmentReader(object):
             adj_class = Float64Add
         return adj_class(0,
                          end_loc,
-                         0,
-                         0,
+                         col,
+                         col,
                          adj_value)
 
-    def _get_adjustments_in_range(self, cf, dts, field):
+    def _get_adjustments_in_range(self, cf, dts, field, col=0):
         if field == 'volume' or field == 'sid':
             return {}
         if cf.adjustment is None:
@@ -248,7 +260,8 @@ class ContinuousFutureAdjustmentReader(object):
             adj = self._make_adjustment(cf.adjustment,
                                         front_close,
                                         back_close,
-                                        end_loc)
+                                        end_loc,
+                                        col)
             try:
                 adjs[adj_loc].append(adj)
             except KeyError:
@@ -266,16 +279,43 @@ class SlidingWindow(object):
     window : AdjustedArrayWindow
        Window of pricing data with prefetched values beyond the current
        simulation dt.
+    size : int
+       The number of rows in each requested window.
     cal_start : int
        Index in the overall calendar at which the window starts.
+    offset : int
+       The offset of the first window from ``cal_start``.
+    assets : list[Asset], optional
+       The assets whose data is in the columns of ``window``.
+    rounding_places : int, optional
+       The number of decimal places to which ``window`` rounds its output.
     """
 
-    def __init__(self, window, size, cal_start, offset):
+    def __init__(self,
+                 window,
+                 size,
+                 cal_start,
+                 offset,
+                 assets=None,
+                 rounding_places=None):
+        self.size = size
+        self.offset = offset
+        self.assets = assets
+        self.rounding_places = rounding_places
+        self.reset(window, cal_start)
+
+    def reset(self, window, cal_start):
+        """
+        Replace the underlying AdjustedArrayWindow, which starts at
+        ``cal_start``.
+        """
         self.window = window
         self.cal_start = cal_start
         self.current = next(window)
-        self.offset = offset
-        self.most_recent_ix = self.cal_start + size
+        self.anchor = self.size + self.offset
+        self.most_recent_ix = self.cal_start + self.size
+        # The calendar index of the last row of prefetched data.
+        self.last_ix = cal_start + window.data.shape[0] - 1
 
     def get(self, end_ix):
         """
@@ -290,10 +330,43 @@ class SlidingWindow(object):
         target = end_ix - self.cal_start - self.offset + 1
         self.current = self.window.seek(target)
 
+        self.anchor = target
         self.most_recent_ix = end_ix
         return self.current
 
 
+class SlidingWindowColumn(object):
+    """
+    A single asset's column of a SlidingWindow shared by several assets.
+
+    Parameters
+    ----------
+    block : SlidingWindow
+       The window over the data for all of the assets in the block.
+    col : int
+       The column of ``block`` holding the data for this asset.
+    """
+
+    def __init__(self, block, col):
+        self.block = block
+        self.col = col
+
+    @property
+    def most_recent_ix(self):
+        return self.block.most_recent_ix
+
+    def get(self, end_ix):
+        """
+        Returns
+        -------
+        out : A np.ndarray of this asset's pricing up to end_ix after
+              adjustments and rounding have been applied, as a view of the
+              block.
+        """
+        col = self.col
+        return self.block.get(end_ix)[:, col:col + 1]
+
+
 class HistoryLoader(with_metaclass(ABCMeta)):
     """
     Loader for sliding history windows, with support for adjustments.
@@ -330,7 +403,7 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                                                  roll_finders,
                                                  self._frequency)
         self._window_blocks = {
-            field: ExpiringCache(LRU(sid_cache_size))
+            field: LRU(sid_cache_size)
             for field in self.FIELDS
         }
         self._prefetch_length = prefetch_length
@@ -362,6 +435,121 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                     return number_of_decimal_places(contract.tick_size)
         return DEFAULT_ASSET_PRICE_DECIMALS
 
+    def _prefetch_end_ix(self, end_ix):
+        return min(end_ix + self._prefetch_length, len(self._calendar) - 1)
+
+    def _load_block_array(self, start_ix, end_ix, assets, field):
+        """
+        Load the raw data for ``assets`` between the calendar indices
+        ``start_ix`` and ``end_ix``, inclusive.
+        """
+        array = self._array(
+            self._calendar[start_ix:end_ix + 1],
+            assets,
+            field,
+        )
+        if field == 'volume':
+            array = array.astype(float64_dtype)
+        return array
+
+    def _load_block_adjustments(self,
+                                start_ix,
+                                end_ix,
+                                assets,
+                                field,
+                                is_perspective_after):
+        """
+        Load the adjustments for a window over ``assets`` whose data spans
+        the calendar indices ``start_ix`` through ``end_ix``, inclusive.
+        """
+        adj_reader = self._adjustment_readers.get(type(assets[0]))
+        if adj_reader is None:
+            return {}
+
+        cal = self._calendar
+        if is_perspective_after:
+            adj_end_ix = min(end_ix + 1, len(cal) - 1)
+        else:
+            adj_end_ix = end_ix
+        return adj_reader.load_adjustments(
+            [field], cal[start_ix:adj_end_ix + 1], assets,
+        )[0]
+
+    def _make_window(self,
+                     array,
+                     adjustments,
+                     size,
+                     is_perspective_after,
+                     decimal_places,
+                     field):
+        if field == 'sid':
+            window_type = Int64Window
+        else:
+            window_type = Float64Window
+
+        return window_type(
+            array,
+            {},
+            adjustments,
+            0,
+            size,
+            int(is_perspective_after),
+            decimal_places,
+        )
+
+    def _roll_block(self, block, end_ix, field, is_perspective_after):
+        """
+        Move ``block`` forward so that it can provide the window ending at
+        ``end_ix``.
+
+        The rows of the current window that are still needed are kept, with
+        the adjustments that have already been applied to them, and only the
+        bars after the block's prefetched data are read.
+        """
+        start_ix = end_ix - block.size + 1
+        prefetch_end_ix = self._prefetch_end_ix(end_ix)
+
+        # Adjustments at calendar indices before this have already been
+        # applied to the block's data.
+        applied_ix = (
+            block.cal_start + block.anchor + int(is_perspective_after)
+        )
+
+        read_start_ix = max(start_ix, block.last_ix + 1)
+        array = self._load_block_array(
+            read_start_ix,
+            prefetch_end_ix,
+            block.assets,
+            field,
+        )
+        if read_start_ix > start_ix:
+            kept = asarray(block.window.data)[start_ix - block.cal_start:]
+            array = concatenate([kept, array])
+
+        adjustments = {
+            loc: adjs
+            for loc, adjs in iteritems(self._load_block_adjustments(
+                start_ix,
+                prefetch_end_ix,
+                block.assets,
+                field,
+                is_perspective_after,
+            ))
+            if start_ix + loc >= applied_ix
+        }
+
+        block.reset(
+            self._make_window(
+                array,
+                adjustments,
+                block.size,
+                is_perspective_after,
+                block.rounding_places,
+                field,
+            ),
+            start_ix,
+        )
+
     def _ensure_sliding_windows(self, assets, dts, field,
                                 is_perspective_after):
         """
@@ -370,8 +558,10 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         If the corresponding window for the (assets, len(dts), field) does not
         exist, then create a new one.
         If a corresponding window does exist for (assets, len(dts), field), but
-        can not provide data for the current dts range, then create a new
-        one and replace the expired window.
+        has run out of prefetched data for the current dts range, then roll it
+        forward, reading only the data after its last prefetched bar.
+        If the window has already moved past the current dts range, then
+        create a new one and replace it.
 
         Parameters
         ----------
@@ -396,76 +586,89 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         size = len(dts)
         asset_windows = {}
         needed_assets = []
+        rolled_blocks = set()
         cal = self._calendar
 
         assets = self._asset_finder.retrieve_all(assets)
         end_ix = find_in_sorted_index(cal, end)
 
         for asset in assets:
-            try:
-                window = self._window_blocks[field].get(
-                    (asset, size, is_perspective_after), end)
-            except KeyError:
+            window = self._window_blocks[field].get(
+                (asset, size, is_perspective_after))
+            if window is None or end_ix < window.most_recent_ix:
+                # Either there is no window, or the requested end index
+                # occurs before the end index from the previous history call
+                # for this window. Grab new window instead of rewinding
+                # adjustments.
                 needed_assets.append(asset)
-            else:
-                if end_ix < window.most_recent_ix:
-                    # Window needs reset. Requested end index occurs before the
-                    # end index from the previous history call for this window.
-                    # Grab new window instead of rewinding adjustments.
-                    needed_assets.append(asset)
-                else:
-                    asset_windows[asset] = window
+                continue
+
+            block = window.block
+            if end_ix > block.last_ix and id(block) not in rolled_blocks:
+                # The window has run out of prefetched data. Roll it forward
+                # instead of rebuilding it, so that only the new bars are read.
+                self._roll_block(block, end_ix, field, is_perspective_after)
+                rolled_blocks.add(id(block))
+            asset_windows[asset] = window
 
         if needed_assets:
-            offset = 0
             start_ix = find_in_sorted_index(cal, dts[0])
-
-            prefetch_end_ix = min(end_ix + self._prefetch_length, len(cal) - 1)
-            prefetch_end = cal[prefetch_end_ix]
-            prefetch_dts = cal[start_ix:prefetch_end_ix + 1]
-            if is_perspective_after:
-                adj_end_ix = min(prefetch_end_ix + 1, len(cal) - 1)
-                adj_dts = cal[start_ix:adj_end_ix + 1]
-            else:
-                adj_dts = prefetch_dts
-            prefetch_len = len(prefetch_dts)
-            array = self._array(prefetch_dts, needed_assets, field)
-
-            if field == 'sid':
-                window_type = Int64Window
-            else:
-                window_type = Float64Window
-
-            view_kwargs = {}
-            if field == 'volume':
-                array = array.astype(float64_dtype)
-
-            for i, asset in enumerate(needed_assets):
-                adj_reader = None
-                try:
-                    adj_reader = self._adjustment_readers[type(asset)]
-                except KeyError:
-                    adj_reader = None
-                if adj_reader is not None:
-                    adjs = adj_reader.load_adjustments(
-                        [field], adj_dts, [asset])[0]
+            prefetch_end_ix = self._prefetch_end_ix(end_ix)
+            array = self._load_block_array(
+                start_ix,
+                prefetch_end_ix,
+                needed_assets,
+                field,
+            )
+
+            # Build one window for each group of assets that share an
+            # adjustment reader and rounding, so that the adjustments and
+            # rounding for the whole group are applied to a single 2-D block.
+            # Each asset's cache entry is a view of its column of the block.
+            groups = groupby(
+                lambda i: (
+                    type(needed_assets[i]),
+                    self._decimal_places_for_asset(
+                        needed_assets[i], dts[-1],
+                    ),
+                ),
+                range(len(needed_assets)),
+            )
+            for (asset_type, decimal_places), cols in iteritems(groups):
+                group_assets = [needed_assets[i] for i in cols]
+                if len(cols) == len(needed_assets):
+                    block_array = array
                 else:
-                    adjs = {}
-                window = window_type(
-                    array[:, i].reshape(prefetch_len, 1),
-                    view_kwargs,
-                    adjs,
-                    offset,
+                    block_array = array[:, cols]
+
+                window = self._make_window(
+                    block_array,
+                    self._load_block_adjustments(
+                        start_ix,
+                        prefetch_end_ix,
+                        group_assets,
+                        field,
+                        is_perspective_after,
+                    ),
+                    size,
+                    is_perspective_after,
+                    decimal_places,
+                    field,
+                )
+                block = SlidingWindow(
+                    window,
                     size,
-                    int(is_perspective_after),
-                    self._decimal_places_for_asset(asset, dts[-1]),
+                    start_ix,
+                    0,
+                    group_assets,
+                    decimal_places,
                 )
-                sliding_window = SlidingWindow(window, size, start_ix, offset)
-                asset_windows[asset] = sliding_window
-                self._window_blocks[field].set(
-                    (asset, size, is_perspective_after),
-                    sliding_window,
-                    prefetch_end)
+                for col, asset in enumerate(group_assets):
+                    sliding_window = SlidingWindowColumn(block, col)
+                    asset_windows[asset] = sliding_window
+                    self._window_blocks[field][
+                        (asset, size, is_perspective_after)
+                    ] = sliding_window
 
         return [asset_windows[asset] for asset in assets]
 
@@ -13,10 +13,14 @@
 # limitations under the License.
 from abc import ABCMeta, abstractmethod
 import json
+from operator import itemgetter
 import os
 from glob import glob
 from os.path import join
+from tempfile import mkstemp
 from textwrap import dedent
+import threading
+from uuid import uuid4
 
 from lru import LRU
 import bcolz
@@ -43,6 +47,8 @@ from zipline.data.us_equity_pricing import check_uint32_safe
 from zipline.utils.calendars import get_calendar
 from zipline.utils.cli import maybe_show_progress
 from zipline.utils.memoize import lazyval
+from zipline.utils.paths import ensure_directory
+from zipline.utils.pool import imap_bounded
 
 
 logger = logbook.Logger('MinuteBars')
@@ -54,6 +60,43 @@ DEFAULT_EXPECTEDLEN = US_EQUITIES_MINUTES_PER_DAY * 252 * 15
 
 OHLC_RATIO = 1000
 
+# The maximum number of sids that are being written, or waiting to be
+# written, when writing with a pool.
+MAX_PENDING_WRITES = 32
+
+
+# The file in the root directory of minute bars with a stamp which is
+# replaced whenever bars are written.
+DATA_VERSION_FILENAME = 'version'
+
+
+def _write_data_version(rootdir):
+    """
+    Replace the version stamp of the minute bars in ``rootdir``, so that
+    caches of the bars can tell that they were written again.
+    """
+    fd, tmp = mkstemp(dir=rootdir)
+    try:
+        os.write(fd, uuid4().hex.encode('ascii'))
+    finally:
+        os.close(fd)
+    # Rename into place so that readers never see a partial stamp.
+    os.rename(tmp, os.path.join(rootdir, DATA_VERSION_FILENAME))
+
+
+def _read_data_version(rootdir, metadata_path):
+    """
+    Read the version stamp of the minute bars in ``rootdir``.
+
+    Bars written before there were stamps fall back to the modification
+    time of their metadata.
+    """
+    try:
+        with open(os.path.join(rootdir, DATA_VERSION_FILENAME)) as fp:
+            return fp.read()
+    except IOError:
+        return os.path.getmtime(metadata_path)
+
 
 class BcolzMinuteOverlappingData(Exception):
     pass
@@ -68,6 +111,14 @@ class MinuteBarReader(BarReader):
     def data_frequency(self):
         return "minute"
 
+    @property
+    def data_version(self):
+        """
+        An identifier of the written bars which changes whenever they are
+        written again, or None if the reader can't tell.
+        """
+        return None
+
 
 def _calc_minute_index(market_opens, minutes_per_day):
     minutes = np.zeros(len(market_opens) * minutes_per_day,
@@ -392,6 +443,13 @@ class BcolzMinuteBarWriter(object):
         If True, writes the minute bar metadata (on init of the writer).
         If False, no metadata is written (existing metadata is
         retained). Default is True.
+    pool : Pool, optional
+        A pool used by ``write`` to convert, compress and write sids
+        concurrently. This object must support ``apply_async``, for example
+        :class:`multiprocessing.Pool`. If the pool runs in other processes,
+        the writer's calendar must be registered with
+        :func:`~zipline.utils.calendars.get_calendar`. If not provided, sids
+        are written serially.
 
     Notes
     -----
@@ -449,7 +507,8 @@ class BcolzMinuteBarWriter(object):
                  default_ohlc_ratio=OHLC_RATIO,
                  ohlc_ratios_per_sid=None,
                  expectedlen=DEFAULT_EXPECTEDLEN,
-                 write_metadata=True):
+                 write_metadata=True,
+                 pool=None):
 
         self._rootdir = rootdir
         self._start_session = start_session
@@ -463,6 +522,7 @@ class BcolzMinuteBarWriter(object):
         self._expectedlen = expectedlen
         self._default_ohlc_ratio = default_ohlc_ratio
         self._ohlc_ratios_per_sid = ohlc_ratios_per_sid
+        self._pool = pool
 
         self._minute_index = _calc_minute_index(
             self._schedule.market_open, self._minutes_per_day)
@@ -479,7 +539,7 @@ class BcolzMinuteBarWriter(object):
             metadata.write(self._rootdir)
 
     @classmethod
-    def open(cls, rootdir, end_session=None):
+    def open(cls, rootdir, end_session=None, pool=None):
         """
         Open an existing ``rootdir`` for writing.
 
@@ -487,6 +547,8 @@ class BcolzMinuteBarWriter(object):
         ----------
         end_session : Timestamp (optional)
             When appending, the intended new ``end_session``.
+        pool : Pool, optional
+            The pool to write sids with.
         """
         metadata = BcolzMinuteBarMetadata.read(rootdir)
         return BcolzMinuteBarWriter(
@@ -497,7 +559,8 @@ class BcolzMinuteBarWriter(object):
             metadata.minutes_per_day,
             metadata.default_ohlc_ratio,
             metadata.ohlc_ratios_per_sid,
-            write_metadata=end_session is not None
+            write_metadata=end_session is not None,
+            pool=pool,
         )
 
     @property
@@ -557,6 +620,23 @@ class BcolzMinuteBarWriter(object):
             return pd.NaT
         return self._session_labels[num_days - 1]
 
+    def last_date_in_output(self):
+        """
+        Returns
+        -------
+        out : pd.Timestamp
+            The midnight of the last date written in to the output for any
+            sid, or NaT if no data has been written.
+        """
+        glob_path = os.path.join(self._rootdir, "*", "*", "*.bcolz")
+        dates = [
+            self.last_date_in_output_for_sid(
+                int(os.path.basename(sid_path).split('.')[0]),
+            )
+            for sid_path in glob(glob_path)
+        ]
+        return max([dt for dt in dates if dt is not pd.NaT] or [pd.NaT])
+
     def _init_ctable(self, path):
         """
         Create empty ctable for given path.
@@ -569,10 +649,9 @@ class BcolzMinuteBarWriter(object):
         # Only create the containing subdir on creation.
         # This is not to be confused with the `.bcolz` directory, but is the
         # directory up one level from the `.bcolz` directories.
-        sid_containing_dirname = os.path.dirname(path)
-        if not os.path.exists(sid_containing_dirname):
-            # Other sids may have already created the containing directory.
-            os.makedirs(sid_containing_dirname)
+        # Other sids may have already created the containing directory,
+        # possibly concurrently.
+        ensure_directory(os.path.dirname(path))
         initial_array = np.empty(0, np.uint32)
         table = ctable(
             rootdir=path,
@@ -682,19 +761,58 @@ class BcolzMinuteBarWriter(object):
               index : DatetimeIndex of market minutes.
             A given sid may appear more than once in ``data``; however,
             the dates must be strictly increasing.
+            The data may also be a callable taking no arguments which returns
+            the DataFrame. When writing with a pool, it is called on the
+            pool, so parsing can happen concurrently too. With a process
+            pool, such as the one used by ``zipline ingest -j``, the callable
+            must be picklable, e.g. a module-level function or a
+            :func:`functools.partial` of one, not a lambda or a closure.
         show_progress : bool, optional
             Whether or not to show a progress bar while writing.
         """
+        if self._pool is None:
+            write_sid = self.write_sid
+            written = (
+                (sid, write_sid(sid, df, invalid_data_behavior))
+                for sid, df in data
+            )
+        else:
+            pool_args = self._pool_args()
+            written = imap_bounded(
+                self._pool,
+                _write_sid_on_pool,
+                (
+                    (pool_args, sid, df, invalid_data_behavior)
+                    for sid, df in data
+                ),
+                max_pending=MAX_PENDING_WRITES,
+                # Chunks of the same sid must be appended in order.
+                key=itemgetter(1),
+            )
+
         ctx = maybe_show_progress(
-            data,
+            written,
             show_progress=show_progress,
             item_show_func=lambda e: e if e is None else str(e[0]),
             label="Merging minute equity files:",
         )
-        write_sid = self.write_sid
         with ctx as it:
-            for e in it:
-                write_sid(*e, invalid_data_behavior=invalid_data_behavior)
+            for _ in it:
+                pass
+
+    def _pool_args(self):
+        """The arguments needed to recreate this writer on a pool.
+        """
+        return (
+            self._rootdir,
+            self._calendar.name,
+            self._start_session,
+            self._end_session,
+            self._minutes_per_day,
+            self._default_ohlc_ratio,
+            self._ohlc_ratios_per_sid,
+            self._expectedlen,
+        )
 
     def write_sid(self, sid, df, invalid_data_behavior='warn'):
         """
@@ -717,6 +835,8 @@ class BcolzMinuteBarWriter(object):
                 volume : float64|int64
             index : DatetimeIndex of market minutes.
         """
+        if callable(df):
+            df = df()
         cols = {
             'open': df.open.values,
             'high': df.high.values,
@@ -842,6 +962,7 @@ class BcolzMinuteBarWriter(object):
             vol_col
         ])
         table.flush()
+        _write_data_version(self._rootdir)
 
     def data_len_for_day(self, day):
         """
@@ -881,6 +1002,62 @@ class BcolzMinuteBarWriter(object):
         metadata = BcolzMinuteBarMetadata.read(self._rootdir)
         metadata.end_session = date
         metadata.write(self._rootdir)
+        _write_data_version(self._rootdir)
+
+
+# The writer recreated on each worker of a pool, with the ``_pool_args`` it
+# was created from, so that it is only set up once per worker rather than
+# once per sid.
+_pool_writer = threading.local()
+
+
+def _writer_on_pool(pool_args):
+    """The BcolzMinuteBarWriter of this worker for ``pool_args``, recreated
+    only when ``pool_args`` change.
+    """
+    if getattr(_pool_writer, 'args', None) != pool_args:
+        (
+            rootdir,
+            calendar_name,
+            start_session,
+            end_session,
+            minutes_per_day,
+            default_ohlc_ratio,
+            ohlc_ratios_per_sid,
+            expectedlen,
+        ) = pool_args
+        _pool_writer.writer = BcolzMinuteBarWriter(
+            rootdir,
+            get_calendar(calendar_name),
+            start_session,
+            end_session,
+            minutes_per_day,
+            default_ohlc_ratio,
+            ohlc_ratios_per_sid,
+            expectedlen,
+            write_metadata=False,
+        )
+        _pool_writer.args = pool_args
+    return _pool_writer.writer
+
+
+def _write_sid_on_pool(args):
+    """Write one sid's data with the BcolzMinuteBarWriter recreated on this
+    worker from ``BcolzMinuteBarWriter._pool_args``.
+
+    Returns
+    -------
+    written : tuple[int, None]
+        The sid that was written, in the same shape as the elements of the
+        data passed to ``BcolzMinuteBarWriter.write``.
+    """
+    pool_args, sid, df, invalid_data_behavior = args
+    _writer_on_pool(pool_args).write_sid(
+        sid,
+        df,
+        invalid_data_behavior=invalid_data_behavior,
+    )
+    return sid, None
 
 
 class BcolzMinuteBarReader(MinuteBarReader):
@@ -892,6 +1069,14 @@ class BcolzMinuteBarReader(MinuteBarReader):
     rootdir : string
         The root directory containing the metadata and asset bcolz
         directories.
+    sid_cache_size : int, optional
+        The number of carrays to keep open for each field.
+    pool : Pool, optional
+        A pool used by ``load_raw_arrays`` to read sids concurrently. This
+        object must support ``map``, for example
+        :class:`multiprocessing.pool.ThreadPool`. bcolz releases the GIL while
+        decompressing, so a thread pool lets reads of many sids overlap. If
+        not provided, sids are read serially.
 
     See Also
     --------
@@ -899,8 +1084,9 @@ class BcolzMinuteBarReader(MinuteBarReader):
     """
     FIELDS = ('open', 'high', 'low', 'close', 'volume')
 
-    def __init__(self, rootdir, sid_cache_size=1000):
+    def __init__(self, rootdir, sid_cache_size=1000, pool=None):
         self._rootdir = rootdir
+        self._pool = pool
 
         metadata = self._get_metadata()
 
@@ -958,6 +1144,13 @@ class BcolzMinuteBarReader(MinuteBarReader):
         _, close = self.calendar.open_and_close_for_session(self._end_session)
         return close
 
+    @property
+    def data_version(self):
+        return _read_data_version(
+            self._rootdir,
+            BcolzMinuteBarMetadata.metadata_path(self._rootdir),
+        )
+
     @property
     def first_trading_day(self):
         return self._start_session
@@ -973,6 +1166,12 @@ class BcolzMinuteBarReader(MinuteBarReader):
         # fallback to the default.
         return self._default_ohlc_inverse
 
+    def _ohlc_ratio_inverses_for_sids(self, sids):
+        if self._ohlc_inverses_per_sid is None:
+            return np.full(len(sids), self._default_ohlc_inverse)
+        return np.array([self._ohlc_ratio_inverse_for_sid(sid)
+                         for sid in sids])
+
     def _minutes_to_exclude(self):
         """
         Calculate the minutes which should be excluded when a window
@@ -1129,6 +1328,40 @@ class BcolzMinuteBarReader(MinuteBarReader):
             value *= self._ohlc_ratio_inverse_for_sid(sid)
         return value
 
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the pricing info for many sids at the same dt.
+
+        The position of ``dt`` is only looked up once for all of the sids.
+
+        See Also
+        --------
+        :meth:`zipline.data.bar_reader.BarReader.get_values`
+        """
+        if self._last_get_value_dt_value == dt.value:
+            minute_pos = self._last_get_value_dt_position
+        else:
+            try:
+                minute_pos = self._find_position_of_minute(dt)
+            except ValueError:
+                raise NoDataOnDate()
+
+            self._last_get_value_dt_value = dt.value
+            self._last_get_value_dt_position = minute_pos
+
+        values = np.zeros(len(sids), dtype=np.uint32)
+        for i, sid in enumerate(sids):
+            carray = self._open_minute_file(field, sid)
+            if minute_pos < len(carray):
+                values[i] = carray[minute_pos]
+
+        if field == 'volume':
+            return values.astype(np.int64)
+
+        out = values * self._ohlc_ratio_inverses_for_sids(sids)
+        out[values == 0] = np.nan
+        return out
+
     def get_last_traded_dt(self, asset, dt):
         minute_pos = self._find_last_traded_position(asset, dt)
         if minute_pos == -1:
@@ -1233,40 +1466,53 @@ class BcolzMinuteBarReader(MinuteBarReader):
 
         num_minutes = (end_idx - start_idx + 1)
 
-        results = []
-
+        # Compute the rows to keep once for every field and sid.
         indices_to_exclude = self._exclusion_indices_for_range(
             start_idx, end_idx)
         if indices_to_exclude is not None:
+            keep = np.ones(num_minutes, dtype=bool)
             for excl_start, excl_stop in indices_to_exclude:
-                length = excl_stop - excl_start + 1
-                num_minutes -= length
+                keep[excl_start - start_idx:excl_stop - start_idx + 1] = False
+        else:
+            keep = None
+
+        # Open the carrays on the calling thread because the LRU caches are
+        # not thread safe.
+        carrays = [
+            [self._open_minute_file(field, sid) for sid in sids]
+            for field in fields
+        ]
+        raw = [
+            np.zeros((num_minutes, len(sids)), dtype=np.uint32)
+            for _ in fields
+        ]
+
+        def read_sid(i):
+            for field_carrays, field_raw in zip(carrays, raw):
+                values = field_carrays[i][start_idx:end_idx + 1]
+                # We might not have written data for all the minutes
+                # requested.
+                field_raw[:len(values), i] = values
+
+        if self._pool is not None:
+            self._pool.map(read_sid, range(len(sids)))
+        else:
+            for i in range(len(sids)):
+                read_sid(i)
 
-        shape = num_minutes, len(sids)
+        inverses = None
+        results = []
+        for field, values in zip(fields, raw):
+            if keep is not None:
+                values = values[keep]
 
-        for field in fields:
             if field != 'volume':
-                out = np.full(shape, np.nan)
+                if inverses is None:
+                    inverses = self._ohlc_ratio_inverses_for_sids(sids)
+                out = values * inverses
+                out[values == 0] = np.nan
             else:
-                out = np.zeros(shape, dtype=np.uint32)
-
-            for i, sid in enumerate(sids):
-                carray = self._open_minute_file(field, sid)
-                values = carray[start_idx:end_idx + 1]
-                if indices_to_exclude is not None:
-                    for excl_start, excl_stop in indices_to_exclude[::-1]:
-                        excl_slice = np.s_[
-                            excl_start - start_idx:excl_stop - start_idx + 1]
-                        values = np.delete(values, excl_slice)
-
-                where = values != 0
-                # first slice down to len(where) because we might not have
-                # written data for all the minutes requested
-                if field != 'volume':
-                    out[:len(where), i][where] = (
-                        values[where] * self._ohlc_ratio_inverse_for_sid(sid))
-                else:
-                    out[:len(where), i][where] = values[where]
+                out = values
 
             results.append(out)
         return results
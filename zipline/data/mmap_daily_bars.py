@@ -0,0 +1,561 @@
+"""
+Daily bars stored as memory-mapped (sessions x sids) blocks.
+
+Unlike the bcolz format in :mod:`zipline.data.us_equity_pricing`, which keeps
+a compressed table of every asset's rows, this format stores each field as a
+single uncompressed block, so the blocks can be memory-mapped and shared
+through the page cache by every process that reads them, and reading a window
+is a slice of a mapped array.
+"""
+import json
+import os
+
+from bcolz import ctable
+import numpy as np
+import pandas as pd
+
+from zipline.data.bar_reader import (
+    NoDataAfterDate,
+    NoDataBeforeDate,
+    NoDataOnDate,
+)
+from zipline.data.session_bars import SessionBarReader
+from zipline.data.us_equity_pricing import _to_uint32_frame
+from zipline.utils.calendars import get_calendar
+from zipline.utils.cli import maybe_show_progress
+from zipline.utils.memoize import lazyval
+from zipline.utils.paths import ensure_directory
+
+
+FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+# Prices are stored as 1000 * the as-traded dollar value, like the bcolz
+# format.
+PRICE_ADJUSTMENT_FACTOR = 0.001
+
+
+class MmapDailyBarUnknownSid(Exception):
+    pass
+
+
+class MmapDailyBarMetadata(object):
+    """
+    Parameters
+    ----------
+    calendar : zipline.utils.calendars.trading_calendar.TradingCalendar
+        The TradingCalendar on which the daily bars are based.
+    start_session : datetime
+        The first trading session in the data set.
+    end_session : datetime
+        The last trading session in the data set.
+    sids : list[int]
+        The sids in the data set, in the order of the columns of each block.
+    first_session_ix : list[int]
+        The index of the first session with data for each sid, or -1 if
+        there is no data for the sid.
+    last_session_ix : list[int]
+        The index of the last session with data for each sid, or -1 if
+        there is no data for the sid.
+    """
+    FORMAT_VERSION = 1
+
+    METADATA_FILENAME = 'metadata.json'
+
+    @classmethod
+    def metadata_path(cls, rootdir):
+        return os.path.join(rootdir, cls.METADATA_FILENAME)
+
+    @classmethod
+    def read(cls, rootdir):
+        with open(cls.metadata_path(rootdir)) as fp:
+            raw_data = json.load(fp)
+
+        return cls(
+            get_calendar(raw_data['calendar_name']),
+            pd.Timestamp(raw_data['start_session'], tz='UTC'),
+            pd.Timestamp(raw_data['end_session'], tz='UTC'),
+            raw_data['sids'],
+            raw_data['first_session_ix'],
+            raw_data['last_session_ix'],
+            version=raw_data['version'],
+        )
+
+    def __init__(self,
+                 calendar,
+                 start_session,
+                 end_session,
+                 sids,
+                 first_session_ix,
+                 last_session_ix,
+                 version=FORMAT_VERSION):
+        self.calendar = calendar
+        self.start_session = start_session
+        self.end_session = end_session
+        self.sids = sids
+        self.first_session_ix = first_session_ix
+        self.last_session_ix = last_session_ix
+        self.version = version
+
+    def write(self, rootdir):
+        """
+        Write the metadata to a JSON file in the rootdir.
+        """
+        metadata = {
+            'version': self.version,
+            'calendar_name': self.calendar.name,
+            'start_session': str(self.start_session.date()),
+            'end_session': str(self.end_session.date()),
+            'sids': [int(sid) for sid in self.sids],
+            'first_session_ix': [int(ix) for ix in self.first_session_ix],
+            'last_session_ix': [int(ix) for ix in self.last_session_ix],
+        }
+        with open(self.metadata_path(rootdir), 'w+') as fp:
+            json.dump(metadata, fp)
+
+
+def _block_path(rootdir, field):
+    return os.path.join(rootdir, '{0}.npy'.format(field))
+
+
+class MmapDailyBarWriter(object):
+    """
+    Class capable of writing daily OHLCV data to disk as memory-mappable
+    blocks.
+
+    Parameters
+    ----------
+    rootdir : string
+        Path to the root directory into which to write the metadata and
+        blocks. It is created if it does not exist.
+    calendar : zipline.utils.calendars.trading_calendar.TradingCalendar
+        Calendar to use to compute the sessions of the data set.
+    start_session : pd.Timestamp
+        Midnight UTC session label.
+    end_session : pd.Timestamp
+        Midnight UTC session label.
+    sids : iterable[int]
+        Every sid that will be written. The set of sids is fixed when the
+        data set is created.
+
+    Notes
+    -----
+    Each field is stored in an ``.npy`` file containing a uint32 array of
+    shape ``(len(sessions), len(sids))``. Prices are stored as integers in the
+    same way as the bcolz format, and a value of zero means that there was no
+    trade. The first and last session written for each sid are kept in the
+    metadata, so that the reader can tell sessions outside of an asset's
+    lifetime from sessions without trades.
+
+    Writing a session which has already been written overwrites it.
+
+    See Also
+    --------
+    zipline.data.mmap_daily_bars.MmapDailyBarReader
+    zipline.data.mmap_daily_bars.convert_bcolz_daily_bars
+    """
+    COL_NAMES = FIELDS
+
+    def __init__(self, rootdir, calendar, start_session, end_session, sids):
+        self._rootdir = rootdir
+        self._calendar = calendar
+        self._start_session = start_session
+        self._end_session = end_session
+        self._sessions = calendar.sessions_in_range(start_session, end_session)
+        self._sids = sids = np.sort(np.asarray(sids, dtype=np.int64))
+        self._first_session_ix = np.full(len(sids), -1, dtype=np.int64)
+        self._last_session_ix = np.full(len(sids), -1, dtype=np.int64)
+
+        ensure_directory(rootdir)
+        # The files are extended rather than written, so the sessions that
+        # are never written do not take up space on most file systems.
+        self._blocks = {
+            field: np.lib.format.open_memmap(
+                _block_path(rootdir, field),
+                mode='w+',
+                dtype=np.uint32,
+                shape=(len(self._sessions), len(sids)),
+            )
+            for field in self.COL_NAMES
+        }
+        self._write_metadata()
+
+    def _write_metadata(self):
+        MmapDailyBarMetadata(
+            self._calendar,
+            self._start_session,
+            self._end_session,
+            self._sids,
+            self._first_session_ix,
+            self._last_session_ix,
+        ).write(self._rootdir)
+
+    def _flush(self):
+        for block in self._blocks.values():
+            block.flush()
+        self._write_metadata()
+
+    def _column(self, sid):
+        col = self._sids.searchsorted(sid)
+        if col == len(self._sids) or self._sids[col] != sid:
+            raise MmapDailyBarUnknownSid(
+                'sid={0} was not in the sids given when {1} was '
+                'created'.format(sid, self._rootdir),
+            )
+        return col
+
+    def write(self, data, show_progress=False, invalid_data_behavior='warn'):
+        """
+        Parameters
+        ----------
+        data : iterable[tuple[int, pandas.DataFrame]]
+            The data chunks to write. Each chunk should be a tuple of sid
+            and the data for that asset, indexed by session, with the columns
+            ('open', 'high', 'low', 'close', 'volume').
+        show_progress : bool, optional
+            Whether or not to show a progress bar while writing.
+        invalid_data_behavior : {'warn', 'raise', 'ignore'}, optional
+            What to do when data is encountered that is outside the range of
+            a uint32.
+        """
+        ctx = maybe_show_progress(
+            data,
+            show_progress=show_progress,
+            item_show_func=lambda e: e if e is None else str(e[0]),
+            label="Merging daily equity files:",
+        )
+        try:
+            with ctx as it:
+                for sid, df in it:
+                    self._write_frame(sid, df, invalid_data_behavior)
+        finally:
+            self._flush()
+
+    def _write_frame(self, sid, df, invalid_data_behavior):
+        if not len(df):
+            return
+
+        index = pd.DatetimeIndex(df.index)
+        if index.tz is None:
+            index = index.tz_localize('UTC')
+        positions = self._sessions.get_indexer(index)
+        if (positions == -1).any():
+            raise ValueError(
+                'dt={0} is not a session between the start and end session '
+                'of {1}'.format(
+                    index[(positions == -1).argmax()],
+                    self._rootdir,
+                ),
+            )
+
+        converted = _to_uint32_frame(df.copy(), invalid_data_behavior)
+        self._write_raw(
+            sid,
+            positions,
+            {field: converted[field].values for field in self.COL_NAMES},
+        )
+
+    def _write_raw(self, sid, positions, cols):
+        """Write the uint32 ``cols`` for ``sid`` to the sessions at
+        ``positions``.
+        """
+        col = self._column(sid)
+        for field in self.COL_NAMES:
+            self._blocks[field][positions, col] = cols[field]
+
+        first = positions.min()
+        last = positions.max()
+        if self._first_session_ix[col] == -1:
+            self._first_session_ix[col] = first
+            self._last_session_ix[col] = last
+        else:
+            self._first_session_ix[col] = min(
+                self._first_session_ix[col],
+                first,
+            )
+            self._last_session_ix[col] = max(self._last_session_ix[col], last)
+
+
+def convert_bcolz_daily_bars(bcolz_daily_bar_path,
+                             rootdir,
+                             show_progress=False):
+    """
+    Convert daily bars written by the ``BcolzDailyBarWriter``, for example the
+    daily bars of an ingested bundle, to the memory-mapped format.
+
+    Parameters
+    ----------
+    bcolz_daily_bar_path : str or bcolz.ctable
+        The daily bar table to convert.
+    rootdir : str
+        The directory to write the memory-mapped daily bars to.
+    show_progress : bool, optional
+        Whether or not to show a progress bar while converting.
+
+    Returns
+    -------
+    reader : MmapDailyBarReader
+        A reader for the converted data.
+
+    Notes
+    -----
+    The stored integers are copied as they are, so the converted data reads
+    exactly the same values. Only one field of the table is decompressed into
+    memory at a time.
+    """
+    if isinstance(bcolz_daily_bar_path, ctable):
+        table = bcolz_daily_bar_path
+    else:
+        table = ctable(rootdir=bcolz_daily_bar_path, mode='r')
+
+    attrs = table.attrs
+    first_rows = attrs['first_row']
+    last_rows = attrs['last_row']
+    calendar_offsets = attrs['calendar_offset']
+    sids = sorted(int(sid) for sid in first_rows)
+
+    writer = MmapDailyBarWriter(
+        rootdir,
+        get_calendar(attrs['calendar_name']),
+        pd.Timestamp(attrs['start_session_ns'], tz='UTC'),
+        pd.Timestamp(attrs['end_session_ns'], tz='UTC'),
+        sids,
+    )
+
+    with maybe_show_progress(
+            FIELDS,
+            show_progress=show_progress,
+            label='Converting daily bars:') as fields:
+        for field in fields:
+            values = table[field][:]
+            block = writer._blocks[field]
+            for col, sid in enumerate(sids):
+                key = str(sid)
+                first_row = first_rows[key]
+                last_row = last_rows[key]
+                offset = calendar_offsets[key]
+                block[offset:offset + last_row - first_row + 1, col] = \
+                    values[first_row:last_row + 1]
+            del values
+
+    for col, sid in enumerate(sids):
+        key = str(sid)
+        offset = calendar_offsets[key]
+        writer._first_session_ix[col] = offset
+        writer._last_session_ix[col] = (
+            offset + last_rows[key] - first_rows[key]
+        )
+    writer._flush()
+
+    return MmapDailyBarReader(rootdir)
+
+
+class MmapDailyBarReader(SessionBarReader):
+    """
+    Reader for data written by MmapDailyBarWriter.
+
+    Parameters
+    ----------
+    rootdir : string
+        The root directory containing the metadata and blocks.
+
+    Notes
+    -----
+    The blocks are mapped read only, so every process reading the same
+    directory shares one copy of the data in the page cache.
+    ``load_raw_arrays`` returns volumes as views of the mapped block when the
+    requested sids are stored next to each other; prices are always copied,
+    because they are converted to floats.
+
+    See Also
+    --------
+    zipline.data.mmap_daily_bars.MmapDailyBarWriter
+    """
+    FIELDS = FIELDS
+
+    def __init__(self, rootdir):
+        self._rootdir = rootdir
+
+        metadata = MmapDailyBarMetadata.read(rootdir)
+
+        self._calendar = metadata.calendar
+        self._start_session = metadata.start_session
+        self._end_session = metadata.end_session
+        self._sids = np.asarray(metadata.sids, dtype=np.int64)
+        self._first_session_ix = np.asarray(
+            metadata.first_session_ix,
+            dtype=np.int64,
+        )
+        self._last_session_ix = np.asarray(
+            metadata.last_session_ix,
+            dtype=np.int64,
+        )
+
+        self._blocks = {}
+
+    @lazyval
+    def sessions(self):
+        return self._calendar.sessions_in_range(
+            self._start_session,
+            self._end_session,
+        )
+
+    @property
+    def trading_calendar(self):
+        return self._calendar
+
+    @property
+    def last_available_dt(self):
+        return self.sessions[-1]
+
+    @lazyval
+    def first_trading_day(self):
+        written = self._first_session_ix[self._first_session_ix != -1]
+        if not len(written):
+            return None
+        return self.sessions[written.min()]
+
+    @property
+    def sids(self):
+        return self._sids
+
+    def _block(self, field):
+        try:
+            return self._blocks[field]
+        except KeyError:
+            block = self._blocks[field] = np.load(
+                _block_path(self._rootdir, field),
+                mmap_mode='r',
+            ).view(np.ndarray)
+            return block
+
+    def _columns(self, sids):
+        """The columns for ``sids``, and a mask of which sids are present.
+        """
+        sids = np.asarray(sids, dtype=np.int64)
+        if not len(self._sids):
+            return (
+                np.zeros(len(sids), dtype=np.int64),
+                np.zeros(len(sids), dtype=bool),
+            )
+        cols = np.minimum(self._sids.searchsorted(sids), len(self._sids) - 1)
+        return cols, self._sids[cols] == sids
+
+    def load_raw_arrays(self, columns, start_date, end_date, assets):
+        """
+        Parameters
+        ----------
+        columns : list of str
+           'open', 'high', 'low', 'close', or 'volume'
+        start_date: Timestamp
+           Beginning of the window range.
+        end_date: Timestamp
+           End of the window range.
+        assets : list of int
+           The asset identifiers in the window.
+
+        Returns
+        -------
+        list of np.ndarray
+            A list with an entry per field of ndarrays with shape
+            (sessions in range, assets). Prices are float64, with nan on the
+            sessions without trades. Volumes are uint32, and may be read only
+            views of the mapped data.
+        """
+        start_idx = self.sessions.get_loc(start_date)
+        end_idx = self.sessions.get_loc(end_date)
+        cols, found = self._columns(assets)
+        present = cols[found]
+        if len(present) and (np.diff(present) == 1).all():
+            col_index = slice(present[0], present[-1] + 1)
+        else:
+            col_index = present
+
+        results = []
+        for column in columns:
+            raw = self._block(column)[start_idx:end_idx + 1, col_index]
+            if not found.all():
+                out = np.zeros((len(raw), len(assets)), dtype=np.uint32)
+                out[:, found] = raw
+                raw = out
+
+            if column != 'volume':
+                values = raw * PRICE_ADJUSTMENT_FACTOR
+                values[raw == 0] = np.nan
+                results.append(values)
+            else:
+                results.append(raw)
+        return results
+
+    def _day_index(self, sid, day):
+        """The column of ``sid`` and the index of ``day``.
+
+        Raises NoDataOnDate, NoDataBeforeDate or NoDataAfterDate like
+        ``BcolzDailyBarReader.sid_day_index``.
+        """
+        try:
+            day_loc = self.sessions.get_loc(day)
+        except KeyError:
+            raise NoDataOnDate("day={0} is outside of calendar={1}".format(
+                day, self.sessions))
+
+        (col,), (found,) = self._columns([int(sid)])
+        if not found or self._first_session_ix[col] == -1:
+            raise NoDataOnDate('No daily data for sid={0}'.format(sid))
+        if day_loc < self._first_session_ix[col]:
+            raise NoDataBeforeDate(
+                "No data on or before day={0} for sid={1}".format(
+                    day, sid))
+        if day_loc > self._last_session_ix[col]:
+            raise NoDataAfterDate(
+                "No data on or after day={0} for sid={1}".format(
+                    day, sid))
+        return col, day_loc
+
+    def get_value(self, sid, dt, field):
+        """
+        Parameters
+        ----------
+        sid : int
+            The asset identifier.
+        dt : datetime64-like
+            Midnight of the day for which data is requested.
+        field : string
+            The price field. e.g. ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        float
+            The spot price for colname of the given sid on the given day.
+            Raises a NoDataOnDate exception if the given day and sid is before
+            or after the date range of the equity.
+            Returns nan if the day is within the date range, but the price is
+            0.
+        """
+        col, day_loc = self._day_index(sid, dt)
+        price = self._block(field)[day_loc, col]
+        if field != 'volume':
+            if price == 0:
+                return np.nan
+            else:
+                return price * PRICE_ADJUSTMENT_FACTOR
+        else:
+            return price
+
+    def get_last_traded_dt(self, asset, day):
+        try:
+            day_loc = self.sessions.get_loc(day)
+        except KeyError:
+            return pd.NaT
+
+        (col,), (found,) = self._columns([int(asset)])
+        if not found:
+            return pd.NaT
+        first = self._first_session_ix[col]
+        last = min(self._last_session_ix[col], day_loc)
+        if first == -1 or last < first:
+            return pd.NaT
+
+        traded = np.flatnonzero(self._block('volume')[first:last + 1, col])
+        if not len(traded):
+            return pd.NaT
+        return self.sessions[first + traded[-1]]
@@ -0,0 +1,876 @@
+"""
+Minute bars stored as memory-mapped (minutes x sids) blocks.
+
+Unlike the bcolz format in :mod:`zipline.data.minute_bars`, which keeps a
+compressed table per sid, this format stores each field of every sid in a
+single uncompressed block per range of sessions, so reading a window for many
+sids is a slice of a memory-mapped array.
+"""
+from glob import glob
+import json
+import os
+
+from bcolz import ctable
+from lru import LRU
+import numpy as np
+import pandas as pd
+from toolz import keymap
+
+from zipline.data._minute_bar_internal import (
+    find_position_of_minute,
+    minute_value,
+)
+from zipline.data.bar_reader import NoDataOnDate
+from zipline.data.minute_bars import (
+    BcolzMinuteBarMetadata,
+    BcolzMinuteWriterColumnMismatch,
+    MinuteBarReader,
+    OHLC_RATIO,
+    _calc_minute_index,
+    _read_data_version,
+    _write_data_version,
+    convert_cols,
+)
+from zipline.gens.sim_engine import NANOS_IN_MINUTE
+from zipline.utils.calendars import get_calendar
+from zipline.utils.cli import maybe_show_progress
+from zipline.utils.memoize import lazyval
+from zipline.utils.paths import ensure_directory
+
+
+FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+# About one month of sessions. With 390 minutes per session and 8000 sids,
+# each field of a partition is roughly 260MB.
+DEFAULT_SESSIONS_PER_PARTITION = 21
+
+
+class MmapMinuteBarUnknownSid(Exception):
+    pass
+
+
+class MmapMinuteBarMetadata(object):
+    """
+    Parameters
+    ----------
+    default_ohlc_ratio : int
+        The factor by which the pricing data is multiplied so that the
+        float data can be stored as an integer.
+    ohlc_ratios_per_sid : dict or None
+        A dict mapping sids to the ratio to use for that sid instead of
+        ``default_ohlc_ratio``.
+    calendar : zipline.utils.calendars.trading_calendar.TradingCalendar
+        The TradingCalendar on which the minute bars are based.
+    start_session : datetime
+        The first trading session in the data set.
+    end_session : datetime
+        The last trading session in the data set.
+    minutes_per_day : int
+        The number of minutes per each period.
+    sids : list[int]
+        The sids in the data set, in the order of the columns of each block.
+    sessions_per_partition : int
+        The number of sessions stored in each partition.
+    """
+    FORMAT_VERSION = 1
+
+    METADATA_FILENAME = 'metadata.json'
+
+    @classmethod
+    def metadata_path(cls, rootdir):
+        return os.path.join(rootdir, cls.METADATA_FILENAME)
+
+    @classmethod
+    def read(cls, rootdir):
+        with open(cls.metadata_path(rootdir)) as fp:
+            raw_data = json.load(fp)
+
+        ohlc_ratios_per_sid = raw_data['ohlc_ratios_per_sid']
+        if ohlc_ratios_per_sid is not None:
+            ohlc_ratios_per_sid = keymap(int, ohlc_ratios_per_sid)
+
+        return cls(
+            raw_data['ohlc_ratio'],
+            ohlc_ratios_per_sid,
+            get_calendar(raw_data['calendar_name']),
+            pd.Timestamp(raw_data['start_session'], tz='UTC'),
+            pd.Timestamp(raw_data['end_session'], tz='UTC'),
+            raw_data['minutes_per_day'],
+            raw_data['sids'],
+            raw_data['sessions_per_partition'],
+            version=raw_data['version'],
+        )
+
+    def __init__(self,
+                 default_ohlc_ratio,
+                 ohlc_ratios_per_sid,
+                 calendar,
+                 start_session,
+                 end_session,
+                 minutes_per_day,
+                 sids,
+                 sessions_per_partition,
+                 version=FORMAT_VERSION):
+        self.default_ohlc_ratio = default_ohlc_ratio
+        self.ohlc_ratios_per_sid = ohlc_ratios_per_sid
+        self.calendar = calendar
+        self.start_session = start_session
+        self.end_session = end_session
+        self.minutes_per_day = minutes_per_day
+        self.sids = sids
+        self.sessions_per_partition = sessions_per_partition
+        self.version = version
+
+    def write(self, rootdir):
+        """
+        Write the metadata to a JSON file in the rootdir.
+        """
+        metadata = {
+            'version': self.version,
+            'ohlc_ratio': self.default_ohlc_ratio,
+            'ohlc_ratios_per_sid': self.ohlc_ratios_per_sid,
+            'minutes_per_day': self.minutes_per_day,
+            'calendar_name': self.calendar.name,
+            'start_session': str(self.start_session.date()),
+            'end_session': str(self.end_session.date()),
+            'sids': [int(sid) for sid in self.sids],
+            'sessions_per_partition': self.sessions_per_partition,
+        }
+        with open(self.metadata_path(rootdir), 'w+') as fp:
+            json.dump(metadata, fp)
+
+
+def _partition_path(rootdir, partition, field):
+    return os.path.join(
+        rootdir,
+        format(partition, '06'),
+        '{0}.npy'.format(field),
+    )
+
+
+class MmapMinuteBarWriter(object):
+    """
+    Class capable of writing minute OHLCV data to disk as memory-mappable
+    blocks.
+
+    Parameters
+    ----------
+    rootdir : string
+        Path to the root directory into which to write the metadata and
+        partitions. It is created if it does not exist.
+    calendar : zipline.utils.calendars.trading_calendar.TradingCalendar
+        The trading calendar on which to base the minute bars.
+    start_session : datetime
+        The first trading session in the data set.
+    end_session : datetime
+        The last trading session in the data set.
+    minutes_per_day : int
+        The number of minutes per each period.
+    sids : iterable[int]
+        Every sid that will be written. The set of sids is fixed when the
+        data set is created.
+    default_ohlc_ratio : int, optional
+        The default ratio by which to multiply the pricing data to
+        convert from floats to integers that fit within np.uint32.
+        Default is OHLC_RATIO (1000).
+    ohlc_ratios_per_sid : dict, optional
+        A dict mapping each sid in the output to the ratio by which to
+        multiply the pricing data to convert the floats from floats to
+        an integer to fit within the np.uint32.
+    sessions_per_partition : int, optional
+        The number of sessions stored in each partition.
+    write_metadata : bool, optional
+        If True, writes the minute bar metadata (on init of the writer).
+        If False, no metadata is written (existing metadata is
+        retained). Default is True.
+
+    Notes
+    -----
+    The data is split into partitions of ``sessions_per_partition``
+    sessions. Each partition is a directory holding an ``.npy`` file per
+    field, each containing a uint32 array of shape
+    ``(sessions_per_partition * minutes_per_day, len(sids))``. Rows use the
+    same positions as :class:`~zipline.data.minute_bars.BcolzMinuteBarWriter`:
+    a repeating period of ``minutes_per_day`` minutes from each market open.
+
+    Prices are stored as integers in the same way as the bcolz format and a
+    value of zero means that there was no trade. Partitions are created when
+    they are first written to, and minutes which are never written read as no
+    trade.
+
+    Writing a minute which has already been written overwrites it.
+
+    See Also
+    --------
+    zipline.data.mmap_minute_bars.MmapMinuteBarReader
+    """
+    COL_NAMES = FIELDS
+
+    def __init__(self,
+                 rootdir,
+                 calendar,
+                 start_session,
+                 end_session,
+                 minutes_per_day,
+                 sids,
+                 default_ohlc_ratio=OHLC_RATIO,
+                 ohlc_ratios_per_sid=None,
+                 sessions_per_partition=DEFAULT_SESSIONS_PER_PARTITION,
+                 write_metadata=True):
+        self._rootdir = rootdir
+        self._calendar = calendar
+        self._minutes_per_day = minutes_per_day
+        self._sids = sids = np.sort(np.asarray(sids, dtype=np.int64))
+        self._default_ohlc_ratio = default_ohlc_ratio
+        self._ohlc_ratios_per_sid = ohlc_ratios_per_sid
+        self._partition_len = sessions_per_partition * minutes_per_day
+
+        slicer = calendar.schedule.index.slice_indexer(
+            start_session,
+            end_session,
+        )
+        self._minute_index = _calc_minute_index(
+            calendar.schedule[slicer].market_open,
+            minutes_per_day,
+        )
+
+        # Cache of (partition, field) -> writable memmap, flushed and
+        # cleared at the end of each write.
+        self._partitions = {}
+
+        if write_metadata:
+            ensure_directory(rootdir)
+            MmapMinuteBarMetadata(
+                default_ohlc_ratio,
+                ohlc_ratios_per_sid,
+                calendar,
+                start_session,
+                end_session,
+                minutes_per_day,
+                sids,
+                sessions_per_partition,
+            ).write(rootdir)
+
+    @classmethod
+    def open(cls, rootdir, end_session=None):
+        """
+        Open an existing ``rootdir`` for writing.
+
+        Parameters
+        ----------
+        end_session : Timestamp (optional)
+            When appending, the intended new ``end_session``.
+        """
+        metadata = MmapMinuteBarMetadata.read(rootdir)
+        return cls(
+            rootdir,
+            metadata.calendar,
+            metadata.start_session,
+            end_session if end_session is not None else metadata.end_session,
+            metadata.minutes_per_day,
+            metadata.sids,
+            metadata.default_ohlc_ratio,
+            metadata.ohlc_ratios_per_sid,
+            metadata.sessions_per_partition,
+            write_metadata=end_session is not None,
+        )
+
+    def ohlc_ratio_for_sid(self, sid):
+        if self._ohlc_ratios_per_sid is not None:
+            try:
+                return self._ohlc_ratios_per_sid[sid]
+            except KeyError:
+                pass
+        return self._default_ohlc_ratio
+
+    def _column(self, sid):
+        col = self._sids.searchsorted(sid)
+        if col == len(self._sids) or self._sids[col] != sid:
+            raise MmapMinuteBarUnknownSid(
+                'sid={0} was not in the sids given when {1} was '
+                'created'.format(sid, self._rootdir),
+            )
+        return col
+
+    def _partition(self, partition, field):
+        key = partition, field
+        try:
+            return self._partitions[key]
+        except KeyError:
+            pass
+
+        path = _partition_path(self._rootdir, partition, field)
+        if os.path.exists(path):
+            array = np.load(path, mmap_mode='r+')
+        else:
+            ensure_directory(os.path.dirname(path))
+            # The file is extended rather than written, so the minutes that
+            # are never written do not take up space on most file systems.
+            array = np.lib.format.open_memmap(
+                path,
+                mode='w+',
+                dtype=np.uint32,
+                shape=(self._partition_len, len(self._sids)),
+            )
+        self._partitions[key] = array
+        return array
+
+    def _flush(self):
+        if not self._partitions:
+            return
+        for array in self._partitions.values():
+            array.flush()
+        self._partitions.clear()
+        _write_data_version(self._rootdir)
+
+    def write(self, data, show_progress=False, invalid_data_behavior='warn'):
+        """Write a stream of minute data.
+
+        Parameters
+        ----------
+        data : iterable[(int, pd.DataFrame)]
+            The data to write. Each element should be a tuple of sid, data
+            where data has the following format:
+              columns : ('open', 'high', 'low', 'close', 'volume')
+                  open : float64
+                  high : float64
+                  low  : float64
+                  close : float64
+                  volume : float64|int64
+              index : DatetimeIndex of market minutes.
+        show_progress : bool, optional
+            Whether or not to show a progress bar while writing.
+        """
+        ctx = maybe_show_progress(
+            data,
+            show_progress=show_progress,
+            item_show_func=lambda e: e if e is None else str(e[0]),
+            label="Merging minute equity files:",
+        )
+        try:
+            with ctx as it:
+                for sid, df in it:
+                    self._write_frame(sid, df, invalid_data_behavior)
+        finally:
+            self._flush()
+
+    def write_sid(self, sid, df, invalid_data_behavior='warn'):
+        """
+        Write the OHLCV data for the given sid.
+
+        Parameters
+        ----------
+        sid : int
+            The asset identifer for the data being written.
+        df : pd.DataFrame
+            DataFrame of market data with the following characteristics.
+            columns : ('open', 'high', 'low', 'close', 'volume')
+                open : float64
+                high : float64
+                low  : float64
+                close : float64
+                volume : float64|int64
+            index : DatetimeIndex of market minutes.
+        """
+        try:
+            self._write_frame(sid, df, invalid_data_behavior)
+        finally:
+            self._flush()
+
+    def write_cols(self, sid, dts, cols, invalid_data_behavior='warn'):
+        """
+        Write the OHLCV data for the given sid.
+
+        Parameters
+        ----------
+        sid : int
+            The asset identifier for the data being written.
+        dts : datetime64 array
+            The dts corresponding to values in cols.
+        cols : dict of str -> np.array
+            dict of market data with the following characteristics.
+            keys are ('open', 'high', 'low', 'close', 'volume')
+            open : float64
+            high : float64
+            low  : float64
+            close : float64
+            volume : float64|int64
+        """
+        if not all(len(dts) == len(cols[name]) for name in self.COL_NAMES):
+            raise BcolzMinuteWriterColumnMismatch(
+                "Length of dts={0} should match cols: {1}".format(
+                    len(dts),
+                    " ".join("{0}={1}".format(name, len(cols[name]))
+                             for name in self.COL_NAMES)))
+        try:
+            self._write_cols(sid, dts, cols, invalid_data_behavior)
+        finally:
+            self._flush()
+
+    def _write_frame(self, sid, df, invalid_data_behavior):
+        cols = {name: df[name].values for name in self.COL_NAMES}
+        self._write_cols(sid, df.index.values, cols, invalid_data_behavior)
+
+    def _write_cols(self, sid, dts, cols, invalid_data_behavior):
+        if not len(dts):
+            return
+
+        col = self._column(sid)
+
+        minutes = self._minute_index.values
+        dts = np.asarray(dts).astype('datetime64[ns]')
+        positions = minutes.searchsorted(dts)
+        invalid = (
+            (positions == len(minutes)) |
+            (minutes[np.minimum(positions, len(minutes) - 1)] != dts)
+        )
+        if invalid.any():
+            raise ValueError(
+                'dt={0} is not a market minute between the start and end '
+                'session of {1}'.format(
+                    pd.Timestamp(dts[invalid.argmax()], tz='UTC'),
+                    self._rootdir,
+                ),
+            )
+
+        converted = convert_cols(
+            cols,
+            self.ohlc_ratio_for_sid(sid),
+            sid,
+            invalid_data_behavior,
+        )
+
+        # ``dts`` are sorted, so each partition is a contiguous run of
+        # positions.
+        partition_ids = positions // self._partition_len
+        for partition in np.unique(partition_ids):
+            start, stop = partition_ids.searchsorted(
+                [partition, partition + 1],
+            )
+            rows = positions[start:stop] - partition * self._partition_len
+            for field, values in zip(self.COL_NAMES, converted):
+                block = self._partition(partition, field)
+                block[rows, col] = values[start:stop]
+
+
+def convert_bcolz_minute_bars(
+        bcolz_minute_bar_path,
+        rootdir,
+        show_progress=False,
+        sessions_per_partition=DEFAULT_SESSIONS_PER_PARTITION):
+    """
+    Convert minute bars written by the ``BcolzMinuteBarWriter``, for example
+    the minute bars of an ingested bundle, to the memory-mapped format.
+
+    Parameters
+    ----------
+    bcolz_minute_bar_path : str
+        The root directory of the minute bars to convert.
+    rootdir : str
+        The directory to write the memory-mapped minute bars to.
+    show_progress : bool, optional
+        Whether or not to show a progress bar while converting.
+    sessions_per_partition : int, optional
+        The number of sessions stored in each partition.
+
+    Returns
+    -------
+    reader : MmapMinuteBarReader
+        A reader for the converted data.
+
+    Notes
+    -----
+    The stored integers are copied as they are, along with the ohlc ratios,
+    so the converted data reads exactly the same values. Only one field of
+    one sid is decompressed into memory at a time, and partitions in which a
+    sid never traded are not written for that sid.
+    """
+    metadata = BcolzMinuteBarMetadata.read(bcolz_minute_bar_path)
+    sid_paths = {
+        int(os.path.basename(path).split('.')[0]): path
+        for path in glob(
+            os.path.join(bcolz_minute_bar_path, '*', '*', '*.bcolz'),
+        )
+    }
+    sids = sorted(sid_paths)
+
+    writer = MmapMinuteBarWriter(
+        rootdir,
+        metadata.calendar,
+        metadata.start_session,
+        metadata.end_session,
+        metadata.minutes_per_day,
+        sids,
+        default_ohlc_ratio=metadata.default_ohlc_ratio,
+        ohlc_ratios_per_sid=metadata.ohlc_ratios_per_sid,
+        sessions_per_partition=sessions_per_partition,
+    )
+    partition_len = writer._partition_len
+
+    with maybe_show_progress(
+            enumerate(sids),
+            show_progress=show_progress,
+            item_show_func=lambda e: e if e is None else str(e[1]),
+            label='Converting minute bars:',
+            length=len(sids)) as it:
+        for col, sid in it:
+            table = ctable(rootdir=sid_paths[sid], mode='r')
+            for field in FIELDS:
+                # Rows of the bcolz table are the same positions as the rows
+                # of the memory-mapped blocks.
+                values = table[field][:]
+                for start in range(0, len(values), partition_len):
+                    chunk = values[start:start + partition_len]
+                    if not chunk.any():
+                        continue
+                    block = writer._partition(start // partition_len, field)
+                    block[:len(chunk), col] = chunk
+    writer._flush()
+
+    return MmapMinuteBarReader(rootdir)
+
+
+class MmapMinuteBarReader(MinuteBarReader):
+    """
+    Reader for data written by MmapMinuteBarWriter.
+
+    Parameters
+    ----------
+    rootdir : string
+        The root directory containing the metadata and partitions.
+    partition_cache_size : int, optional
+        The maximum number of (partition, field) blocks to keep mapped.
+
+    See Also
+    --------
+    zipline.data.mmap_minute_bars.MmapMinuteBarWriter
+    """
+    FIELDS = FIELDS
+
+    def __init__(self, rootdir, partition_cache_size=1000):
+        self._rootdir = rootdir
+
+        metadata = MmapMinuteBarMetadata.read(rootdir)
+
+        self._start_session = metadata.start_session
+        self._end_session = metadata.end_session
+
+        self.calendar = metadata.calendar
+        slicer = self.calendar.schedule.index.slice_indexer(
+            self._start_session,
+            self._end_session,
+        )
+        schedule = self.calendar.schedule[slicer]
+        self._market_open_values = schedule.market_open.values.\
+            astype('datetime64[m]').astype(np.int64)
+        self._market_close_values = schedule.market_close.values.\
+            astype('datetime64[m]').astype(np.int64)
+        # The offset of the last minute of each session from its open.
+        self._last_offsets = (
+            self._market_close_values - self._market_open_values
+        )
+
+        self._minutes_per_day = metadata.minutes_per_day
+        self._partition_len = (
+            metadata.sessions_per_partition * metadata.minutes_per_day
+        )
+        self._sids = np.asarray(metadata.sids, dtype=np.int64)
+
+        ohlc_ratios = metadata.ohlc_ratios_per_sid or {}
+        self._ohlc_inverses = 1.0 / np.array([
+            ohlc_ratios.get(sid, metadata.default_ohlc_ratio)
+            for sid in self._sids
+        ])
+
+        self._partitions = LRU(partition_cache_size)
+
+    @property
+    def trading_calendar(self):
+        return self.calendar
+
+    @lazyval
+    def last_available_dt(self):
+        _, close = self.calendar.open_and_close_for_session(self._end_session)
+        return close
+
+    @property
+    def data_version(self):
+        return _read_data_version(
+            self._rootdir,
+            MmapMinuteBarMetadata.metadata_path(self._rootdir),
+        )
+
+    @property
+    def first_trading_day(self):
+        return self._start_session
+
+    @property
+    def sids(self):
+        return self._sids
+
+    def _partition(self, partition, field):
+        """The block for ``field`` in ``partition``, or None if the partition
+        was never written.
+        """
+        key = partition, field
+        try:
+            return self._partitions[key]
+        except KeyError:
+            pass
+
+        path = _partition_path(self._rootdir, partition, field)
+        try:
+            array = np.load(path, mmap_mode='r')
+        except IOError:
+            if os.path.exists(path):
+                raise
+            # Don't remember the miss, a writer may create the partition
+            # later.
+            return None
+        self._partitions[key] = array
+        return array
+
+    def _columns(self, sids):
+        """The columns for ``sids``, and a mask of which sids are present.
+        """
+        sids = np.asarray(sids, dtype=np.int64)
+        if not len(self._sids):
+            return (
+                np.zeros(len(sids), dtype=np.int64),
+                np.zeros(len(sids), dtype=bool),
+            )
+        cols = np.minimum(self._sids.searchsorted(sids), len(self._sids) - 1)
+        return cols, self._sids[cols] == sids
+
+    def _find_position_of_minute(self, minute_dt):
+        return find_position_of_minute(
+            self._market_open_values,
+            self._market_close_values,
+            minute_dt.value / NANOS_IN_MINUTE,
+            self._minutes_per_day,
+            False,
+        )
+
+    def _pos_to_minute(self, pos):
+        minute_epoch = minute_value(
+            self._market_open_values,
+            pos,
+            self._minutes_per_day
+        )
+        return pd.Timestamp(minute_epoch, tz='UTC', unit="m")
+
+    def _market_positions(self, start_idx, end_idx):
+        """The positions between ``start_idx`` and ``end_idx`` inclusive,
+        excluding the padding after early closes.
+        """
+        positions = np.arange(start_idx, end_idx + 1)
+        sessions = positions // self._minutes_per_day
+        offsets = positions % self._minutes_per_day
+        return positions[offsets <= self._last_offsets[sessions]]
+
+    def get_value(self, sid, dt, field):
+        """
+        Retrieve the pricing info for the given sid, dt, and field.
+
+        Parameters
+        ----------
+        sid : int
+            Asset identifier.
+        dt : datetime-like
+            The datetime at which the trade occurred.
+        field : string
+            The type of pricing data to retrieve.
+            ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        out : float|int
+
+        The market data for the given sid, dt, and field coordinates.
+
+        For OHLC:
+            Returns a float if a trade occurred at the given dt.
+            If no trade occurred, a np.nan is returned.
+
+        For volume:
+            Returns the integer value of the volume.
+            (A volume of 0 signifies no trades for the given dt.)
+        """
+        try:
+            pos = self._find_position_of_minute(dt)
+        except ValueError:
+            raise NoDataOnDate()
+
+        (col,), (found,) = self._columns([sid])
+        if not found:
+            raise NoDataOnDate('No minute data for sid={0}'.format(sid))
+
+        partition, row = divmod(pos, self._partition_len)
+        block = self._partition(partition, field)
+        value = 0 if block is None else block[row, col]
+
+        if value == 0:
+            if field == 'volume':
+                return 0
+            else:
+                return np.nan
+
+        if field != 'volume':
+            return value * self._ohlc_inverses[col]
+        return value
+
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the pricing info for many sids at the same dt.
+
+        The values of all of the sids are read from the same row of the
+        partition holding ``dt``.
+
+        See Also
+        --------
+        :meth:`zipline.data.bar_reader.BarReader.get_values`
+        """
+        try:
+            pos = self._find_position_of_minute(dt)
+        except ValueError:
+            raise NoDataOnDate()
+
+        cols, found = self._columns(sids)
+        if not found.all():
+            raise NoDataOnDate('No minute data for sids={0}'.format(
+                np.asarray(sids)[~found].tolist(),
+            ))
+
+        partition, row = divmod(pos, self._partition_len)
+        block = self._partition(partition, field)
+        if block is None:
+            values = np.zeros(len(cols), dtype=np.uint32)
+        else:
+            values = block[row, cols]
+
+        if field == 'volume':
+            return values.astype(np.int64)
+
+        out = values * self._ohlc_inverses[cols]
+        out[values == 0] = np.nan
+        return out
+
+    def get_last_traded_dt(self, asset, dt):
+        (col,), (found,) = self._columns([asset.sid])
+        if not found:
+            return pd.NaT
+
+        pos = find_position_of_minute(
+            self._market_open_values,
+            self._market_close_values,
+            dt.value / NANOS_IN_MINUTE,
+            self._minutes_per_day,
+            True,
+        )
+        # Don't look before the asset's start date.
+        start_minute = asset.start_date.value / NANOS_IN_MINUTE
+        if start_minute > self._market_open_values[0]:
+            lower = find_position_of_minute(
+                self._market_open_values,
+                self._market_close_values,
+                start_minute,
+                self._minutes_per_day,
+                True,
+            )
+        else:
+            lower = 0
+
+        if pos < lower:
+            return pd.NaT
+
+        partition, row = divmod(pos, self._partition_len)
+        while partition >= 0:
+            partition_start = partition * self._partition_len
+            block = self._partition(partition, 'volume')
+            if block is not None:
+                first_row = max(lower - partition_start, 0)
+                traded = np.flatnonzero(block[first_row:row + 1, col])
+                if len(traded):
+                    return self._pos_to_minute(
+                        partition_start + first_row + traded[-1],
+                    )
+            if partition_start <= lower:
+                break
+            partition -= 1
+            row = self._partition_len - 1
+
+        return pd.NaT
+
+    def load_raw_arrays(self, fields, start_dt, end_dt, sids):
+        """
+        Parameters
+        ----------
+        fields : list of str
+           'open', 'high', 'low', 'close', or 'volume'
+        start_dt: Timestamp
+           Beginning of the window range.
+        end_dt: Timestamp
+           End of the window range.
+        sids : list of int
+           The asset identifiers in the window.
+
+        Returns
+        -------
+        list of np.ndarray
+            A list with an entry per field of ndarrays with shape
+            (minutes in range, sids) with a dtype of float64, containing the
+            values for the respective field over start and end dt range.
+            Sids which are not in the data set have no trades.
+        """
+        start_idx = self._find_position_of_minute(start_dt)
+        end_idx = self._find_position_of_minute(end_dt)
+
+        positions = self._market_positions(start_idx, end_idx)
+        cols, found = self._columns(sids)
+        cols = cols[found]
+        if len(cols) and (np.diff(cols) == 1).all():
+            # Read contiguous columns with a slice so that they are copied
+            # straight out of the mapped block.
+            col_index = slice(cols[0], cols[-1] + 1)
+        else:
+            col_index = cols
+
+        partition_ids = positions // self._partition_len
+        partition_bounds = [
+            (partition, partition_ids.searchsorted([partition, partition + 1]))
+            for partition in np.unique(partition_ids)
+        ]
+
+        results = []
+        for field in fields:
+            raw = np.zeros((len(positions), len(cols)), dtype=np.uint32)
+            for partition, (start, stop) in partition_bounds:
+                block = self._partition(partition, field)
+                if block is None:
+                    continue
+                rows = positions[start:stop] - partition * self._partition_len
+                window = block[rows[0]:rows[-1] + 1, col_index]
+                if len(window) != len(rows):
+                    # Drop the padding after early closes.
+                    window = window[rows - rows[0]]
+                raw[start:stop] = window
+
+            if field != 'volume':
+                values = raw * self._ohlc_inverses[cols]
+                values[raw == 0] = np.nan
+                missing = np.nan
+            else:
+                values = raw
+                missing = 0
+
+            if found.all():
+                results.append(values)
+            else:
+                out = np.full(
+                    (len(positions), len(sids)),
+                    missing,
+                    dtype=values.dtype,
+                )
+                out[:, found] = values
+                results.append(out)
+        return results
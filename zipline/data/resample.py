@@ -13,7 +13,12 @@
 # limitations under the License.
 from collections import OrderedDict
 from abc import ABCMeta, abstractmethod
+import json
+import os
+import shutil
+from tempfile import mkstemp
 
+from lru import LRU
 import numpy as np
 import pandas as pd
 from six import with_metaclass
@@ -29,6 +34,7 @@ from zipline.data.bar_reader import NoDataOnDate
 from zipline.data.minute_bars import MinuteBarReader
 from zipline.data.session_bars import SessionBarReader
 from zipline.utils.memoize import lazyval
+from zipline.utils.paths import ensure_directory
 
 _MINUTE_TO_SESSION_OHCLV_HOW = OrderedDict((
     ('open', 'first'),
@@ -65,6 +71,14 @@ def minute_frame_to_session_frame(minute_frame, calendar):
     return minute_frame.groupby(calendar.minute_to_session_label).agg(how)
 
 
+# The number of sessions which MinuteResampleSessionBarReader resamples and
+# caches together.
+SESSIONS_PER_CACHE_BLOCK = 21
+
+# The number of blocks which MinuteResampleSessionBarReader keeps in memory.
+CACHE_BLOCKS_IN_MEMORY = 64
+
+
 def minute_to_session(column, close_locs, data, out):
     """
     Resample an array with minute data into an array with session data.
@@ -510,10 +524,152 @@ class DailyHistoryAggregator(object):
 
 
 class MinuteResampleSessionBarReader(SessionBarReader):
+    """
+    A SessionBarReader which resamples the bars of a minute bar reader.
+
+    Parameters
+    ----------
+    calendar : zipline.utils.calendars.trading_calendar.TradingCalendar
+        The calendar of the sessions.
+    minute_bar_reader : MinuteBarReader
+        The reader of the minute bars to resample.
+    cache_dir : str, optional
+        A directory in which to keep the resampled bars, so that they are
+        only resampled once across runs. The cache is cleared when the minute
+        bars are written again, e.g. by a new ingestion. By default the
+        resampled bars are only kept in memory.
+    sessions_per_cache_block : int, optional
+        The number of sessions resampled and cached together.
+    blocks_in_memory : int, optional
+        The number of the most recently used blocks kept in memory.
+
+    Notes
+    -----
+    The sessions of the minute data are split into blocks of
+    ``sessions_per_cache_block`` sessions. The first read of a sid in a block
+    resamples every field of the whole block for that sid, and later reads of
+    that block are slices of the cached bars. Blocks in ``cache_dir`` which
+    end after the last session of the minute data are resampled again once
+    the minute data has been extended.
+    """
+    FIELDS = ('open', 'high', 'low', 'close', 'volume')
 
-    def __init__(self, calendar, minute_bar_reader):
+    def __init__(self,
+                 calendar,
+                 minute_bar_reader,
+                 cache_dir=None,
+                 sessions_per_cache_block=SESSIONS_PER_CACHE_BLOCK,
+                 blocks_in_memory=CACHE_BLOCKS_IN_MEMORY):
         self._calendar = calendar
         self._minute_bar_reader = minute_bar_reader
+        self._cache_dir = cache_dir
+        self._sessions_per_block = sessions_per_cache_block
+
+        # Cache of block index -> {'sid': sorted sids, field: bars}.
+        self._blocks = LRU(blocks_in_memory)
+
+        if cache_dir is not None:
+            self._init_cache_dir()
+
+    def _init_cache_dir(self):
+        """Clear ``cache_dir`` if it was written for other minute bars or
+        with other blocks.
+        """
+        reader = self._minute_bar_reader
+        metadata = {
+            'calendar_name': self._calendar.name,
+            'first_session': str(self.sessions[0].date()),
+            'sessions_per_block': self._sessions_per_block,
+            # Identify the minute bars, so that bars which were corrected by
+            # writing them again are resampled again.
+            'minute_bars_last_available_dt': str(reader.last_available_dt),
+            'minute_bars_version': getattr(reader, 'data_version', None),
+        }
+        path = os.path.join(self._cache_dir, 'metadata.json')
+        try:
+            with open(path) as fp:
+                if json.load(fp) == metadata:
+                    return
+        except (IOError, ValueError):
+            pass
+
+        if os.path.exists(self._cache_dir):
+            shutil.rmtree(self._cache_dir)
+        ensure_directory(self._cache_dir)
+        with open(path, 'w') as fp:
+            json.dump(metadata, fp)
+
+    def _block_path(self, block_ix):
+        return os.path.join(self._cache_dir, '{0:06}.npz'.format(block_ix))
+
+    def _empty_block(self, num_sessions):
+        block = {'sid': np.array([], dtype=np.int64)}
+        for field in self.FIELDS:
+            block[field] = np.empty(
+                (num_sessions, 0),
+                dtype=np.uint32 if field == 'volume' else np.float64,
+            )
+        return block
+
+    def _read_block(self, block_ix, num_sessions):
+        if self._cache_dir is not None:
+            try:
+                with np.load(self._block_path(block_ix)) as npz:
+                    block = {name: npz[name] for name in npz.files}
+            except IOError:
+                pass
+            else:
+                # The block is shorter if it was written before the minute
+                # data was extended.
+                if len(block['close']) == num_sessions:
+                    return block
+        return self._empty_block(num_sessions)
+
+    def _write_block(self, block_ix, block):
+        # Write to a temporary file and rename it into place so that readers
+        # never see a partial block.
+        fd, tmp = mkstemp(suffix='.npz', dir=self._cache_dir)
+        os.close(fd)
+        try:
+            np.savez(tmp, **block)
+            os.rename(tmp, self._block_path(block_ix))
+        except:
+            os.remove(tmp)
+            raise
+
+    def _block(self, block_ix, sids):
+        """The block ``block_ix``, resampling the sids in ``sids`` which are
+        not cached yet.
+        """
+        sessions = self.sessions
+        first = block_ix * self._sessions_per_block
+        last = min(first + self._sessions_per_block, len(sessions)) - 1
+
+        try:
+            block = self._blocks[block_ix]
+        except KeyError:
+            block = self._read_block(block_ix, last - first + 1)
+
+        missing = np.setdiff1d(sids, block['sid'])
+        if len(missing):
+            resampled = self._get_resampled(
+                self.FIELDS,
+                sessions[first],
+                sessions[last],
+                missing,
+            )
+            merged_sids = np.concatenate([block['sid'], missing])
+            order = np.argsort(merged_sids, kind='mergesort')
+            merged = {'sid': merged_sids[order]}
+            for field, bars in zip(self.FIELDS, resampled):
+                merged[field] = np.hstack([block[field], bars])[:, order]
+            block = merged
+
+            if self._cache_dir is not None:
+                self._write_block(block_ix, block)
+
+        self._blocks[block_ix] = block
+        return block
 
     def _get_resampled(self, columns, start_session, end_session, assets):
         range_open = self._calendar.session_open(start_session)
@@ -565,14 +721,43 @@ class MinuteResampleSessionBarReader(SessionBarReader):
         return self._calendar
 
     def load_raw_arrays(self, columns, start_dt, end_dt, sids):
-        return self._get_resampled(columns, start_dt, end_dt, sids)
+        sessions = self.sessions
+        start_ix = sessions.searchsorted(start_dt)
+        end_ix = sessions.searchsorted(end_dt)
+        if (start_ix == len(sessions) or
+                end_ix == len(sessions) or
+                sessions[start_ix] != start_dt or
+                sessions[end_ix] != end_dt):
+            # Only the sessions of the minute data are cached.
+            return self._get_resampled(columns, start_dt, end_dt, sids)
+
+        sids = np.asarray(sids, dtype=np.int64)
+        shape = (end_ix - start_ix + 1, len(sids))
+        results = [
+            np.zeros(shape, dtype=np.uint32) if column == 'volume' else
+            np.full(shape, np.nan)
+            for column in columns
+        ]
+
+        per_block = self._sessions_per_block
+        for block_ix in range(start_ix // per_block, end_ix // per_block + 1):
+            block = self._block(block_ix, sids)
+            cols = block['sid'].searchsorted(sids)
+
+            block_start = block_ix * per_block
+            lo = max(start_ix, block_start)
+            hi = min(end_ix + 1, block_start + per_block)
+            rows = slice(lo - block_start, hi - block_start)
+            out_rows = slice(lo - start_ix, hi - start_ix)
+            for column, out in zip(columns, results):
+                out[out_rows] = block[column][rows][:, cols]
+
+        return results
 
     def get_value(self, sid, session, colname):
-        # WARNING: This will need caching or other optimization if used in a
-        # tight loop.
-        # This was developed to complete interface, but has not been tuned
-        # for real world use.
-        return self._get_resampled([colname], session, session, [sid])[0][0][0]
+        return self.load_raw_arrays(
+            [colname], session, session, [sid],
+        )[0][0][0]
 
     @lazyval
     def sessions(self):
@@ -658,6 +843,16 @@ class ReindexBarReader(with_metaclass(ABCMeta)):
             else:
                 return np.nan
 
+    def get_values(self, sids, dt, field):
+        try:
+            return self._reader.get_values(sids, dt, field)
+        except NoDataOnDate:
+            # Fill in the sids without data one at a time.
+            return np.array(
+                [self.get_value(sid, dt, field) for sid in sids],
+                dtype=np.int64 if field == 'volume' else np.float64,
+            )
+
     @abstractmethod
     def _outer_dts(self, start_dt, end_dt):
         raise NotImplementedError
@@ -70,8 +70,10 @@ from zipline.utils.input_validation import (
 from zipline.utils.sqlite_utils import group_into_chunks, coerce_string_to_conn
 from zipline.utils.memoize import lazyval
 from zipline.utils.cli import maybe_show_progress
+from zipline.utils.pool import imap_bounded
 from ._equities import _compute_row_slices, _read_bcolz_data
 from ._adjustments import load_adjustments_from_sqlite
+from .adjustments_index import AdjustmentsIndex
 
 
 logger = logbook.Logger('UsEquityPricing')
@@ -80,6 +82,9 @@ OHLC = frozenset(['open', 'high', 'low', 'close'])
 US_EQUITY_PRICING_BCOLZ_COLUMNS = (
     'open', 'high', 'low', 'close', 'volume', 'day', 'id'
 )
+# The maximum number of assets that are being converted, or waiting to be
+# converted, when writing daily bars with a pool.
+MAX_PENDING_CONVERSIONS = 32
 SQLITE_ADJUSTMENT_COLUMN_DTYPES = {
     'effective_date': integer,
     'ratio': float,
@@ -105,6 +110,15 @@ SQLITE_STOCK_DIVIDEND_PAYOUT_COLUMN_DTYPES = {
     'payment_sid': integer,
     'ratio': float,
 }
+# The columns which identify a row in each adjustments table. Writing a row
+# into an existing adjustments db replaces the rows with the same key.
+SQLITE_ADJUSTMENT_KEYS = {
+    'splits': ('sid', 'effective_date'),
+    'mergers': ('sid', 'effective_date'),
+    'dividends': ('sid', 'effective_date'),
+    'dividend_payouts': ('sid', 'ex_date'),
+    'stock_dividend_payouts': ('sid', 'ex_date'),
+}
 UINT32_MAX = iinfo(uint32).max
 
 
@@ -179,6 +193,18 @@ class BcolzDailyBarWriter(object):
         Midnight UTC session label.
     end_session: pd.Timestamp
         Midnight UTC session label.
+    pool : Pool, optional
+        A pool used by ``write`` to validate and convert each asset's data
+        concurrently. This object must support ``apply_async``, for example
+        :class:`multiprocessing.Pool`. The converted data is still appended
+        to the output table in order. If not provided, each asset is
+        converted serially.
+    append_to : bcolz.ctable, optional
+        A table written by a ``BcolzDailyBarWriter`` with the same calendar
+        and start session. The data passed to ``write`` is appended to each
+        asset's rows from this table, and assets which are not written keep
+        their rows from this table. The new data for an asset must start
+        after its last row in this table.
 
     See Also
     --------
@@ -192,8 +218,16 @@ class BcolzDailyBarWriter(object):
         'volume': float64,
     }
 
-    def __init__(self, filename, calendar, start_session, end_session):
+    def __init__(self,
+                 filename,
+                 calendar,
+                 start_session,
+                 end_session,
+                 pool=None,
+                 append_to=None):
         self._filename = filename
+        self._pool = pool
+        self._append_to = append_to
 
         if start_session != end_session:
             if not calendar.is_session(start_session):
@@ -227,7 +261,13 @@ class BcolzDailyBarWriter(object):
         ----------
         data : iterable[tuple[int, pandas.DataFrame or bcolz.ctable]]
             The data chunks to write. Each chunk should be a tuple of sid
-            and the data for that asset.
+            and the data for that asset. The data may also be a callable
+            taking no arguments which returns the data. When writing with a
+            pool, it is called on the pool, so parsing can happen
+            concurrently too. With a process pool, such as the one used by
+            ``zipline ingest -j``, the callable must be picklable, e.g. a
+            module-level function or a :func:`functools.partial` of one, not
+            a lambda or a closure.
         assets : set[int], optional
             The assets that should be in ``data``. If this is provided
             we will check ``data`` against the assets and provide better
@@ -243,11 +283,30 @@ class BcolzDailyBarWriter(object):
         table : bcolz.ctable
             The newly-written table.
         """
-        ctx = maybe_show_progress(
-            (
-                (sid, self.to_ctable(df, invalid_data_behavior))
+        if self._pool is None:
+            tables = (
+                (
+                    sid,
+                    self.to_ctable(
+                        df() if callable(df) else df,
+                        invalid_data_behavior,
+                    ),
+                )
                 for sid, df in data
-            ),
+            )
+        else:
+            tables = imap_bounded(
+                self._pool,
+                _to_uint32_records,
+                (
+                    (sid, df, invalid_data_behavior)
+                    for sid, df in data
+                ),
+                max_pending=MAX_PENDING_CONVERSIONS,
+            )
+
+        ctx = maybe_show_progress(
+            tables,
             show_progress=show_progress,
             item_show_func=self.progress_bar_item_show_func,
             label=self.progress_bar_message,
@@ -291,6 +350,7 @@ class BcolzDailyBarWriter(object):
         Internal implementation of write.
 
         `iterator` should be an iterator yielding pairs of (asset, ctable).
+        The tables may also be numpy record arrays with the same columns.
         """
         total_rows = 0
         first_row = {}
@@ -316,6 +376,9 @@ class BcolzDailyBarWriter(object):
                         raise ValueError('unknown asset id %r' % asset_id)
                     yield asset_id, table
 
+        if self._append_to is not None:
+            iterator = self._append_to_existing(iterator)
+
         for asset_id, table in iterator:
             nrows = len(table)
             for column_name in columns:
@@ -329,10 +392,13 @@ class BcolzDailyBarWriter(object):
 
                 columns[column_name].append(table[column_name])
 
+            # Record arrays give numpy scalars, which can't be stored in
+            # `attrs`.
+            first_day = int(table["day"][0])
             if earliest_date is None:
-                earliest_date = table["day"][0]
+                earliest_date = first_day
             else:
-                earliest_date = min(earliest_date, table["day"][0])
+                earliest_date = min(earliest_date, first_day)
 
             # Bcolz doesn't support ints as keys in `attrs`, so convert
             # assets to strings for use as attr keys.
@@ -408,19 +474,88 @@ class BcolzDailyBarWriter(object):
         full_table.flush()
         return full_table
 
+    def _append_to_existing(self, iterator):
+        """
+        Prepend each asset's rows from ``self._append_to`` to the new rows
+        for that asset, then add the assets which had no new rows.
+
+        `iterator` should be an iterator yielding pairs of (asset, table).
+        """
+        existing = self._append_to
+        first_row = existing.attrs['first_row']
+        last_row = existing.attrs['last_row']
+        remaining = set(first_row)
+
+        columns = [c for c in US_EQUITY_PRICING_BCOLZ_COLUMNS if c != 'id']
+        dtype = [(c, uint32) for c in columns]
+
+        for asset_id, table in iterator:
+            asset_key = str(asset_id)
+            if asset_key not in remaining:
+                yield asset_id, table
+                continue
+            remaining.remove(asset_key)
+
+            old = existing[first_row[asset_key]:last_row[asset_key] + 1]
+            if table['day'][0] <= old['day'][-1]:
+                raise ValueError(
+                    'Data for asset %d starts on %s, which is not after the'
+                    ' last day in the table being appended to, %s.' % (
+                        asset_id,
+                        Timestamp(table['day'][0], unit='s', tz='UTC'),
+                        Timestamp(old['day'][-1], unit='s', tz='UTC'),
+                    ),
+                )
+            merged = np.empty(len(old) + len(table), dtype=dtype)
+            for column in columns:
+                merged[column][:len(old)] = old[column]
+                merged[column][len(old):] = table[column][:]
+            yield asset_id, merged
+
+        for asset_key in sorted(remaining, key=int):
+            yield int(asset_key), existing[
+                first_row[asset_key]:last_row[asset_key] + 1
+            ]
+
     @expect_element(invalid_data_behavior={'warn', 'raise', 'ignore'})
     def to_ctable(self, raw_data, invalid_data_behavior):
         if isinstance(raw_data, ctable):
             # we already have a ctable so do nothing
             return raw_data
 
-        winsorise_uint32(raw_data, invalid_data_behavior, 'volume', *OHLC)
-        processed = (raw_data[list(OHLC)] * 1000).astype('uint32')
-        dates = raw_data.index.values.astype('datetime64[s]')
-        check_uint32_safe(dates.max().view(np.int64), 'day')
-        processed['day'] = dates.astype('uint32')
-        processed['volume'] = raw_data.volume.astype('uint32')
-        return ctable.fromdataframe(processed)
+        return ctable.fromdataframe(
+            _to_uint32_frame(raw_data, invalid_data_behavior),
+        )
+
+
+def _to_uint32_frame(raw_data, invalid_data_behavior):
+    """Convert a DataFrame of daily OHLCV data into the uint32 columns stored
+    by the BcolzDailyBarWriter.
+    """
+    winsorise_uint32(raw_data, invalid_data_behavior, 'volume', *OHLC)
+    processed = (raw_data[list(OHLC)] * 1000).astype('uint32')
+    dates = raw_data.index.values.astype('datetime64[s]')
+    check_uint32_safe(dates.max().view(np.int64), 'day')
+    processed['day'] = dates.astype('uint32')
+    processed['volume'] = raw_data.volume.astype('uint32')
+    return processed
+
+
+def _to_uint32_records(args):
+    """Convert one asset's data for ``BcolzDailyBarWriter.write`` on a pool.
+
+    The result is returned as a record array rather than a ctable so that it
+    can be sent back from another process.
+    """
+    sid, raw_data, invalid_data_behavior = args
+    if callable(raw_data):
+        raw_data = raw_data()
+    if isinstance(raw_data, ctable):
+        return sid, raw_data[:]
+    return sid, _to_uint32_frame(
+        raw_data,
+        invalid_data_behavior,
+    ).to_records(index=False)
 
 
 class BcolzDailyBarReader(SessionBarReader):
@@ -881,6 +1016,11 @@ class SQLiteAdjustmentWriter(object):
         If True and conn_or_path is a string, remove any existing files at the
         given path before connecting.
 
+    Notes
+    -----
+    If the database already has adjustments, the new rows are added to them.
+    Existing rows for the same sid and date are replaced.
+
     See Also
     --------
     zipline.data.us_equity_pricing.SQLiteAdjustmentReader
@@ -938,6 +1078,8 @@ class SQLiteAdjustmentWriter(object):
                         ),
                     )
 
+            self._delete_existing(tablename, frame)
+
         frame.to_sql(
             tablename,
             self.conn,
@@ -945,6 +1087,27 @@ class SQLiteAdjustmentWriter(object):
             chunksize=50000,
         )
 
+    def _delete_existing(self, tablename, frame):
+        """Delete the rows of ``tablename`` with the same keys as the rows of
+        ``frame``.
+        """
+        exists = self.conn.execute(
+            "SELECT COUNT(*) FROM sqlite_master "
+            "WHERE type='table' AND name=?",
+            (tablename,),
+        ).fetchone()[0]
+        if not exists:
+            return
+
+        keys = SQLITE_ADJUSTMENT_KEYS[tablename]
+        self.conn.executemany(
+            'DELETE FROM {0} WHERE {1}'.format(
+                tablename,
+                ' AND '.join('%s = ?' % key for key in keys),
+            ),
+            zip(*(frame[key].values.tolist() for key in keys)),
+        )
+
     def write_frame(self, tablename, frame):
         if tablename not in SQLITE_ADJUSTMENT_TABLENAMES:
             raise ValueError(
@@ -1203,43 +1366,43 @@ class SQLiteAdjustmentWriter(object):
         self.write_frame('mergers', mergers)
         self.write_dividend_data(dividends, stock_dividends)
         self.conn.execute(
-            "CREATE INDEX splits_sids "
+            "CREATE INDEX IF NOT EXISTS splits_sids "
             "ON splits(sid)"
         )
         self.conn.execute(
-            "CREATE INDEX splits_effective_date "
+            "CREATE INDEX IF NOT EXISTS splits_effective_date "
             "ON splits(effective_date)"
         )
         self.conn.execute(
-            "CREATE INDEX mergers_sids "
+            "CREATE INDEX IF NOT EXISTS mergers_sids "
             "ON mergers(sid)"
         )
         self.conn.execute(
-            "CREATE INDEX mergers_effective_date "
+            "CREATE INDEX IF NOT EXISTS mergers_effective_date "
             "ON mergers(effective_date)"
         )
         self.conn.execute(
-            "CREATE INDEX dividends_sid "
+            "CREATE INDEX IF NOT EXISTS dividends_sid "
             "ON dividends(sid)"
         )
         self.conn.execute(
-            "CREATE INDEX dividends_effective_date "
+            "CREATE INDEX IF NOT EXISTS dividends_effective_date "
             "ON dividends(effective_date)"
         )
         self.conn.execute(
-            "CREATE INDEX dividend_payouts_sid "
+            "CREATE INDEX IF NOT EXISTS dividend_payouts_sid "
             "ON dividend_payouts(sid)"
         )
         self.conn.execute(
-            "CREATE INDEX dividends_payouts_ex_date "
+            "CREATE INDEX IF NOT EXISTS dividends_payouts_ex_date "
             "ON dividend_payouts(ex_date)"
         )
         self.conn.execute(
-            "CREATE INDEX stock_dividend_payouts_sid "
+            "CREATE INDEX IF NOT EXISTS stock_dividend_payouts_sid "
             "ON stock_dividend_payouts(sid)"
         )
         self.conn.execute(
-            "CREATE INDEX stock_dividends_payouts_ex_date "
+            "CREATE INDEX IF NOT EXISTS stock_dividends_payouts_ex_date "
             "ON stock_dividend_payouts(ex_date)"
         )
 
@@ -1274,15 +1437,31 @@ class SQLiteAdjustmentReader(object):
     ----------
     conn : str or sqlite3.Connection
         Connection from which to load data.
+    preload : bool, optional
+        Read every adjustment into memory up front and serve all lookups from
+        the in-memory copy instead of querying the db. This is much faster
+        when adjustments are looked up for many assets or many times, for
+        example in long backtests and pipelines.
+    index : AdjustmentsIndex, optional
+        An index to serve all lookups from instead of the db, for example
+        one read with ``AdjustmentsIndex.read``. This takes precedence over
+        ``preload``.
 
     See Also
     --------
     :class:`zipline.data.us_equity_pricing.SQLiteAdjustmentWriter`
+    :class:`zipline.data.adjustments_index.AdjustmentsIndex`
     """
 
     @preprocess(conn=coerce_string_to_conn)
-    def __init__(self, conn):
+    def __init__(self, conn, preload=False, index=None):
         self.conn = conn
+        if index is not None:
+            self._index = index
+        elif preload:
+            self._index = AdjustmentsIndex.from_conn(conn)
+        else:
+            self._index = None
 
         # Given the tables in the adjustments.db file, dict which knows which
         # col names contain dates that have been coerced into ints.
@@ -1297,6 +1476,8 @@ class SQLiteAdjustmentReader(object):
         }
 
     def load_adjustments(self, columns, dates, assets):
+        if self._index is not None:
+            return self._index.load_adjustments(list(columns), dates, assets)
         return load_adjustments_from_sqlite(
             self.conn,
             list(columns),
@@ -1305,6 +1486,8 @@ class SQLiteAdjustmentReader(object):
         )
 
     def get_adjustments_for_sid(self, table_name, sid):
+        if self._index is not None:
+            return self._index.get_adjustments_for_sid(table_name, sid)
         t = (sid,)
         c = self.conn.cursor()
         adjustments_for_sid = c.execute(
@@ -1316,7 +1499,55 @@ class SQLiteAdjustmentReader(object):
                 for adjustment in
                 adjustments_for_sid]
 
+    def get_splits(self, assets, dt):
+        """
+        Returns the splits for the given sids which are effective on the
+        given dt.
+
+        Parameters
+        ----------
+        assets : container
+            Sids for which we want splits.
+        dt : pd.Timestamp
+            The date for which we are checking for splits. Note: this is
+            expected to be midnight UTC.
+
+        Returns
+        -------
+        splits : list[(int, float)]
+            List of splits, where each split is a (sid, ratio) tuple.
+        """
+        if self._index is not None:
+            return self._index.get_splits(assets, dt)
+
+        # convert dt to # of seconds since epoch, because that's what we use
+        # in the adjustments db
+        seconds = int(dt.value / 1e9)
+
+        splits = self.conn.execute(
+            "SELECT sid, ratio FROM SPLITS WHERE effective_date = ?",
+            (seconds,)).fetchall()
+
+        return [split for split in splits if split[0] in assets]
+
     def get_dividends_with_ex_date(self, assets, date, asset_finder):
+        if self._index is not None:
+            payouts = self._index.payouts_with_ex_date(
+                'dividend_payouts', assets, date,
+            )
+            return [
+                Dividend(
+                    asset_finder.retrieve_asset(sid),
+                    amount,
+                    Timestamp(pay_date, unit='s', tz='UTC'),
+                )
+                for sid, amount, pay_date in zip(
+                    payouts['sid'].tolist(),
+                    payouts['amount'].tolist(),
+                    payouts['pay_date'].tolist(),
+                )
+            ]
+
         seconds = date.value / int(1e9)
         c = self.conn.cursor()
 
@@ -1339,6 +1570,25 @@ class SQLiteAdjustmentReader(object):
         return divs
 
     def get_stock_dividends_with_ex_date(self, assets, date, asset_finder):
+        if self._index is not None:
+            payouts = self._index.payouts_with_ex_date(
+                'stock_dividend_payouts', assets, date,
+            )
+            return [
+                StockDividend(
+                    asset_finder.retrieve_asset(sid),
+                    asset_finder.retrieve_asset(payment_sid),
+                    ratio,
+                    Timestamp(pay_date, unit='s', tz='UTC'),
+                )
+                for sid, payment_sid, ratio, pay_date in zip(
+                    payouts['sid'].tolist(),
+                    payouts['payment_sid'].tolist(),
+                    payouts['ratio'].tolist(),
+                    payouts['pay_date'].tolist(),
+                )
+            ]
+
         seconds = date.value / int(1e9)
         c = self.conn.cursor()
 
@@ -1408,3 +1658,140 @@ class SQLiteAdjustmentReader(object):
             )
             for t_name, date_cols in self._datetime_int_cols.items()
         }
+
+
+class CorporateActionCalendar(object):
+    """
+    The splits and dividend payouts in an adjustments db which take effect in
+    a range of sessions, grouped by session.
+
+    The calendar is read from the db once, and answers the per-session lookups
+    made during a simulation with dictionary lookups. Lookups for sessions
+    outside of the range are forwarded to ``reader``.
+
+    Parameters
+    ----------
+    reader : SQLiteAdjustmentReader
+        The reader to build the calendar from.
+    start_session : pd.Timestamp
+        The first session in the calendar.
+    end_session : pd.Timestamp
+        The last session in the calendar.
+
+    See Also
+    --------
+    :meth:`zipline.data.data_portal.DataPortal.load_corporate_actions`
+    """
+
+    def __init__(self, reader, start_session, end_session):
+        self._reader = reader
+        self.start_session = start_session
+        self.end_session = end_session
+
+        start = start_session.value // int(1e9)
+        end = end_session.value // int(1e9)
+        conn = reader.conn
+
+        self._splits = self._group_by_date(conn.execute(
+            "SELECT effective_date, sid, ratio FROM splits "
+            "WHERE effective_date >= ? AND effective_date <= ?",
+            (start, end),
+        ))
+        self._dividends = self._group_by_date(conn.execute(
+            "SELECT ex_date, sid, amount, pay_date FROM dividend_payouts "
+            "WHERE ex_date >= ? AND ex_date <= ?",
+            (start, end),
+        ))
+
+        # Stock dividends are also looked up by sid and a range of ex dates,
+        # so every stock dividend with a later ex date is kept.
+        self._stock_dividends = {}
+        self._stock_dividends_by_sid = {}
+        for row in conn.execute(
+                "SELECT declared_date, ex_date, pay_date, payment_sid, ratio, "
+                "record_date, sid FROM stock_dividend_payouts "
+                "WHERE ex_date >= ?",
+                (start,)):
+            self._stock_dividends.setdefault(row[1], []).append(
+                (row[6], row[3], row[4], row[2]),
+            )
+            self._stock_dividends_by_sid.setdefault(row[6], []).append(row)
+
+    @staticmethod
+    def _group_by_date(rows):
+        grouped = {}
+        for row in rows:
+            grouped.setdefault(row[0], []).append(row[1:])
+        return grouped
+
+    def covers(self, dt):
+        """Whether the calendar holds the corporate actions on ``dt``.
+        """
+        return self.start_session <= dt <= self.end_session
+
+    def get_splits(self, assets, dt):
+        if not self.covers(dt):
+            return self._reader.get_splits(assets, dt)
+
+        return [
+            (sid, ratio)
+            for sid, ratio in self._splits.get(dt.value // int(1e9), ())
+            if sid in assets
+        ]
+
+    def get_dividends_with_ex_date(self, assets, date, asset_finder):
+        if not self.covers(date):
+            return self._reader.get_dividends_with_ex_date(
+                assets, date, asset_finder,
+            )
+
+        return [
+            Dividend(
+                asset_finder.retrieve_asset(sid),
+                amount,
+                Timestamp(pay_date, unit='s', tz='UTC'),
+            )
+            for sid, amount, pay_date in self._dividends.get(
+                date.value // int(1e9), (),
+            )
+            if sid in assets
+        ]
+
+    def get_stock_dividends_with_ex_date(self, assets, date, asset_finder):
+        if not self.covers(date):
+            return self._reader.get_stock_dividends_with_ex_date(
+                assets, date, asset_finder,
+            )
+
+        return [
+            StockDividend(
+                asset_finder.retrieve_asset(sid),
+                asset_finder.retrieve_asset(payment_sid),
+                ratio,
+                Timestamp(pay_date, unit='s', tz='UTC'),
+            )
+            for sid, payment_sid, ratio, pay_date in self._stock_dividends.get(
+                date.value // int(1e9), (),
+            )
+            if sid in assets
+        ]
+
+    def get_stock_dividend_rows(self, sid, start_date, end_date):
+        """The stock dividends for ``sid`` with an ex date after
+        ``start_date`` and a pay date before ``end_date``.
+
+        ``start_date`` must not be before the first session of the calendar.
+
+        Returns
+        -------
+        rows : list[tuple]
+            The declared_date, ex_date, pay_date, payment_sid, ratio,
+            record_date and sid of each stock dividend, with the dates in
+            seconds since the epoch.
+        """
+        start = start_date.value / 1e9
+        end = end_date.value / 1e9
+        return [
+            row for row in self._stock_dividends_by_sid.get(int(sid), ())
+            if row[1] > start and row[2] < end
+        ]
@@ -112,6 +112,81 @@ def calc_gross_value(long_value, short_value):
     return long_value + abs(short_value)
 
 
+class PositionColumns(object):
+    """The tracked positions as parallel arrays.
+
+    Parameters
+    ----------
+    positions : iterable[Position]
+        The positions, in order.
+
+    Attributes
+    ----------
+    positions : list[Position]
+        The positions, in the order of the arrays.
+    assets : list[Asset]
+        The asset of each position.
+    amounts : np.array[float64]
+        The amount of each position.
+    last_sale_prices : np.array[float64]
+        The last sale price of each position.
+    multipliers : np.array[float64]
+        The multiplier of the exposure of each position. This is the contract
+        multiplier for futures and 1 otherwise.
+    value_multipliers : np.array[float64]
+        The multiplier of the value of each position. This is 0 for futures,
+        which don't have an inherent position value, and 1 otherwise.
+    """
+    def __init__(self, positions):
+        self.positions = positions = list(positions)
+        self.assets = [position.asset for position in positions]
+
+        is_future = np.array(
+            [isinstance(asset, Future) for asset in self.assets],
+            dtype=bool,
+        )
+        self.amounts = np.array(
+            [position.amount for position in positions],
+            dtype=np.float64,
+        )
+        self.last_sale_prices = np.array(
+            [position.last_sale_price for position in positions],
+            dtype=np.float64,
+        )
+        self.multipliers = np.array(
+            [
+                asset.multiplier if future else 1.0
+                for asset, future in zip(self.assets, is_future)
+            ],
+            dtype=np.float64,
+        )
+        self.value_multipliers = (~is_future).astype(np.float64)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def update_last_sale_prices(self, prices):
+        """Set the last sale price of each position to the price at the same
+        index of ``prices``, except where it is nan.
+
+        Returns
+        -------
+        updated : np.array[int64]
+            The indices of the positions whose last sale price changed.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        updated = np.flatnonzero(
+            ~np.isnan(prices) & (prices != self.last_sale_prices),
+        )
+        self.last_sale_prices[updated] = prices[updated]
+
+        positions = self.positions
+        for ix, price in zip(updated.tolist(), prices[updated].tolist()):
+            positions[ix].last_sale_price = price
+
+        return updated
+
+
 class PositionTracker(object):
 
     def __init__(self, data_frequency):
@@ -123,6 +198,30 @@ class PositionTracker(object):
 
         self.data_frequency = data_frequency
 
+        # Columnar copy of ``positions``, rebuilt on demand after positions
+        # are added, removed or changed by anything but a price sync.
+        self._columns = None
+        # The result of ``stats``, until any position changes.
+        self._stats = None
+        # The assets whose entries in ``_positions_store`` are out of date.
+        self._dirty_assets = set()
+
+    @property
+    def columns(self):
+        """The positions as a :class:`PositionColumns`.
+        """
+        if self._columns is None:
+            self._columns = PositionColumns(itervalues(self.positions))
+        return self._columns
+
+    def _positions_changed(self, assets):
+        """Record that the positions of ``assets`` were added, removed or
+        changed by anything but a price sync.
+        """
+        self._columns = None
+        self._stats = None
+        self._dirty_assets.update(assets)
+
     @expect_types(asset=Asset)
     def update_position(self, asset, amount=None, last_sale_price=None,
                         last_sale_date=None, cost_basis=None):
@@ -132,6 +231,8 @@ class PositionTracker(object):
         else:
             position = self.positions[asset]
 
+        self._positions_changed((asset,))
+
         if amount is not None:
             position.amount = amount
         if last_sale_price is not None:
@@ -153,6 +254,7 @@ class PositionTracker(object):
             position = self.positions[asset]
 
         position.update(txn)
+        self._positions_changed((asset,))
 
         if position.amount == 0:
             del self.positions[asset]
@@ -169,6 +271,7 @@ class PositionTracker(object):
         # Adjust the cost basis of the stock if we own it
         if asset in self.positions:
             self.positions[asset].adjust_commission_cost_basis(asset, cost)
+            self._dirty_assets.add(asset)
 
     def handle_splits(self, splits):
         """
@@ -185,6 +288,7 @@ class PositionTracker(object):
             position.
         """
         total_leftover_cash = 0
+        self._positions_changed(asset for asset, _ in splits)
 
         for asset, ratio in splits:
             if asset in self.positions:
@@ -256,6 +360,12 @@ class PositionTracker(object):
         except:
             stock_payments = []
 
+        if stock_payments:
+            self._positions_changed(
+                stock_payment['payment_asset']
+                for stock_payment in stock_payments
+            )
+
         for stock_payment in stock_payments:
             payment_asset = stock_payment['payment_asset']
             share_count = stock_payment['share_count']
@@ -297,13 +407,20 @@ class PositionTracker(object):
 
         positions = self._positions_store
 
-        for asset, pos in iteritems(self.positions):
+        # Only the positions which changed since the last call are rebuilt.
+        dirty_assets = self._dirty_assets
+        if not dirty_assets:
+            return positions
+
+        for asset in dirty_assets:
+            pos = self.positions[asset]
 
-            if pos.amount == 0:
-                # Clear out the position if it has become empty since the last
-                # time get_positions was called.  Catching the KeyError is
-                # faster than checking `if asset in positions`, and this can be
-                # potentially called in a tight inner loop.
+            if pos is None or pos.amount == 0:
+                # Clear out the position if it has been closed or has become
+                # empty since the last time get_positions was called.
+                # Catching the KeyError is faster than checking
+                # `if asset in positions`, and this can be potentially called
+                # in a tight inner loop.
                 try:
                     del positions[asset]
                 except KeyError:
@@ -320,6 +437,7 @@ class PositionTracker(object):
             # one we have currently
             positions[asset] = position
 
+        dirty_assets.clear()
         return positions
 
     def get_positions_list(self):
@@ -331,51 +449,62 @@ class PositionTracker(object):
 
     def sync_last_sale_prices(self, dt, handle_non_market_minutes,
                               data_portal):
-        if not handle_non_market_minutes:
-            for asset, position in iteritems(self.positions):
-                last_sale_price = data_portal.get_spot_value(
-                    asset, 'price', dt, self.data_frequency
-                )
+        columns = self.columns
+        if not len(columns):
+            return
 
-                if not np.isnan(last_sale_price):
-                    position.last_sale_price = last_sale_price
+        if not handle_non_market_minutes:
+            # Look up the prices of all of the assets in one call.
+            last_sale_prices = data_portal.get_spot_value(
+                columns.assets, 'price', dt, self.data_frequency
+            )
         else:
-            for asset, position in iteritems(self.positions):
-                last_sale_price = data_portal.get_adjusted_value(
+            previous_minute = data_portal.trading_calendar.previous_minute(dt)
+            last_sale_prices = [
+                data_portal.get_adjusted_value(
                     asset,
                     'price',
-                    data_portal.trading_calendar.previous_minute(dt),
+                    previous_minute,
                     dt,
                     self.data_frequency
                 )
+                for asset in columns.assets
+            ]
 
-                if not np.isnan(last_sale_price):
-                    position.last_sale_price = last_sale_price
+        updated = columns.update_last_sale_prices(last_sale_prices)
+        if len(updated):
+            self._stats = None
+            assets = columns.assets
+            self._dirty_assets.update(assets[ix] for ix in updated.tolist())
 
     def stats(self):
-        amounts = []
-        last_sale_prices = []
-        for pos in itervalues(self.positions):
-            amounts.append(pos.amount)
-            last_sale_prices.append(pos.last_sale_price)
-
-        position_values = calc_position_values(itervalues(self.positions))
-        position_exposures = calc_position_exposures(
-            itervalues(self.positions)
+        if self._stats is not None:
+            return self._stats
+
+        columns = self.columns
+        position_values = (
+            columns.last_sale_prices *
+            columns.amounts *
+            columns.value_multipliers
+        )
+        position_exposures = (
+            columns.amounts *
+            columns.last_sale_prices *
+            columns.multipliers
         )
 
-        long_value = calc_long_value(position_values)
-        short_value = calc_short_value(position_values)
+        long_value = position_values[position_values > 0].sum()
+        short_value = position_values[position_values < 0].sum()
         gross_value = calc_gross_value(long_value, short_value)
-        long_exposure = calc_long_exposure(position_exposures)
-        short_exposure = calc_short_exposure(position_exposures)
+        long_exposure = position_exposures[position_exposures > 0].sum()
+        short_exposure = position_exposures[position_exposures < 0].sum()
         gross_exposure = calc_gross_exposure(long_exposure, short_exposure)
-        net_exposure = calc_net(position_exposures)
-        longs_count = calc_longs_count(position_exposures)
-        shorts_count = calc_shorts_count(position_exposures)
-        net_value = calc_net(position_values)
+        net_exposure = position_exposures.sum()
+        longs_count = np.count_nonzero(position_exposures > 0)
+        shorts_count = np.count_nonzero(position_exposures < 0)
+        net_value = position_values.sum()
 
-        return PositionStats(
+        self._stats = PositionStats(
             long_value=long_value,
             gross_value=gross_value,
             short_value=short_value,
@@ -387,3 +516,4 @@ class PositionTracker(object):
             shorts_count=shorts_count,
             net_value=net_value
         )
+        return self._stats
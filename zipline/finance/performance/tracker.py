@@ -433,7 +433,9 @@ class PerformanceTracker(object):
         # Check for any dividends, then return the daily perf packet
         self.check_upcoming_dividends(
             next_session=next_session,
-            adjustment_reader=data_portal._adjustment_reader
+            adjustment_reader=data_portal._corporate_actions_reader(
+                next_session,
+            ),
         )
 
         return daily_update
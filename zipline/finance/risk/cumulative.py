@@ -27,22 +27,213 @@ from . risk import (
     choose_treasury
 )
 
-from empyrical import (
-    alpha_beta_aligned,
-    annual_volatility,
-    cum_returns,
-    downside_risk,
-    max_drawdown,
-    sharpe_ratio,
-    sortino_ratio,
-)
-
 log = logbook.Logger('Risk Cumulative')
 
 
 choose_treasury = functools.partial(choose_treasury, lambda *args: '10year',
                                     compound=False)
 
+# The annualization factor for daily returns used by empyrical.
+ANNUALIZATION_FACTOR = 252
+
+
+class RiskAccumulator(object):
+    """
+    Running state from which the cumulative risk metrics of a pair of
+    algorithm and benchmark return series can be computed in constant time.
+
+    Each metric matches the corresponding empyrical function applied to the
+    full return series, up to floating point error. Like empyrical, missing
+    returns are treated as zero when compounding and are otherwise ignored.
+
+    :Usage:
+        Call update() with each day's returns, then read the metrics off of
+        the accumulator. Use copy() to compute metrics for a tentative
+        observation without changing the accumulator.
+    """
+    __slots__ = (
+        'count',
+        'algorithm_growth',
+        'benchmark_growth',
+        'peak',
+        'max_drawdown',
+        'algorithm_count',
+        'algorithm_mean',
+        'algorithm_m2',
+        'algorithm_downside_sum_squares',
+        'benchmark_count',
+        'benchmark_mean',
+        'benchmark_m2',
+        'joint_count',
+        'joint_algorithm_mean',
+        'joint_benchmark_mean',
+        'joint_benchmark_m2',
+        'joint_comoment',
+    )
+
+    def __init__(self):
+        # The number of observations, including missing returns.
+        self.count = 0
+
+        # Compounded growth of one unit, for cumulative returns and drawdowns.
+        self.algorithm_growth = 1.0
+        self.benchmark_growth = 1.0
+        self.peak = -np.inf
+        self.max_drawdown = np.nan
+
+        # Welford accumulators for the mean and sum of squared deviations of
+        # the algorithm returns and of the benchmark returns.
+        self.algorithm_count = 0
+        self.algorithm_mean = np.nan
+        self.algorithm_m2 = 0.0
+        self.algorithm_downside_sum_squares = 0.0
+        self.benchmark_count = 0
+        self.benchmark_mean = np.nan
+        self.benchmark_m2 = 0.0
+
+        # Accumulators over the days on which both returns are present, for
+        # alpha and beta.
+        self.joint_count = 0
+        self.joint_algorithm_mean = 0.0
+        self.joint_benchmark_mean = 0.0
+        self.joint_benchmark_m2 = 0.0
+        self.joint_comoment = 0.0
+
+    def copy(self):
+        new = RiskAccumulator.__new__(RiskAccumulator)
+        for name in self.__slots__:
+            setattr(new, name, getattr(self, name))
+        return new
+
+    def update(self, algorithm_returns, benchmark_returns):
+        self.count += 1
+
+        algorithm_missing = np.isnan(algorithm_returns)
+        benchmark_missing = np.isnan(benchmark_returns)
+
+        if not algorithm_missing:
+            self.algorithm_growth *= 1.0 + algorithm_returns
+
+            self.algorithm_count += 1
+            if self.algorithm_count == 1:
+                self.algorithm_mean = 0.0
+            delta = algorithm_returns - self.algorithm_mean
+            self.algorithm_mean += delta / self.algorithm_count
+            self.algorithm_m2 += delta * (
+                algorithm_returns - self.algorithm_mean
+            )
+
+            if algorithm_returns < 0:
+                self.algorithm_downside_sum_squares += algorithm_returns ** 2
+
+        if not benchmark_missing:
+            self.benchmark_growth *= 1.0 + benchmark_returns
+
+            self.benchmark_count += 1
+            if self.benchmark_count == 1:
+                self.benchmark_mean = 0.0
+            delta = benchmark_returns - self.benchmark_mean
+            self.benchmark_mean += delta / self.benchmark_count
+            self.benchmark_m2 += delta * (
+                benchmark_returns - self.benchmark_mean
+            )
+
+        if not (algorithm_missing or benchmark_missing):
+            self.joint_count += 1
+            algorithm_delta = algorithm_returns - self.joint_algorithm_mean
+            self.joint_algorithm_mean += algorithm_delta / self.joint_count
+            benchmark_delta = benchmark_returns - self.joint_benchmark_mean
+            self.joint_benchmark_mean += benchmark_delta / self.joint_count
+            self.joint_benchmark_m2 += benchmark_delta * (
+                benchmark_returns - self.joint_benchmark_mean
+            )
+            self.joint_comoment += algorithm_delta * (
+                benchmark_returns - self.joint_benchmark_mean
+            )
+
+        # Drawdowns are measured on the value of 100 units, as in empyrical.
+        value = self.algorithm_growth * 100
+        if value > self.peak:
+            self.peak = value
+        if self.peak != 0:
+            drawdown = (value - self.peak) / self.peak
+            if not drawdown >= self.max_drawdown:
+                self.max_drawdown = drawdown
+
+    @property
+    def algorithm_cumulative_returns(self):
+        return self.algorithm_growth - 1.0
+
+    @property
+    def benchmark_cumulative_returns(self):
+        return self.benchmark_growth - 1.0
+
+    @staticmethod
+    def _annual_volatility(count, m2, n):
+        if n < 2 or count < 2:
+            return np.nan
+        return np.sqrt(m2 / (count - 1)) * np.sqrt(ANNUALIZATION_FACTOR)
+
+    @property
+    def algorithm_volatility(self):
+        return self._annual_volatility(
+            self.algorithm_count,
+            self.algorithm_m2,
+            self.count,
+        )
+
+    @property
+    def benchmark_volatility(self):
+        return self._annual_volatility(
+            self.benchmark_count,
+            self.benchmark_m2,
+            self.count,
+        )
+
+    @property
+    def beta(self):
+        if self.count < 2 or self.joint_count < 2:
+            return np.nan
+        benchmark_variance = self.joint_benchmark_m2 / self.joint_count
+        if abs(benchmark_variance) < 1.0e-30:
+            return np.nan
+        return (self.joint_comoment / self.joint_count) / benchmark_variance
+
+    @property
+    def alpha(self):
+        beta = self.beta
+        if np.isnan(beta):
+            return np.nan
+        return (
+            self.joint_algorithm_mean - beta * self.joint_benchmark_mean
+        ) * ANNUALIZATION_FACTOR
+
+    @property
+    def sharpe(self):
+        if self.count < 2 or self.algorithm_count < 2:
+            return np.nan
+        std = np.sqrt(self.algorithm_m2 / (self.algorithm_count - 1))
+        if std == 0:
+            return np.nan
+        return self.algorithm_mean / std * np.sqrt(ANNUALIZATION_FACTOR)
+
+    @property
+    def downside_risk(self):
+        if self.algorithm_count == 0:
+            return np.nan
+        return np.sqrt(
+            self.algorithm_downside_sum_squares / self.algorithm_count
+        ) * np.sqrt(ANNUALIZATION_FACTOR)
+
+    @property
+    def sortino(self):
+        if self.count < 2:
+            return np.nan
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (
+                np.float64(self.algorithm_mean) / self.downside_risk
+            ) * ANNUALIZATION_FACTOR
+
 
 class RiskMetricsCumulative(object):
     """
@@ -139,6 +330,13 @@ class RiskMetricsCumulative(object):
 
         self.num_trading_days = 0
 
+        # Accumulates the returns of every session before the latest one.
+        # The latest session's returns may still change (in minute emission,
+        # update is called every minute with the returns so far that day), so
+        # they are only folded in once a later session is updated.
+        self._accumulator = RiskAccumulator()
+        self._accumulated_count = 0
+
     def update(self, dt, algorithm_returns, benchmark_returns, leverage):
         # Keep track of latest dt for use in to_dict and other methods
         # that report current state.
@@ -155,9 +353,10 @@ class RiskMetricsCumulative(object):
             if len(self.algorithm_returns) == 1:
                 self.algorithm_returns = np.append(0.0, self.algorithm_returns)
 
-        self.algorithm_cumulative_returns[dt_loc] = cum_returns(
-            self.algorithm_returns
-        )[-1]
+        stats = self._accumulate(dt_loc, algorithm_returns, benchmark_returns)
+
+        self.algorithm_cumulative_returns[dt_loc] = \
+            stats.algorithm_cumulative_returns
 
         algo_cumulative_returns_to_date = \
             self.algorithm_cumulative_returns[:dt_loc + 1]
@@ -186,9 +385,8 @@ class RiskMetricsCumulative(object):
             if len(self.benchmark_returns) == 1:
                 self.benchmark_returns = np.append(0.0, self.benchmark_returns)
 
-        self.benchmark_cumulative_returns[dt_loc] = cum_returns(
-            self.benchmark_returns
-        )[-1]
+        self.benchmark_cumulative_returns[dt_loc] = \
+            stats.benchmark_cumulative_returns
 
         benchmark_cumulative_returns_to_date = \
             self.benchmark_cumulative_returns[:dt_loc + 1]
@@ -228,12 +426,8 @@ algorithm_returns ({algo_count}) in range {start} : {end} on {dt}"
             raise Exception(message)
 
         self.update_current_max()
-        self.benchmark_volatility[dt_loc] = annual_volatility(
-            self.benchmark_returns
-        )
-        self.algorithm_volatility[dt_loc] = annual_volatility(
-            self.algorithm_returns
-        )
+        self.benchmark_volatility[dt_loc] = stats.benchmark_volatility
+        self.algorithm_volatility[dt_loc] = stats.algorithm_volatility
 
         # caching the treasury rates for the minutely case is a
         # big speedup, because it avoids searching the treasury
@@ -253,27 +447,42 @@ algorithm_returns ({algo_count}) in range {start} : {end} on {dt}"
             self.algorithm_cumulative_returns[dt_loc] -
             self.treasury_period_return)
 
-        self.alpha[dt_loc], self.beta[dt_loc] = alpha_beta_aligned(
-            self.algorithm_returns,
-            self.benchmark_returns,
-        )
-        self.sharpe[dt_loc] = sharpe_ratio(
-            self.algorithm_returns,
-        )
-        self.downside_risk[dt_loc] = downside_risk(
-            self.algorithm_returns
-        )
-        self.sortino[dt_loc] = sortino_ratio(
-            self.algorithm_returns,
-            _downside_risk=self.downside_risk[dt_loc]
-        )
-        self.max_drawdown = max_drawdown(
-            self.algorithm_returns
-        )
+        self.alpha[dt_loc] = stats.alpha
+        self.beta[dt_loc] = stats.beta
+        self.sharpe[dt_loc] = stats.sharpe
+        self.downside_risk[dt_loc] = stats.downside_risk
+        self.sortino[dt_loc] = stats.sortino
+        self.max_drawdown = stats.max_drawdown
         self.max_drawdowns[dt_loc] = self.max_drawdown
         self.max_leverage = self.calculate_max_leverage()
         self.max_leverages[dt_loc] = self.max_leverage
 
+    def _accumulate(self, dt_loc, algorithm_returns, benchmark_returns):
+        """
+        Get a RiskAccumulator over the returns of every session up to and
+        including ``dt_loc``, with the returns for ``dt_loc`` given by
+        ``algorithm_returns`` and ``benchmark_returns``.
+        """
+        if dt_loc < self._accumulated_count:
+            # Updating an earlier session than before; start over.
+            self._accumulator = RiskAccumulator()
+            self._accumulated_count = 0
+
+        accumulator = self._accumulator
+        for loc in range(self._accumulated_count, dt_loc):
+            accumulator.update(
+                self.algorithm_returns_cont[loc],
+                self.benchmark_returns_cont[loc],
+            )
+        self._accumulated_count = dt_loc
+
+        stats = accumulator.copy()
+        if self.create_first_day_stats and dt_loc == 0:
+            # Mirror the zero returns prepended to the first day's series.
+            stats.update(0.0, 0.0)
+        stats.update(algorithm_returns, benchmark_returns)
+        return stats
+
     def to_dict(self):
         """
         Creates a dictionary representing the state of the risk report.
@@ -30,7 +30,27 @@ cpdef enum:
     BEFORE_TRADING_START_BAR = 4
 
 cdef class MinuteSimulationClock:
+    """
+    Emits the events of a simulation over ``sessions``.
+
+    Parameters
+    ----------
+    sessions : pd.DatetimeIndex
+        The sessions to simulate.
+    market_opens, market_closes : pd.Series
+        The first and last minute to simulate in each session.
+    before_trading_start_minutes : pd.DatetimeIndex
+        The minute of each session at which to run before_trading_start.
+    minute_emission : bool, optional
+        Whether to emit MINUTE_END after each bar.
+    next_bar : callable[(pd.DatetimeIndex, int) -> int], optional
+        Called with a run of minutes of a session and the position of the
+        first minute which has not been emitted, returns the position of the
+        next minute for which to emit a BAR. By default every minute is
+        emitted.
+    """
     cdef bool minute_emission
+    cdef object next_bar
     cdef np.int64_t[:] market_opens_nanos, market_closes_nanos, bts_nanos, \
         sessions_nanos
     cdef dict minutes_by_session
@@ -40,8 +60,10 @@ cdef class MinuteSimulationClock:
                  market_opens,
                  market_closes,
                  before_trading_start_minutes,
-                 minute_emission=False):
+                 minute_emission=False,
+                 next_bar=None):
         self.minute_emission = minute_emission
+        self.next_bar = next_bar
 
         self.market_opens_nanos = market_opens.values.astype(np.int64)
         self.market_closes_nanos = market_closes.values.astype(np.int64)
@@ -70,6 +92,19 @@ cdef class MinuteSimulationClock:
             )
         return minutes_by_session
 
+    def all_minutes(self):
+        """
+        The minutes of every session, in order. These are the minutes at
+        which the clock may emit a BAR.
+        """
+        return pd.to_datetime(
+            np.concatenate([
+                self.minutes_by_session[session_nano].asi8
+                for session_nano in self.sessions_nanos
+            ] or [np.array([], dtype=np.int64)]),
+            utc=True,
+        )
+
     def __iter__(self):
         minute_emission = self.minute_emission
 
@@ -111,7 +146,20 @@ cdef class MinuteSimulationClock:
             yield regular_minutes[-1], SESSION_END
 
     def _get_minutes_for_list(self, minutes, minute_emission):
-        for minute in minutes:
+        next_bar = self.next_bar
+        if next_bar is None:
+            for minute in minutes:
+                yield minute, BAR
+                if minute_emission:
+                    yield minute, MINUTE_END
+            return
+
+        # Jump ahead to the minutes which need a bar.
+        num_minutes = len(minutes)
+        idx = next_bar(minutes, 0)
+        while idx < num_minutes:
+            minute = minutes[idx]
             yield minute, BAR
             if minute_emission:
                 yield minute, MINUTE_END
+            idx = next_bar(minutes, idx + 1)
@@ -254,6 +254,15 @@ cdef class Adjustment:
 
         return self._key() == other._key()
 
+    def __reduce__(self):
+        return type(self), (
+            self.first_row,
+            self.last_row,
+            self.first_col,
+            self.last_col,
+            self.value,
+        )
+
     cpdef tuple _key(self):
         """
         Comparison key
@@ -390,6 +399,15 @@ cdef class ArrayAdjustment(Adjustment):
     Subclasses should inherit and provide a `values` attribute and a `mutate`
     method.
     """
+    def __reduce__(self):
+        return type(self), (
+            self.first_row,
+            self.last_row,
+            self.first_col,
+            self.last_col,
+            asarray(self.values),
+        )
+
     def __repr__(self):
             return (
                 "%s(first_row=%d, last_row=%d,"
@@ -519,6 +537,15 @@ cdef class Datetime641DArrayOverwrite(ArrayAdjustment):
             )
         self.values = asarray([datetime_to_int(value) for value in values])
 
+    def __reduce__(self):
+        return type(self), (
+            self.first_row,
+            self.last_row,
+            self.first_col,
+            self.last_col,
+            asarray(self.values).view('datetime64[ns]'),
+        )
+
     cpdef mutate(self, int64_t[:, :] data):
         cdef Py_ssize_t i, row, col
         cdef int64_t[:] values = self.values
@@ -689,6 +716,15 @@ cdef class Datetime64Adjustment(_Int64Adjustment):
             value=datetime_to_int(value),
         )
 
+    def __reduce__(self):
+        return type(self), (
+            self.first_row,
+            self.last_row,
+            self.first_col,
+            self.last_col,
+            datetime64(self.value, 'ns'),
+        )
+
     def __repr__(self):
         return (
             "%s(first_row=%d, last_row=%d,"
@@ -5,12 +5,17 @@ from abc import (
     ABCMeta,
     abstractmethod,
 )
+from collections import deque
+from multiprocessing.pool import ThreadPool
+import sys
 from uuid import uuid4
 
 from six import (
     iteritems,
+    reraise,
     with_metaclass,
 )
+from six.moves.queue import Queue
 from numpy import array
 from pandas import DataFrame, MultiIndex
 from toolz import groupby, juxt
@@ -68,7 +73,12 @@ class PipelineEngine(with_metaclass(ABCMeta)):
         raise NotImplementedError("run_pipeline")
 
     @abstractmethod
-    def run_chunked_pipeline(self, pipeline, start_date, end_date, chunksize):
+    def run_chunked_pipeline(self,
+                             pipeline,
+                             start_date,
+                             end_date,
+                             chunksize,
+                             max_workers=None):
         """
         Compute values for `pipeline` in number of days equal to `chunksize`
         and return stitched up result. Computing in chunks is useful for
@@ -84,6 +94,9 @@ class PipelineEngine(with_metaclass(ABCMeta)):
             The end date to run the pipeline for.
         chunksize : int
             The number of days to execute at a time.
+        max_workers : int, optional
+            The number of chunks to compute concurrently. If not provided,
+            chunks are computed one after another.
 
         Returns
         -------
@@ -105,6 +118,82 @@ class PipelineEngine(with_metaclass(ABCMeta)):
         """
         raise NotImplementedError("run_chunked_pipeline")
 
+    @abstractmethod
+    def iter_pipeline_chunks(self,
+                             pipeline,
+                             start_date,
+                             end_date,
+                             chunksize,
+                             max_workers=None):
+        """
+        Lazily compute values for `pipeline` in number of days equal to
+        `chunksize`, yielding the result for each chunk as soon as it is
+        ready. Unlike :meth:`run_chunked_pipeline`, only the chunks that are
+        being computed are held in memory, which makes this useful for
+        writing results to disk or aggregating them incrementally.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            The start date to run the pipeline for.
+        end_date : pd.Timestamp
+            The end date to run the pipeline for.
+        chunksize : int
+            The number of days to execute at a time.
+        max_workers : int, optional
+            The number of chunks to compute concurrently. If not provided,
+            chunks are computed one after another.
+
+        Returns
+        -------
+        chunks : iterator[pd.DataFrame]
+            An iterator of frames of computed results, in date order.
+
+            Each frame has the same layout as the result of
+            :meth:`run_pipeline` for the dates in its chunk. Categorical
+            columns are not unified across chunks, so each chunk's categories
+            only contain the labels that appear in that chunk.
+
+        See Also
+        --------
+        :meth:`zipline.pipeline.engine.PipelineEngine.run_pipeline`
+        :meth:`zipline.pipeline.engine.PipelineEngine.run_chunked_pipeline`
+        """
+        raise NotImplementedError("iter_pipeline_chunks")
+
+    @abstractmethod
+    def run_multiple_pipelines(self, pipelines, start_date, end_date):
+        """
+        Compute values for several pipelines between ``start_date`` and
+        ``end_date`` at once.
+
+        Terms that appear in more than one pipeline, including their inputs,
+        are only loaded and computed once.
+
+        Parameters
+        ----------
+        pipelines : dict[hashable -> Pipeline]
+            The pipelines to run, keyed by name.
+        start_date : pd.Timestamp
+            Start date of the computed matrices.
+        end_date : pd.Timestamp
+            End date of the computed matrices.
+
+        Returns
+        -------
+        results : dict[hashable -> pd.DataFrame]
+            Map from the name of each pipeline to a frame of its computed
+            results. Each frame is the same as the result of
+            :meth:`run_pipeline` for that pipeline.
+
+        See Also
+        --------
+        :meth:`zipline.pipeline.engine.PipelineEngine.run_pipeline`
+        """
+        raise NotImplementedError("run_multiple_pipelines")
+
 
 class NoEngineRegistered(Exception):
     """
@@ -123,12 +212,34 @@ class ExplodingPipelineEngine(PipelineEngine):
             "resources were registered."
         )
 
-    def run_chunked_pipeline(self, pipeline, start_date, end_date, chunksize):
+    def run_chunked_pipeline(self,
+                             pipeline,
+                             start_date,
+                             end_date,
+                             chunksize,
+                             max_workers=None):
         raise NoEngineRegistered(
             "Attempted to run a chunked pipeline but no pipeline "
             "resources were registered."
         )
 
+    def iter_pipeline_chunks(self,
+                             pipeline,
+                             start_date,
+                             end_date,
+                             chunksize,
+                             max_workers=None):
+        raise NoEngineRegistered(
+            "Attempted to run a chunked pipeline but no pipeline "
+            "resources were registered."
+        )
+
+    def run_multiple_pipelines(self, pipelines, start_date, end_date):
+        raise NoEngineRegistered(
+            "Attempted to run pipelines but no pipeline "
+            "resources were registered."
+        )
+
 
 def default_populate_initial_workspace(initial_workspace,
                                        root_mask_term,
@@ -163,6 +274,22 @@ def default_populate_initial_workspace(initial_workspace,
     return initial_workspace
 
 
+def _compute_term(term, inputs, dates, assets, mask):
+    """Compute ``term`` on a worker of a pool.
+
+    Returns
+    -------
+    result : tuple[Term, np.ndarray or None, tuple or None]
+        ``(term, result, exc_info)``. Exceptions are returned instead of
+        raised so that the thread driving the computation is always notified
+        and can re-raise them with their original traceback.
+    """
+    try:
+        return term, term._compute(inputs, dates, assets, mask), None
+    except Exception:
+        return term, None, sys.exc_info()
+
+
 class SimplePipelineEngine(PipelineEngine):
     """
     PipelineEngine class that computes each term independently.
@@ -183,10 +310,26 @@ class SimplePipelineEngine(PipelineEngine):
         computing a pipeline. See
         :func:`zipline.pipeline.engine.default_populate_initial_workspace`
         for more info.
+    pool : Pool, optional
+        A pool used to compute independent terms concurrently. This object
+        must support ``apply_async`` with a ``callback``, for example
+        :class:`multiprocessing.pool.ThreadPool`. Terms become eligible to run
+        as soon as all of their dependencies have been computed. Loadable
+        terms are always loaded on the calling thread. If not provided, terms
+        are computed serially in topological order.
+
+    Notes
+    -----
+    Most of the builtin factors spend their time in numpy and bottleneck
+    routines that release the GIL, so a thread pool is usually the right
+    choice. Windowed inputs are passed to terms as lazy iterators over
+    adjusted arrays which cannot be pickled, so process pools are not
+    supported.
 
     See Also
     --------
     :func:`zipline.pipeline.engine.default_populate_initial_workspace`
+    :class:`zipline.utils.pool.SequentialPool`
     """
     __slots__ = (
         '_get_loader',
@@ -195,13 +338,15 @@ class SimplePipelineEngine(PipelineEngine):
         '_root_mask_term',
         '_root_mask_dates_term',
         '_populate_initial_workspace',
+        '_pool',
     )
 
     def __init__(self,
                  get_loader,
                  calendar,
                  asset_finder,
-                 populate_initial_workspace=None):
+                 populate_initial_workspace=None,
+                 pool=None):
         self._get_loader = get_loader
         self._calendar = calendar
         self._finder = asset_finder
@@ -212,6 +357,7 @@ class SimplePipelineEngine(PipelineEngine):
         self._populate_initial_workspace = (
             populate_initial_workspace or default_populate_initial_workspace
         )
+        self._pool = pool
 
     def run_pipeline(self, pipeline, start_date, end_date):
         """
@@ -281,6 +427,180 @@ class SimplePipelineEngine(PipelineEngine):
                 "start_date=%s, end_date=%s" % (start_date, end_date)
             )
 
+        graph, dates, assets, initial_workspace, screen_name = (
+            self._prepare_pipeline(pipeline, start_date, end_date)
+        )
+        results = self.compute_chunk(
+            graph,
+            dates,
+            assets,
+            initial_workspace,
+        )
+        return self._results_to_narrow(
+            graph,
+            dates,
+            assets,
+            results,
+            screen_name,
+        )
+
+    @copydoc(PipelineEngine.run_chunked_pipeline)
+    def run_chunked_pipeline(self,
+                             pipeline,
+                             start_date,
+                             end_date,
+                             chunksize,
+                             max_workers=None):
+        chunks = list(self.iter_pipeline_chunks(
+            pipeline,
+            start_date,
+            end_date,
+            chunksize,
+            max_workers,
+        ))
+
+        if len(chunks) == 1:
+            # OPTIMIZATION: Don't make an extra copy in `categorical_df_concat`
+            # if we don't have to.
+            return chunks[0]
+
+        return categorical_df_concat(chunks, inplace=True)
+
+    @copydoc(PipelineEngine.iter_pipeline_chunks)
+    def iter_pipeline_chunks(self,
+                             pipeline,
+                             start_date,
+                             end_date,
+                             chunksize,
+                             max_workers=None):
+        ranges = compute_date_range_chunks(
+            self._calendar,
+            start_date,
+            end_date,
+            chunksize,
+        )
+        return self._run_chunks(pipeline, ranges, max_workers)
+
+    @copydoc(PipelineEngine.run_multiple_pipelines)
+    def run_multiple_pipelines(self, pipelines, start_date, end_date):
+        if end_date < start_date:
+            raise ValueError(
+                "start_date must be before or equal to end_date \n"
+                "start_date=%s, end_date=%s" % (start_date, end_date)
+            )
+
+        # Imported here to avoid a circular import through
+        # zipline.pipeline.visualize.
+        from .graph import ExecutionPlan
+
+        # Build a single plan whose outputs are the outputs of every pipeline,
+        # keyed by (pipeline name, column name). Terms are memoized, so a term
+        # shared between pipelines is a single node in the graph and is only
+        # computed once.
+        screen_names = {name: uuid4().hex for name in pipelines}
+        terms = {}
+        for name, pipeline in iteritems(pipelines):
+            pipeline_terms = pipeline._prepare_graph_terms(
+                screen_names[name],
+                self._root_mask_term,
+            )
+            for column_name, term in iteritems(pipeline_terms):
+                terms[name, column_name] = term
+
+        graph = ExecutionPlan(terms, self._calendar, start_date, end_date)
+        dates, assets, initial_workspace = self._prepare_plan(
+            graph,
+            start_date,
+            end_date,
+        )
+        results = self.compute_chunk(graph, dates, assets, initial_workspace)
+
+        extra_rows = graph.extra_rows[self._root_mask_term]
+        return {
+            name: self._to_narrow(
+                pipeline.columns,
+                {
+                    column_name: results[name, column_name]
+                    for column_name in pipeline.columns
+                },
+                results[name, screen_names[name]],
+                dates[extra_rows:],
+                assets,
+            )
+            for name, pipeline in iteritems(pipelines)
+        }
+
+    def _run_chunks(self, pipeline, ranges, max_workers):
+        """
+        Lazily compute ``pipeline`` for each (start_date, end_date) pair in
+        ``ranges``, yielding results in order.
+
+        When ``max_workers`` is given, up to ``max_workers`` chunks are
+        computed concurrently on a thread pool. Only ``compute_chunk`` runs on
+        the pool: inputs are loaded and results are converted on the calling
+        thread, because loaders and asset finders generally hold resources
+        like SQLite connections that may not be shared across threads. At most
+        ``max_workers`` chunks are loaded ahead of the chunk being yielded,
+        which bounds the memory used by pending inputs.
+        """
+        if not max_workers:
+            for start_date, end_date in ranges:
+                yield self.run_pipeline(pipeline, start_date, end_date)
+            return
+
+        def finish(pending_chunk):
+            result, (graph, dates, assets, _, screen_name) = pending_chunk
+            return self._results_to_narrow(
+                graph,
+                dates,
+                assets,
+                result.get(),
+                screen_name,
+            )
+
+        pool = ThreadPool(max_workers)
+        try:
+            pending = deque()
+            for start_date, end_date in ranges:
+                if len(pending) == max_workers:
+                    yield finish(pending.popleft())
+
+                prepared = self._prepare_pipeline(
+                    pipeline,
+                    start_date,
+                    end_date,
+                )
+                graph, dates, assets, initial_workspace, _ = prepared
+                self._load_inputs(graph, dates, assets, initial_workspace)
+                result = pool.apply_async(
+                    self.compute_chunk,
+                    (graph, dates, assets, initial_workspace),
+                )
+                pending.append((result, prepared))
+
+            while pending:
+                yield finish(pending.popleft())
+        finally:
+            pool.terminate()
+
+    def _prepare_pipeline(self, pipeline, start_date, end_date):
+        """
+        Build the execution plan and initial workspace for computing
+        ``pipeline`` between ``start_date`` and ``end_date``.
+
+        Returns
+        -------
+        graph : zipline.pipeline.graph.ExecutionPlan
+            The execution plan for ``pipeline``.
+        dates : pd.DatetimeIndex
+            Row labels for the root mask, including extra rows.
+        assets : pd.Int64Index
+            Column labels for the root mask.
+        initial_workspace : dict
+            Map from term -> output to begin computations with.
+        screen_name : str
+            The name of the screen's output in ``graph.outputs``.
+        """
         screen_name = uuid4().hex
         graph = pipeline.to_execution_plan(
             screen_name,
@@ -289,6 +609,27 @@ class SimplePipelineEngine(PipelineEngine):
             start_date,
             end_date,
         )
+        dates, assets, initial_workspace = self._prepare_plan(
+            graph,
+            start_date,
+            end_date,
+        )
+        return graph, dates, assets, initial_workspace, screen_name
+
+    def _prepare_plan(self, graph, start_date, end_date):
+        """
+        Compute the root mask and initial workspace for executing ``graph``
+        between ``start_date`` and ``end_date``.
+
+        Returns
+        -------
+        dates : pd.DatetimeIndex
+            Row labels for the root mask, including extra rows.
+        assets : pd.Int64Index
+            Column labels for the root mask.
+        initial_workspace : dict
+            Map from term -> output to begin computations with.
+        """
         extra_rows = graph.extra_rows[self._root_mask_term]
         root_mask = self._compute_root_mask(start_date, end_date, extra_rows)
         dates, assets, root_mask_values = explode(root_mask)
@@ -303,14 +644,14 @@ class SimplePipelineEngine(PipelineEngine):
             dates,
             assets,
         )
+        return dates, assets, initial_workspace
 
-        results = self.compute_chunk(
-            graph,
-            dates,
-            assets,
-            initial_workspace,
-        )
-
+    def _results_to_narrow(self, graph, dates, assets, results, screen_name):
+        """
+        Convert the output of ``compute_chunk`` for a plan built by
+        ``_prepare_pipeline`` into a DataFrame.
+        """
+        extra_rows = graph.extra_rows[self._root_mask_term]
         return self._to_narrow(
             graph.outputs,
             results,
@@ -319,22 +660,32 @@ class SimplePipelineEngine(PipelineEngine):
             assets,
         )
 
-    @copydoc(PipelineEngine.run_chunked_pipeline)
-    def run_chunked_pipeline(self, pipeline, start_date, end_date, chunksize):
-        ranges = compute_date_range_chunks(
-            self._calendar,
-            start_date,
-            end_date,
-            chunksize,
-        )
-        chunks = [self.run_pipeline(pipeline, s, e) for s, e in ranges]
+    def _load_inputs(self, graph, dates, assets, workspace):
+        """
+        Load every loadable term needed to compute ``graph`` into
+        ``workspace``.
+        """
+        refcounts = graph.initial_refcounts(workspace)
+        loader_group_key = juxt(self.get_loader, getitem(graph.extra_rows))
+        loader_groups = groupby(loader_group_key, graph.loadable_terms)
 
-        if len(chunks) == 1:
-            # OPTIMIZATION: Don't make an extra copy in `categorical_df_concat`
-            # if we don't have to.
-            return chunks[0]
+        for term in graph.loadable_terms:
+            if term in workspace or not refcounts[term]:
+                continue
 
-        return categorical_df_concat(chunks, inplace=True)
+            mask, mask_dates = graph.mask_and_dates_for_term(
+                term,
+                self._root_mask_term,
+                workspace,
+                dates,
+            )
+            workspace.update(self._load_term_group(
+                term,
+                loader_groups[loader_group_key(term)],
+                mask,
+                mask_dates,
+                assets,
+            ))
 
     def _compute_root_mask(self, start_date, end_date, extra_rows):
         """
@@ -470,49 +821,56 @@ class SimplePipelineEngine(PipelineEngine):
 
         refcounts = graph.initial_refcounts(workspace)
 
-        for term in graph.execution_order(refcounts):
-            # `term` may have been supplied in `initial_workspace`, and in the
-            # future we may pre-compute loadable terms coming from the same
-            # dataset.  In either case, we will already have an entry for this
-            # term, which we shouldn't re-compute.
-            if term in workspace:
-                continue
-
-            # Asset labels are always the same, but date labels vary by how
-            # many extra rows are needed.
-            mask, mask_dates = graph.mask_and_dates_for_term(
-                term,
-                self._root_mask_term,
-                workspace,
+        if self._pool is not None:
+            self._compute_concurrently(
+                graph,
                 dates,
+                assets,
+                workspace,
+                refcounts,
+                loader_groups,
+                loader_group_key,
             )
-
-            if isinstance(term, LoadableTerm):
-                to_load = sorted(
-                    loader_groups[loader_group_key(term)],
-                    key=lambda t: t.dataset
-                )
-                loader = get_loader(term)
-                loaded = loader.load_adjusted_array(
-                    to_load, mask_dates, assets, mask,
-                )
-                workspace.update(loaded)
-            else:
-                workspace[term] = term._compute(
-                    self._inputs_for_term(term, workspace, graph),
-                    mask_dates,
-                    assets,
-                    mask,
+        else:
+            for term in graph.execution_order(refcounts):
+                # `term` may have been supplied in `initial_workspace`, and in
+                # the future we may pre-compute loadable terms coming from the
+                # same dataset.  In either case, we will already have an entry
+                # for this term, which we shouldn't re-compute.
+                if term in workspace:
+                    continue
+
+                # Asset labels are always the same, but date labels vary by how
+                # many extra rows are needed.
+                mask, mask_dates = graph.mask_and_dates_for_term(
+                    term,
+                    self._root_mask_term,
+                    workspace,
+                    dates,
                 )
-                if term.ndim == 2:
-                    assert workspace[term].shape == mask.shape
-                else:
-                    assert workspace[term].shape == (mask.shape[0], 1)
 
-                # Decref dependencies of ``term``, and clear any terms whose
-                # refcounts hit 0.
-                for garbage_term in graph.decref_dependencies(term, refcounts):
-                    del workspace[garbage_term]
+                if isinstance(term, LoadableTerm):
+                    workspace.update(self._load_term_group(
+                        term,
+                        loader_groups[loader_group_key(term)],
+                        mask,
+                        mask_dates,
+                        assets,
+                    ))
+                else:
+                    self._store_computed_term(
+                        term,
+                        term._compute(
+                            self._inputs_for_term(term, workspace, graph),
+                            mask_dates,
+                            assets,
+                            mask,
+                        ),
+                        mask,
+                        graph,
+                        workspace,
+                        refcounts,
+                    )
 
         out = {}
         graph_extra_rows = graph.extra_rows
@@ -521,6 +879,135 @@ class SimplePipelineEngine(PipelineEngine):
             out[name] = workspace[term][graph_extra_rows[term]:]
         return out
 
+    def _load_term_group(self, term, group, mask, mask_dates, assets):
+        """
+        Load ``term`` along with every other term in ``group``, which must
+        share ``term``'s loader and extra rows.
+        """
+        to_load = sorted(group, key=lambda t: t.dataset)
+        loader = self.get_loader(term)
+        return loader.load_adjusted_array(to_load, mask_dates, assets, mask)
+
+    @staticmethod
+    def _store_computed_term(term, result, mask, graph, workspace, refcounts):
+        """
+        Store the computed ``result`` for ``term`` in ``workspace`` and clear
+        any terms that are no longer needed.
+        """
+        workspace[term] = result
+        if term.ndim == 2:
+            assert result.shape == mask.shape
+        else:
+            assert result.shape == (mask.shape[0], 1)
+
+        # Decref dependencies of ``term``, and clear any terms whose
+        # refcounts hit 0.
+        for garbage_term in graph.decref_dependencies(term, refcounts):
+            del workspace[garbage_term]
+
+    def _compute_concurrently(self,
+                              graph,
+                              dates,
+                              assets,
+                              workspace,
+                              refcounts,
+                              loader_groups,
+                              loader_group_key):
+        """
+        Compute the terms of ``graph`` into ``workspace`` using ``self._pool``.
+
+        Terms are submitted to the pool as soon as all of their dependencies
+        are available in ``workspace``. All reads and writes of ``workspace``
+        and ``refcounts`` happen on the calling thread, so garbage collection
+        of intermediate results works exactly as in the serial case: a term is
+        only released after every term that depends on it has finished.
+        """
+        dag = graph.graph
+        order = [
+            term for term in graph.execution_order(refcounts)
+            if term not in workspace
+        ]
+        pending = set(order)
+
+        # Map from term -> number of its dependencies that still need to be
+        # loaded or computed.
+        waiting_on = {
+            term: sum(dep in pending for dep in dag.predecessors(term))
+            for term in order
+        }
+        ready = deque(term for term in order if not waiting_on[term])
+        finished = Queue()
+        in_flight = {}
+
+        def mark_done(term):
+            pending.remove(term)
+            for dependent in dag.successors(term):
+                if dependent in pending:
+                    waiting_on[dependent] -= 1
+                    if not waiting_on[dependent]:
+                        ready.append(dependent)
+
+        while pending:
+            while ready:
+                term = ready.popleft()
+                if term not in pending:
+                    # Already loaded as part of another term's loader group.
+                    continue
+
+                mask, mask_dates = graph.mask_and_dates_for_term(
+                    term,
+                    self._root_mask_term,
+                    workspace,
+                    dates,
+                )
+                if isinstance(term, LoadableTerm):
+                    loaded = self._load_term_group(
+                        term,
+                        loader_groups[loader_group_key(term)],
+                        mask,
+                        mask_dates,
+                        assets,
+                    )
+                    workspace.update(loaded)
+                    for loaded_term in loaded:
+                        if loaded_term in pending:
+                            mark_done(loaded_term)
+                else:
+                    in_flight[term] = mask
+                    self._pool.apply_async(
+                        _compute_term,
+                        (
+                            term,
+                            self._inputs_for_term(term, workspace, graph),
+                            mask_dates,
+                            assets,
+                            mask,
+                        ),
+                        callback=finished.put,
+                    )
+
+            if not in_flight:
+                # Nothing is running and nothing is ready; this can only
+                # happen if a loader didn't return a term it was asked for.
+                raise AssertionError(
+                    "Unable to schedule terms: %s" % sorted(map(str, pending))
+                )
+
+            term, result, exc_info = finished.get()
+            mask = in_flight.pop(term)
+            if exc_info is not None:
+                reraise(*exc_info)
+
+            self._store_computed_term(
+                term,
+                result,
+                mask,
+                graph,
+                workspace,
+                refcounts,
+            )
+            mark_done(term)
+
     def _to_narrow(self, terms, data, mask, dates, assets):
         """
         Convert raw computed pipeline results into a DataFrame for public APIs.
@@ -1,10 +1,20 @@
 
-from numpy import broadcast_arrays
-from scipy.stats import (
-    linregress,
-    pearsonr,
-    spearmanr,
+from numpy import (
+    arange,
+    argsort,
+    clip,
+    empty,
+    empty_like,
+    errstate,
+    isnan,
+    maximum,
+    minimum,
+    nan,
+    not_equal,
+    sqrt,
+    where,
 )
+from scipy.stats import t as t_distribution
 
 from zipline.errors import IncompatibleTerms
 from zipline.pipeline.factors import CustomFactor
@@ -13,7 +23,11 @@ from zipline.pipeline.mixins import SingleInputMixin
 from zipline.pipeline.sentinels import NotSpecified
 from zipline.pipeline.term import AssetExists
 from zipline.utils.input_validation import expect_bounded, expect_dtypes
-from zipline.utils.numpy_utils import float64_dtype, int64_dtype
+from zipline.utils.numpy_utils import (
+    bool_dtype,
+    float64_dtype,
+    int64_dtype,
+)
 
 from .technical import Returns
 
@@ -21,6 +35,124 @@ from .technical import Returns
 ALLOWED_DTYPES = (float64_dtype, int64_dtype)
 
 
+def _pearson_r(x, y):
+    """
+    Compute the Pearson correlation coefficient between each column of ``x``
+    and the corresponding column of ``y``.
+
+    Equivalent to ``scipy.stats.pearsonr(x[:, i], y[:, i])[0]`` for each
+    column. Either array may have a single column, in which case it is
+    broadcast against the columns of the other.
+
+    Columns containing NaN, or with zero variance, produce NaN.
+    """
+    x = x - x.mean(axis=0)
+    y = y - y.mean(axis=0)
+    with errstate(divide='ignore', invalid='ignore'):
+        r = (x * y).sum(axis=0) / sqrt(
+            (x * x).sum(axis=0) * (y * y).sum(axis=0)
+        )
+    # Values slightly outside of [-1, 1] are artifacts of floating point
+    # arithmetic.
+    return clip(r, -1.0, 1.0, out=r)
+
+
+def _rankdata_columns(data):
+    """
+    Rank each column of ``data``, assigning tied values the average of the
+    ranks they span.
+
+    Equivalent to ``scipy.stats.rankdata(data[:, i], method='average')`` for
+    each column of NaN-free data.
+    """
+    nrows, ncols = data.shape
+    columns = arange(ncols)
+    sort_idxs = argsort(data, axis=0, kind='mergesort')
+    sorted_data = data[sort_idxs, columns]
+
+    # Each run of equal values occupies the positions [start, stop] of the
+    # sorted column. Forward-fill the first position of each run and
+    # backward-fill the last position of each run.
+    run_starts = empty(data.shape, dtype=bool_dtype)
+    run_starts[0] = True
+    not_equal(sorted_data[1:], sorted_data[:-1], out=run_starts[1:])
+    run_stops = empty_like(run_starts)
+    run_stops[:-1] = run_starts[1:]
+    run_stops[-1] = True
+
+    positions = arange(nrows)[:, None]
+
+    start = maximum.accumulate(where(run_starts, positions, 0), axis=0)
+    stop = minimum.accumulate(
+        where(run_stops, positions, nrows - 1)[::-1],
+        axis=0,
+    )[::-1]
+
+    out = data.astype(float64_dtype)
+    out[sort_idxs, columns] = (start + stop) / 2.0 + 1.0
+    return out
+
+
+def _spearman_r(x, y):
+    """
+    Compute the Spearman rank correlation coefficient between each column of
+    ``x`` and the corresponding column of ``y``.
+
+    Equivalent to ``scipy.stats.spearmanr(x[:, i], y[:, i])[0]`` for each
+    column. Either array may have a single column, in which case it is
+    broadcast against the columns of the other.
+
+    Columns containing NaN, or with zero variance, produce NaN.
+    """
+    r = _pearson_r(_rankdata_columns(x), _rankdata_columns(y))
+    r[isnan(x).any(axis=0) | isnan(y).any(axis=0)] = nan
+    return r
+
+
+def _linear_regression(y, x):
+    """
+    Perform an ordinary least-squares regression of each column of ``y`` on
+    the corresponding column of ``x``.
+
+    Equivalent to ``scipy.stats.linregress(x=x[:, i], y=y[:, i])`` for each
+    column. Either array may have a single column, in which case it is
+    broadcast against the columns of the other.
+
+    Returns
+    -------
+    alpha, beta, r_value, p_value, stderr : np.ndarray[float64]
+        The intercepts, slopes, correlation coefficients, two-sided p-values
+        for the hypothesis that each slope is zero, and standard errors of
+        the estimated slopes.
+    """
+    # Mirrors the implementation of `linregress` so that the results are the
+    # same, including for degenerate inputs.
+    TINY = 1.0e-20
+    n = len(x)
+    df = n - 2
+
+    x_mean = x.mean(axis=0)
+    y_mean = y.mean(axis=0)
+    x_demeaned = x - x_mean
+    y_demeaned = y - y_mean
+    ssxm = (x_demeaned * x_demeaned).sum(axis=0) / n
+    ssym = (y_demeaned * y_demeaned).sum(axis=0) / n
+    ssxym = (x_demeaned * y_demeaned).sum(axis=0) / n
+
+    with errstate(divide='ignore', invalid='ignore'):
+        r_den = sqrt(ssxm * ssym)
+        r = where(r_den == 0.0, 0.0, ssxym / r_den)
+        clip(r, -1.0, 1.0, out=r)
+
+        t = r * sqrt(df / ((1.0 - r + TINY) * (1.0 + r + TINY)))
+        p_value = 2 * t_distribution.sf(abs(t), df)
+        beta = ssxym / ssxm
+        alpha = y_mean - beta * x_mean
+        stderr = sqrt((1 - r ** 2) * ssym / ssxm / df)
+
+    return alpha, beta, r, p_value, stderr
+
+
 class _RollingCorrelation(CustomFactor, SingleInputMixin):
 
     @expect_dtypes(base_factor=ALLOWED_DTYPES, target=ALLOWED_DTYPES)
@@ -78,13 +210,10 @@ class RollingPearson(_RollingCorrelation):
     window_safe = True
 
     def compute(self, today, assets, out, base_data, target_data):
-        # If `target_data` is a Slice or single column of data, broadcast it
-        # out to the same shape as `base_data`, then compute column-wise. This
-        # is efficient because each column of the broadcasted array only refers
-        # to a single memory location.
-        target_data = broadcast_arrays(target_data, base_data)[0]
-        for i in range(len(out)):
-            out[i] = pearsonr(base_data[:, i], target_data[:, i])[0]
+        # If `target_data` is a Slice or single column of data, it is
+        # broadcast against every column of `base_data`, so it is only
+        # demeaned once.
+        out[:] = _pearson_r(base_data, target_data)
 
 
 class RollingSpearman(_RollingCorrelation):
@@ -124,13 +253,10 @@ class RollingSpearman(_RollingCorrelation):
     window_safe = True
 
     def compute(self, today, assets, out, base_data, target_data):
-        # If `target_data` is a Slice or single column of data, broadcast it
-        # out to the same shape as `base_data`, then compute column-wise. This
-        # is efficient because each column of the broadcasted array only refers
-        # to a single memory location.
-        target_data = broadcast_arrays(target_data, base_data)[0]
-        for i in range(len(out)):
-            out[i] = spearmanr(base_data[:, i], target_data[:, i])[0]
+        # If `target_data` is a Slice or single column of data, it is
+        # broadcast against every column of `base_data`, so it is only
+        # ranked once.
+        out[:] = _spearman_r(base_data, target_data)
 
 
 class RollingLinearRegression(CustomFactor, SingleInputMixin):
@@ -190,29 +316,16 @@ class RollingLinearRegression(CustomFactor, SingleInputMixin):
         )
 
     def compute(self, today, assets, out, dependent, independent):
-        alpha = out.alpha
-        beta = out.beta
-        r_value = out.r_value
-        p_value = out.p_value
-        stderr = out.stderr
-
-        def regress(y, x):
-            regr_results = linregress(y=y, x=x)
-            # `linregress` returns its results in the following order:
-            # slope, intercept, r-value, p-value, stderr
-            alpha[i] = regr_results[1]
-            beta[i] = regr_results[0]
-            r_value[i] = regr_results[2]
-            p_value[i] = regr_results[3]
-            stderr[i] = regr_results[4]
-
-        # If `independent` is a Slice or single column of data, broadcast it
-        # out to the same shape as `dependent`, then compute column-wise. This
-        # is efficient because each column of the broadcasted array only refers
-        # to a single memory location.
-        independent = broadcast_arrays(independent, dependent)[0]
-        for i in range(len(out)):
-            regress(y=dependent[:, i], x=independent[:, i])
+        # If `independent` is a Slice or single column of data, it is
+        # broadcast against every column of `dependent`, so its moments are
+        # only computed once.
+        (
+            out.alpha[:],
+            out.beta[:],
+            out.r_value[:],
+            out.p_value[:],
+            out.stderr[:],
+        ) = _linear_regression(y=dependent, x=independent)
 
 
 class RollingPearsonOfReturns(RollingPearson):
@@ -0,0 +1,330 @@
+"""
+PipelineLoader that caches the arrays produced by another loader.
+"""
+from collections import MutableMapping, OrderedDict
+import errno
+from hashlib import sha1
+import os
+import pickle
+
+import numpy as np
+from six import iteritems
+
+from zipline.lib.adjusted_array import AdjustedArray, NOMASK
+from zipline.lib.labelarray import LabelArray
+from zipline.utils.cache import working_file
+from zipline.utils.context_tricks import nop_context
+from zipline.utils.paths import ensure_directory
+
+from .base import PipelineLoader
+
+
+def _nbytes(adjusted_array):
+    """
+    The number of bytes used by the baseline data of ``adjusted_array``.
+
+    The adjustments are not counted; they are almost always much smaller than
+    the baseline data.
+    """
+    return adjusted_array.data.nbytes
+
+
+class InMemoryTermCache(MutableMapping):
+    """A least-recently-used, in-memory cache of loaded pipeline terms.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        The maximum number of bytes of baseline data to hold. When adding an
+        entry would exceed this, the least recently used entries are evicted.
+        If not provided, the cache is unbounded.
+    lock : Lock, optional
+        Thread lock for multithreaded access to the cache.
+        If not provided no locking will be used.
+
+    Notes
+    -----
+    Values are shared between every pipeline that reads them, so they must be
+    treated as read-only.
+    """
+    def __init__(self, max_bytes=None, lock=None):
+        self.max_bytes = max_bytes
+        self.lock = lock if lock is not None else nop_context
+        self._entries = OrderedDict()
+        self._nbytes = 0
+
+    @property
+    def nbytes(self):
+        """The number of bytes of baseline data currently held.
+        """
+        return self._nbytes
+
+    def __getitem__(self, key):
+        with self.lock:
+            value = self._entries.pop(key)
+            # Re-insert the entry to mark it as the most recently used.
+            self._entries[key] = value
+            return value
+
+    def __setitem__(self, key, value):
+        nbytes = _nbytes(value)
+        with self.lock:
+            if key in self._entries:
+                self._nbytes -= _nbytes(self._entries.pop(key))
+
+            if self.max_bytes is not None:
+                if nbytes > self.max_bytes:
+                    # This entry would evict everything else without fitting.
+                    return
+                while self._nbytes + nbytes > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._nbytes -= _nbytes(evicted)
+
+            self._entries[key] = value
+            self._nbytes += nbytes
+
+    def __delitem__(self, key):
+        with self.lock:
+            self._nbytes -= _nbytes(self._entries.pop(key))
+
+    def __iter__(self):
+        return iter(list(self._entries))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return '<%s: %d entries, %d bytes>' % (
+            type(self).__name__,
+            len(self),
+            self.nbytes,
+        )
+
+
+class DiskTermCache(MutableMapping):
+    """A least-recently-used, disk-backed cache of loaded pipeline terms.
+
+    Each entry is stored as an ``.npy`` file holding the baseline data, which
+    is memory-mapped when read, and a pickle file holding the adjustments and
+    metadata.
+
+    Parameters
+    ----------
+    path : str
+        The directory in which to store entries. It will be created if it does
+        not exist. Entries persist across processes.
+    max_bytes : int, optional
+        The maximum number of bytes of baseline data to keep on disk. When
+        adding an entry would exceed this, the least recently read entries
+        are deleted. If not provided, the cache is unbounded.
+    lock : Lock, optional
+        Thread lock for multithreaded/multiprocessed access to the cache.
+        If not provided no locking will be used.
+
+    Notes
+    -----
+    Recency is tracked with file modification times, so entries are ordered
+    consistently between processes sharing the same ``path``.
+    """
+    _data_suffix = '.npy'
+    _meta_suffix = '.meta'
+
+    def __init__(self, path, max_bytes=None, lock=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lock = lock if lock is not None else nop_context
+        ensure_directory(path)
+
+    def _keypath(self, key, suffix):
+        return os.path.join(self.path, key + suffix)
+
+    def __getitem__(self, key):
+        data_path = self._keypath(key, self._data_suffix)
+        meta_path = self._keypath(key, self._meta_suffix)
+        with self.lock:
+            try:
+                with open(meta_path, 'rb') as f:
+                    adjustments, missing_value, categories = pickle.load(f)
+                data = np.load(data_path, mmap_mode='r')
+                # Mark this entry as the most recently used.
+                os.utime(data_path, None)
+            except IOError as e:
+                if e.errno != errno.ENOENT:
+                    raise
+                raise KeyError(key)
+
+        if categories is not None:
+            data = LabelArray.from_codes_and_metadata(
+                codes=np.array(data),
+                categories=categories,
+                reverse_categories={
+                    category: code for code, category in enumerate(categories)
+                },
+                missing_value=missing_value,
+            )
+        return AdjustedArray(data, NOMASK, adjustments, missing_value)
+
+    def __setitem__(self, key, value):
+        data = value.data
+        if isinstance(data, LabelArray):
+            categories = data.categories
+            data = data.as_int_array()
+        else:
+            categories = None
+
+        with self.lock:
+            # Write the data before the metadata because we only consider an
+            # entry to exist once its metadata file is present.
+            self._write(
+                key,
+                self._data_suffix,
+                lambda f: np.save(f, data),
+            )
+            self._write(
+                key,
+                self._meta_suffix,
+                lambda f: pickle.dump(
+                    (value.adjustments, value.missing_value, categories),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                ),
+            )
+
+            if self.max_bytes is not None:
+                self._evict()
+
+    def _write(self, key, suffix, write):
+        """Atomically write the file for ``key`` with ``suffix`` by calling
+        ``write`` with a file opened for writing.
+        """
+        final_path = self._keypath(key, suffix)
+        # Create the temporary file next to the final path so that committing
+        # it is a rename rather than a copy.
+        with working_file(final_path, dir=self.path) as wf:
+            with open(wf.path, 'wb') as f:
+                write(f)
+
+    def _evict(self):
+        """Delete the least recently used entries until the total size is no
+        more than ``self.max_bytes``.
+        """
+        entries = []
+        total = 0
+        for key in self:
+            stat = os.stat(self._keypath(key, self._data_suffix))
+            entries.append((stat.st_mtime, key, stat.st_size))
+            total += stat.st_size
+
+        for _, key, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(key)
+            total -= size
+
+    def _remove(self, key):
+        # Remove the metadata first so that readers never see an entry without
+        # its data.
+        for suffix in self._meta_suffix, self._data_suffix:
+            try:
+                os.remove(self._keypath(key, suffix))
+            except OSError as e:
+                if e.errno != errno.ENOENT:
+                    raise
+
+    def __delitem__(self, key):
+        with self.lock:
+            if not os.path.exists(self._keypath(key, self._meta_suffix)):
+                raise KeyError(key)
+            self._remove(key)
+
+    def __iter__(self):
+        suffix = self._meta_suffix
+        return iter(sorted(
+            name[:-len(suffix)]
+            for name in os.listdir(self.path)
+            if name.endswith(suffix)
+        ))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return '<%s: path=%r, %d entries>' % (
+            type(self).__name__,
+            self.path,
+            len(self),
+        )
+
+
+class CachingLoader(PipelineLoader):
+    """A PipelineLoader that caches the arrays produced by another loader.
+
+    Arrays are cached per column, keyed by the column, the requested dates and
+    assets, the mask, and a user-supplied ``version``. Columns that are found
+    in the cache are not passed to the wrapped loader at all.
+
+    Parameters
+    ----------
+    loader : PipelineLoader
+        The loader to cache.
+    cache : MutableMapping[str -> AdjustedArray]
+        The storage for cached arrays, for example an
+        :class:`~zipline.pipeline.loaders.caching.InMemoryTermCache` or a
+        :class:`~zipline.pipeline.loaders.caching.DiskTermCache`.
+    version : str, optional
+        A string identifying the version of the data served by ``loader``,
+        such as the ingestion timestamp of the bundle it reads. Entries cached
+        under one version are never returned for another, so this must change
+        whenever the underlying data changes.
+
+    Notes
+    -----
+    Use a single ``CachingLoader`` for each wrapped loader so that
+    :class:`~zipline.pipeline.engine.SimplePipelineEngine` can still group
+    columns that share a loader into one load.
+
+    Cached arrays are shared between pipeline runs and must not be mutated.
+    """
+    def __init__(self, loader, cache, version=''):
+        self.loader = loader
+        self.cache = cache
+        self.version = version
+
+    def _cache_key(self, column, dates, assets, mask):
+        key = sha1()
+        for part in (
+                self.version,
+                column.dataset.__module__,
+                column.dataset.__name__,
+                column.name,
+                column.dtype.str,
+                repr(column.missing_value)):
+            key.update(repr(part).encode('utf-8'))
+        for array in (np.asarray(dates).view('int64'), np.asarray(assets)):
+            key.update(array.tostring())
+        key.update(np.packbits(mask).tostring())
+        return key.hexdigest()
+
+    def load_adjusted_array(self, columns, dates, assets, mask):
+        keys = {
+            column: self._cache_key(column, dates, assets, mask)
+            for column in columns
+        }
+
+        out = {}
+        for column, key in iteritems(keys):
+            try:
+                out[column] = self.cache[key]
+            except KeyError:
+                pass
+
+        to_load = [column for column in columns if column not in out]
+        if to_load:
+            loaded = self.loader.load_adjusted_array(
+                to_load, dates, assets, mask,
+            )
+            for column, adjusted_array in iteritems(loaded):
+                self.cache[keys[column]] = adjusted_array
+            out.update(loaded)
+
+        return out
@@ -26,7 +26,12 @@ from sqlalchemy import create_engine
 from testfixtures import TempDirectory
 from toolz import concat, curry
 
-from zipline.assets import AssetFinder, AssetDBWriter
+from zipline.assets import (
+    AssetConvertible,
+    AssetDBWriter,
+    AssetFinder,
+    PricingDataAssociable,
+)
 from zipline.assets.synthetic import make_simple_equity_info
 from zipline.data.data_portal import DataPortal
 from zipline.data.loader import get_benchmark_filename, INDEX_MAPPING
@@ -708,9 +713,13 @@ class FakeDataPortal(DataPortal):
 
     def get_spot_value(self, asset, field, dt, data_frequency):
         if field == "volume":
-            return 100
+            value = 100
         else:
-            return 1.0
+            value = 1.0
+
+        if isinstance(asset, (AssetConvertible, PricingDataAssociable)):
+            return value
+        return [value] * len(asset)
 
     def get_history_window(self, assets, end_dt, bar_count, frequency, field,
                            data_frequency, ffill=True):
@@ -740,6 +749,12 @@ class FetcherDataPortal(DataPortal):
                                                 first_trading_day)
 
     def get_spot_value(self, asset, field, dt, data_frequency):
+        if not isinstance(asset, (AssetConvertible, PricingDataAssociable)):
+            return [
+                self.get_spot_value(a, field, dt, data_frequency)
+                for a in asset
+            ]
+
         # if this is a fetcher field, exercise the regular code path
         if self._is_extra_source(asset, field, self._augmented_sources_map):
             return super(FetcherDataPortal, self).get_spot_value(
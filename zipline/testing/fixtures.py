@@ -1272,10 +1272,18 @@ class WithAdjustmentReader(WithBcolzEquityDailyBarReader):
         to write the data into the connection to be used by the class's
         adjustment reader.
 
+    Attributes
+    ----------
+    ADJUSTMENT_READER_PRELOAD : bool
+        Whether the adjustment reader reads all of the adjustments into memory
+        up front. By default this is False.
+
     See Also
     --------
     zipline.testing.MockDailyBarReader
     """
+    ADJUSTMENT_READER_PRELOAD = False
+
     @classmethod
     def _make_data(cls):
         return None
@@ -1313,7 +1321,10 @@ class WithAdjustmentReader(WithBcolzEquityDailyBarReader):
             dividends=cls.make_dividends_data(),
             stock_dividends=cls.make_stock_dividends_data(),
         )
-        cls.adjustment_reader = SQLiteAdjustmentReader(conn)
+        cls.adjustment_reader = SQLiteAdjustmentReader(
+            conn,
+            preload=cls.ADJUSTMENT_READER_PRELOAD,
+        )
 
 
 class WithEquityPricingPipelineEngine(WithAdjustmentReader,
@@ -5,14 +5,13 @@ from collections import MutableMapping
 import errno
 import os
 import pickle
-from distutils import dir_util
 from shutil import rmtree, move
 from tempfile import mkdtemp, NamedTemporaryFile
 
 import pandas as pd
 
 from .context_tricks import nop_context
-from .paths import ensure_directory
+from .paths import ensure_directory, link_tree
 
 
 class Expired(Exception):
@@ -318,16 +317,18 @@ class working_dir(object):
     final_path : str
         The location to move the file when committing.
     *args, **kwargs
-        Forwarded to tmp_dir.
+        Forwarded to :func:`tempfile.mkdtemp`.
 
     Notes
     -----
     The file is moved on __exit__ if there are no exceptions.
-    ``working_dir`` uses :func:`dir_util.copy_tree` to move the actual files,
-    meaning it has as strong of guarantees as :func:`dir_util.copy_tree`.
+    ``working_dir`` uses :func:`~zipline.utils.paths.link_tree` to move the
+    actual files, so files which are hard links to other files stay shared
+    when the temporary directory is on the same file system as the final
+    path.
     """
     def __init__(self, final_path, *args, **kwargs):
-        self.path = mkdtemp()
+        self.path = mkdtemp(*args, **kwargs)
         self._final_path = final_path
 
     def ensure_dir(self, *path_parts):
@@ -355,7 +356,7 @@ class working_dir(object):
     def _commit(self):
         """Sync the temporary directory to the final path.
         """
-        dir_util.copy_tree(self.path, self._final_path)
+        link_tree(self.path, self._final_path)
 
     def __enter__(self):
         return self
@@ -14,6 +14,7 @@
 # limitations under the License.
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
+from operator import itemgetter
 import six
 import warnings
 
@@ -179,6 +180,19 @@ def lossless_float_to_int(funcname, func, argname, arg):
     raise TypeError(arg)
 
 
+def _isin_sorted(values, sorted_values):
+    """
+    Check which of ``values`` are in the sorted array ``sorted_values``.
+
+    This is a binary search for each value, which is cheaper than
+    ``np.in1d`` when ``sorted_values`` is much longer than ``values``.
+    """
+    ix = sorted_values.searchsorted(values)
+    mask = ix < len(sorted_values)
+    mask[mask] = sorted_values[ix[mask]] == values[mask]
+    return mask
+
+
 class EventManager(object):
     """Manages a list of Event objects.
     This manages the logic for checking the rules and dispatching to the
@@ -198,6 +212,21 @@ class EventManager(object):
             lambda *_: nop_context
         )
 
+        # The schedule built by ``compile``: the trigger times of the compiled
+        # events, sorted, the (position, event) which triggers at each time,
+        # where position is the order of the event at the time of compiling,
+        # and the position of the next time to dispatch.
+        self._trigger_times = None
+        self._trigger_events = None
+        self._trigger_owners = None
+        self._trigger_pos = 0
+        self._compiled_events = []
+        self._compiled = set()
+        # The (position, event) of the compiled events which trigger at every
+        # minute. These are dispatched directly rather than scheduled.
+        self._always = []
+        self._has_uncompiled = False
+
     def add_event(self, event, prepend=False):
         """
         Adds an event to the manager.
@@ -207,14 +236,196 @@ class EventManager(object):
         else:
             self._events.append(event)
 
+        # Events added after ``compile`` check their rule every minute.
+        self._has_uncompiled = (
+            self._trigger_times is not None or self._has_uncompiled
+        )
+
+    def compile(self, minutes):
+        """
+        Precompute the minutes at which each event triggers, so that
+        ``handle_data`` does not have to check their rules every minute.
+
+        Events whose rules can't be compiled (see :meth:`EventRule.compile`)
+        keep checking their rule every minute.
+
+        Parameters
+        ----------
+        minutes : pd.DatetimeIndex
+            Every minute which will be passed to ``handle_data``, in order.
+        """
+        times = []
+        owners = []
+        compiled = set()
+        always = []
+        for position, event in enumerate(self._events):
+            if type(event.rule) is Always:
+                always.append((position, event))
+                compiled.add(id(event))
+                continue
+
+            triggers = event.rule.compile(minutes)
+            if triggers is None:
+                continue
+            times.append(triggers)
+            owners.append(np.full(len(triggers), position, dtype=np.int64))
+            compiled.add(id(event))
+
+        if times:
+            times = np.concatenate(times)
+            owners = np.concatenate(owners)
+        else:
+            times = np.array([], dtype=np.int64)
+            owners = np.array([], dtype=np.int64)
+
+        # Order by time, then by the order in which the events were added.
+        order = np.lexsort((owners, times))
+        self._trigger_times = times[order]
+        self._trigger_owners = owners[order]
+        self._trigger_events = [
+            (ix, self._events[ix]) for ix in self._trigger_owners
+        ]
+        self._trigger_pos = 0
+        self._compiled_events = list(self._events)
+        self._compiled = compiled
+        self._always = always
+        self._has_uncompiled = len(compiled) < len(self._events)
+
+    def _pop_triggered(self, dt):
+        """
+        Advance the compiled schedule to ``dt`` and return the
+        (position, event) of the compiled events which trigger at ``dt``, in
+        the order in which they were added.
+        """
+        times = self._trigger_times
+        value = dt.value
+        pos = self._trigger_pos
+        if pos < len(times) and times[pos] < value:
+            # Minutes were skipped, catch up.
+            pos = times.searchsorted(value)
+        end = pos
+        if end < len(times) and times[end] == value:
+            end = times.searchsorted(value, side='right')
+        self._trigger_pos = end
+
+        triggered = self._trigger_events[pos:end]
+        if not triggered:
+            return self._always
+        if not self._always:
+            return triggered
+        return sorted(self._always + triggered, key=itemgetter(0))
+
     def handle_data(self, context, data, dt):
         with self._create_context(data):
+            if self._trigger_times is None:
+                for event in self._events:
+                    event.handle_data(
+                        context,
+                        data,
+                        dt,
+                    )
+                return
+
+            triggered = self._pop_triggered(dt)
+            if not self._has_uncompiled:
+                for _, event in triggered:
+                    event.callback(context, data)
+                return
+
+            triggered = {id(event) for _, event in triggered}
+            compiled = self._compiled
             for event in self._events:
-                event.handle_data(
-                    context,
-                    data,
-                    dt,
-                )
+                if id(event) not in compiled:
+                    event.handle_data(context, data, dt)
+                elif id(event) in triggered:
+                    event.callback(context, data)
+
+    def next_trigger(self, minutes, ignore=()):
+        """
+        Find the first of ``minutes`` at which any of the events may trigger.
+
+        Parameters
+        ----------
+        minutes : pd.DatetimeIndex
+            The market minutes to check, in order.
+        ignore : iterable[Event], optional
+            Events to leave out.
+
+        Returns
+        -------
+        position : int
+            The position in ``minutes`` of the first minute at which an event
+            may trigger, ``len(minutes)`` if there is none.
+        """
+        stop = len(minutes)
+        if not stop:
+            return stop
+
+        for _, event in self._always:
+            if not any(event is ignored for ignored in ignore):
+                return 0
+
+        compiled = self._compiled
+        if compiled:
+            nanos = minutes.asi8
+            times = self._trigger_times
+            first = times.searchsorted(nanos[0])
+            last = times.searchsorted(nanos[-1], side='right')
+            ignored_owners = [
+                position
+                for position, event in enumerate(self._compiled_events)
+                if any(event is ignored for ignored in ignore)
+            ]
+            triggers = times[first:last][~np.in1d(
+                self._trigger_owners[first:last],
+                ignored_owners,
+            )]
+            if len(triggers):
+                stop = nanos.searchsorted(triggers[0])
+
+        rules = [
+            event.rule
+            for event in self._events
+            if id(event) not in compiled and
+            not any(event is ignored for ignored in ignore)
+        ]
+        if not rules:
+            return stop
+
+        # Check the rules over windows which double in size, so that rules
+        # which are checked minute by minute are not checked much further
+        # than the first minute at which any of them may trigger.
+        start, size = 0, 1
+        while start < stop:
+            end = min(start + size, stop)
+            window = minutes[start:end]
+            mask = np.zeros(len(window), dtype=bool)
+            for rule in rules:
+                mask |= rule.may_trigger(window)
+            (hits,) = np.nonzero(mask)
+            if len(hits):
+                return start + hits[0]
+            start, size = end, size * 2
+        return stop
+
+    def skip(self, minutes):
+        """
+        Advance the events past minutes at which none of them trigger,
+        without calling their rules' ``should_trigger``.
+
+        Parameters
+        ----------
+        minutes : pd.DatetimeIndex
+            The skipped market minutes, in order. None of the events may
+            trigger at any of them according to :meth:`may_trigger`.
+        """
+        if not len(minutes):
+            return
+        compiled = self._compiled
+        for event in self._events:
+            # The compiled schedule catches up by itself.
+            if id(event) not in compiled:
+                event.rule.skip(minutes)
 
 
 class Event(namedtuple('Event', ['rule', 'callback'])):
@@ -244,6 +455,55 @@ class EventRule(six.with_metaclass(ABCMeta)):
         """
         raise NotImplementedError('should_trigger')
 
+    def may_trigger(self, minutes):
+        """
+        Find the minutes at which this rule may trigger, without changing the
+        state of the rule.
+
+        The result may include minutes at which the rule ends up not
+        triggering, but never leaves out a minute at which it does. By
+        default every minute is included.
+
+        Parameters
+        ----------
+        minutes : pd.DatetimeIndex
+            The market minutes to check, in order.
+
+        Returns
+        -------
+        mask : np.array[bool]
+        """
+        return np.ones(len(minutes), dtype=bool)
+
+    def skip(self, minutes):
+        """
+        Update the state of this rule as if ``should_trigger`` had been called
+        with each of ``minutes``, none of which trigger the rule.
+
+        Stateful rules which narrow down :meth:`may_trigger` must override
+        this.
+        """
+        pass
+
+    def compile(self, minutes):
+        """
+        Find the minutes at which this rule triggers if ``should_trigger`` is
+        called with each of ``minutes`` in order, without calling it.
+
+        Parameters
+        ----------
+        minutes : pd.DatetimeIndex
+            The market minutes of the simulation, in order.
+
+        Returns
+        -------
+        triggers : np.array[int64] or None
+            The nanoseconds of the minutes at which the rule triggers, sorted,
+            or None if the rule can't be compiled. By default rules can't be
+            compiled.
+        """
+        return None
+
 
 class StatelessRule(EventRule):
     """
@@ -260,6 +520,13 @@ class StatelessRule(EventRule):
         return ComposedRule(self, rule, ComposedRule.lazy_and)
     __and__ = and_
 
+    def may_trigger(self, minutes):
+        # Stateless rules can be checked ahead of time, so the mask is exact.
+        return np.array(
+            [bool(self.should_trigger(dt)) for dt in minutes],
+            dtype=bool,
+        )
+
 
 class ComposedRule(StatelessRule):
     """
@@ -293,6 +560,33 @@ class ComposedRule(StatelessRule):
             dt
         )
 
+    def may_trigger(self, minutes):
+        if self.composer is not ComposedRule.lazy_and:
+            return super(ComposedRule, self).may_trigger(minutes)
+        return (
+            self.first.may_trigger(minutes) &
+            self.second.may_trigger(minutes)
+        )
+
+    def compile(self, minutes):
+        if self.composer is not ComposedRule.lazy_and:
+            return None
+
+        first = self.first.compile(minutes)
+        second = self.second.compile(minutes)
+        if first is not None and second is not None:
+            if len(first) > len(second):
+                first, second = second, first
+            return first[_isin_sorted(first, second)]
+
+        # Narrow down the compiled side with the exact mask of the other.
+        for triggers, other in (first, self.second), (second, self.first):
+            if triggers is not None and isinstance(other, StatelessRule):
+                return triggers[
+                    other.may_trigger(pd.to_datetime(triggers, utc=True))
+                ]
+        return None
+
     @staticmethod
     def lazy_and(first_should_trigger, second_should_trigger, dt):
         """
@@ -314,6 +608,12 @@ class Always(StatelessRule):
         return True
     should_trigger = always_trigger
 
+    def may_trigger(self, minutes):
+        return np.ones(len(minutes), dtype=bool)
+
+    def compile(self, minutes):
+        return minutes.asi8
+
 
 class Never(StatelessRule):
     """
@@ -327,6 +627,53 @@ class Never(StatelessRule):
         return False
     should_trigger = never_trigger
 
+    def may_trigger(self, minutes):
+        return np.zeros(len(minutes), dtype=bool)
+
+    def compile(self, minutes):
+        return np.array([], dtype=np.int64)
+
+
+def _session_labels(cal, minutes):
+    """
+    Get the session label of each of the market ``minutes``.
+
+    Unlike ``cal.minute_index_to_session_labels``, this does not assume that
+    ``minutes`` are contiguous, so it is also correct for sparse minutes such
+    as the session closes of a daily simulation.
+    """
+    return cal.schedule.index[
+        cal.market_closes_nanos.searchsorted(minutes.asi8, side='left')
+    ]
+
+
+def _execution_opens_and_closes(cal, minutes):
+    """
+    Get the execution opens and closes of the sessions spanned by
+    ``minutes``.
+    """
+    if len(minutes):
+        schedule = cal.schedule.loc[
+            cal.minute_to_session_label(minutes[0]):
+            cal.minute_to_session_label(minutes[-1])
+        ]
+    else:
+        schedule = cal.schedule.iloc[:0]
+    return (
+        cal.execution_time_from_open(schedule.market_open),
+        cal.execution_time_from_close(schedule.market_close),
+    )
+
+
+def _triggers_in_sessions(triggers, opens, closes, minutes):
+    """
+    Keep the per session ``triggers`` which fall within their session and
+    are in ``minutes``.
+    """
+    in_session = ((triggers >= opens) & (triggers <= closes)).values
+    triggers = triggers.values[in_session].astype(np.int64)
+    return triggers[_isin_sorted(triggers, minutes.asi8)]
+
 
 class AfterOpen(StatelessRule):
     """
@@ -383,6 +730,20 @@ class AfterOpen(StatelessRule):
 
         return dt == self._period_end
 
+    def may_trigger(self, minutes):
+        period_starts = self.cal.execution_time_from_open(
+            self.cal.schedule.market_open.reindex(
+                _session_labels(self.cal, minutes),
+            ),
+        )
+        period_ends = period_starts + (self.offset - self._one_minute)
+        return minutes.values == period_ends.values
+
+    def compile(self, minutes):
+        opens, closes = _execution_opens_and_closes(self.cal, minutes)
+        period_ends = opens + (self.offset - self._one_minute)
+        return _triggers_in_sessions(period_ends, opens, closes, minutes)
+
 
 class BeforeClose(StatelessRule):
     """
@@ -436,6 +797,19 @@ class BeforeClose(StatelessRule):
 
         return self._period_start == dt
 
+    def may_trigger(self, minutes):
+        period_ends = self.cal.execution_time_from_close(
+            self.cal.schedule.market_close.reindex(
+                _session_labels(self.cal, minutes),
+            ),
+        )
+        return minutes.values == (period_ends - self.offset).values
+
+    def compile(self, minutes):
+        opens, closes = _execution_opens_and_closes(self.cal, minutes)
+        period_starts = closes - self.offset
+        return _triggers_in_sessions(period_starts, opens, closes, minutes)
+
 
 class NotHalfDay(StatelessRule):
     """
@@ -445,6 +819,11 @@ class NotHalfDay(StatelessRule):
         return self.cal.minute_to_session_label(dt) \
             not in self.cal.early_closes
 
+    def may_trigger(self, minutes):
+        return ~_session_labels(self.cal, minutes).isin(
+            self.cal.early_closes,
+        )
+
 
 class TradingDayOfWeekRule(six.with_metaclass(ABCMeta, StatelessRule)):
     @preprocess(n=lossless_float_to_int('TradingDayOfWeekRule'))
@@ -459,6 +838,12 @@ class TradingDayOfWeekRule(six.with_metaclass(ABCMeta, StatelessRule)):
         val = self.cal.minute_to_session_label(dt, direction="none").value
         return val in self.execution_period_values
 
+    def may_trigger(self, minutes):
+        return np.in1d(
+            _session_labels(self.cal, minutes).asi8,
+            self._execution_period_array,
+        )
+
     @lazyval
     def execution_period_values(self):
         # calculate the list of periods that match the given criteria
@@ -470,6 +855,10 @@ class TradingDayOfWeekRule(six.with_metaclass(ABCMeta, StatelessRule)):
             .astype(np.int64)
         )
 
+    @lazyval
+    def _execution_period_array(self):
+        return np.array(sorted(self.execution_period_values), dtype=np.int64)
+
 
 class NthTradingDayOfWeek(TradingDayOfWeekRule):
     """
@@ -504,6 +893,12 @@ class TradingDayOfMonthRule(six.with_metaclass(ABCMeta, StatelessRule)):
         value = self.cal.minute_to_session_label(dt, direction="none").value
         return value in self.execution_period_values
 
+    def may_trigger(self, minutes):
+        return np.in1d(
+            _session_labels(self.cal, minutes).asi8,
+            self._execution_period_array,
+        )
+
     @lazyval
     def execution_period_values(self):
         # calculate the list of periods that match the given criteria
@@ -515,6 +910,10 @@ class TradingDayOfMonthRule(six.with_metaclass(ABCMeta, StatelessRule)):
             .astype(np.int64)
         )
 
+    @lazyval
+    def _execution_period_array(self):
+        return np.array(sorted(self.execution_period_values), dtype=np.int64)
+
 
 class NthTradingDayOfMonth(TradingDayOfMonthRule):
     """
@@ -576,6 +975,60 @@ class OncePerDay(StatefulRule):
             self.triggered = True
             return True
 
+    def may_trigger(self, minutes):
+        mask = self.rule.may_trigger(minutes)
+        if self.triggered:
+            # This rule can't trigger again until it is reset for a new date.
+            mask &= minutes >= self.next_date
+        return mask
+
+    def skip(self, minutes):
+        # Reset for a new date at the minutes at which ``should_trigger``
+        # would have.
+        if self.date is None:
+            self.triggered = False
+            self.date = minutes[0]
+            self.next_date = self.date + pd.Timedelta(1, unit="d")
+
+        ix = minutes.searchsorted(self.next_date)
+        while ix < len(minutes):
+            self.triggered = False
+            self.date = minutes[ix]
+            self.next_date = self.date + pd.Timedelta(1, unit="d")
+            ix = minutes.searchsorted(self.next_date)
+
+        self.rule.skip(minutes)
+
+    def compile(self, minutes):
+        triggers = self.rule.compile(minutes)
+        if triggers is None or not len(minutes):
+            return triggers
+
+        # Replay the resets for a new date, which happen at the first minute
+        # at or after ``next_date``, and keep the first trigger after each.
+        nanos = minutes.asi8
+        one_day = pd.Timedelta(1, unit="d").value
+        start = nanos[0]
+        if self.date is None or start >= self.next_date.value:
+            next_date, triggered = start + one_day, False
+        else:
+            next_date, triggered = self.next_date.value, self.triggered
+
+        out = []
+        while True:
+            if not triggered:
+                ix = triggers.searchsorted(start)
+                if ix < len(triggers) and triggers[ix] < next_date:
+                    out.append(triggers[ix])
+
+            ix = nanos.searchsorted(next_date)
+            if ix == len(nanos):
+                break
+            start = nanos[ix]
+            next_date, triggered = start + one_day, False
+
+        return np.array(out, dtype=np.int64)
+
 
 # Factory API
 
@@ -7,6 +7,7 @@ Otherwise default to expanduser(~/.zipline)
 from errno import EEXIST
 import os
 from os.path import exists, expanduser, join
+import shutil
 
 import pandas as pd
 
@@ -34,6 +35,40 @@ def ensure_directory(path):
         raise
 
 
+def link_tree(src, dst, should_copy=None):
+    """
+    Recreate the directory tree at ``src`` under ``dst``, hard linking the
+    files where possible.
+
+    Parameters
+    ----------
+    src : str
+        The directory to link from.
+    dst : str
+        The directory to link into. This is created if it does not exist.
+    should_copy : callable[str -> bool], optional
+        A predicate on the paths of the files in ``src``. The files for which
+        this returns True are copied instead of linked.
+
+    Notes
+    -----
+    Files are also copied when they can not be linked, for example when
+    ``dst`` is on another file system.
+    """
+    for root, _, filenames in os.walk(src):
+        target = join(dst, os.path.relpath(root, src))
+        ensure_directory(target)
+        for filename in filenames:
+            source = join(root, filename)
+            if should_copy is None or not should_copy(source):
+                try:
+                    os.link(source, join(target, filename))
+                    continue
+                except OSError:
+                    pass
+            shutil.copy2(source, join(target, filename))
+
+
 def ensure_directory_containing(path):
     """
     Ensure that the directory containing `path` exists.
@@ -1,3 +1,5 @@
+from collections import Counter, deque
+
 from six.moves import map as imap
 from toolz import compose, identity
 
@@ -134,3 +136,52 @@ class SequentialPool(object):
             f(*args, **kwargs)
         """
         return f(*args, **kwargs or {})
+
+
+def imap_bounded(pool, f, iterable, max_pending, key=None):
+    """Lazily apply a function to each of the elements of ``iterable`` on a
+    pool, yielding the results in order.
+
+    Unlike ``pool.imap``, ``iterable`` is only consumed as results are
+    yielded, so at most ``max_pending`` elements are held at once.
+
+    Parameters
+    ----------
+    pool : Pool
+        The pool to run ``f`` on. This object must support ``apply_async``.
+    f : callable[A, B]
+        The function to apply. This must be picklable if ``pool`` runs in
+        other processes.
+    iterable : iterable[A]
+        The elements to apply ``f`` to.
+    max_pending : int
+        The maximum number of calls that may be running or waiting to run.
+    key : callable[A, hashable], optional
+        A function of the elements. Calls for elements with the same key are
+        never run concurrently; a call waits for the results of all of the
+        earlier calls with the same key.
+
+    Yields
+    ------
+    result : B
+        The result of ``f`` for each element of ``iterable``, in order.
+    """
+    pending = deque()
+    pending_keys = Counter()
+
+    def pop():
+        k, result = pending.popleft()
+        pending_keys[k] -= 1
+        return result.get()
+
+    for element in iterable:
+        k = key(element) if key is not None else None
+        while pending and (
+                len(pending) >= max_pending or
+                (key is not None and pending_keys[k])):
+            yield pop()
+        pending.append((k, pool.apply_async(f, (element,))))
+        pending_keys[k] += 1
+
+    while pending:
+        yield pop()